@@ -1,10 +1,17 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from matterstack._lazy import lazy_exports
+
 __version__ = "0.2.6"
 
-from matterstack.core.campaign import Campaign
-from matterstack.core.evidence import EvidenceBundle
-from matterstack.core.run import RunHandle
-from matterstack.core.workflow import Task, Workflow
-from matterstack.orchestration.run_lifecycle import initialize_run, run_until_completion
+if TYPE_CHECKING:
+    from matterstack.core.campaign import Campaign
+    from matterstack.core.evidence import EvidenceBundle
+    from matterstack.core.run import RunHandle
+    from matterstack.core.workflow import Task, Workflow
+    from matterstack.orchestration.run_lifecycle import initialize_run, run_until_completion
 
 __all__ = [
     "Campaign",
@@ -15,3 +22,18 @@ __all__ = [
     "initialize_run",
     "run_until_completion",
 ]
+
+# Public names, imported on first attribute access (PEP 562) so that importing any submodule
+# (config, CLI helpers) does not first load the orchestration and storage stack.
+_LAZY_EXPORTS = {
+    "Campaign": "matterstack.core.campaign",
+    "Task": "matterstack.core.workflow",
+    "Workflow": "matterstack.core.workflow",
+    "RunHandle": "matterstack.core.run",
+    "EvidenceBundle": "matterstack.core.evidence",
+    "initialize_run": "matterstack.orchestration.run_lifecycle",
+    "run_until_completion": "matterstack.orchestration.run_lifecycle",
+}
+
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
@@ -0,0 +1,35 @@
+"""
+Lazy (PEP 562) re-exports for modules whose public names live in heavier submodules.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_exports(
+    module_globals: Dict[str, Any], exports: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level `__getattr__` and `__dir__` for names imported on first access.
+
+    `exports` maps each name to the module defining it; relative module names resolve against
+    the calling module's package. A resolved value is stored in `module_globals`, so later
+    lookups no longer go through `__getattr__`.
+    """
+    module_name = module_globals["__name__"]
+    package = module_globals.get("__package__")
+
+    def __getattr__(name: str) -> Any:
+        source = exports.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source, package), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module_globals) | set(exports))
+
+    return __getattr__, __dir__
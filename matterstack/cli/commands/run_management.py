@@ -12,6 +12,7 @@ Contains commands for managing run lifecycle:
 """
 
 import logging
+import os
 import random
 import sys
 import time
@@ -44,9 +45,8 @@ def cmd_init(args):
 
         # Deterministic safety: explicit path must exist (avoid creating a run and then failing).
         if operators_config:
-            p = Path(operators_config)
-            if not p.is_file():
-                raise FileNotFoundError(f"CLI --operators-config file not found: {p}")
+            if not os.path.isfile(operators_config):
+                raise FileNotFoundError(f"CLI --operators-config file not found: {Path(operators_config)}")
 
         campaign = load_workspace_context(workspace_slug)
         handle = initialize_run(workspace_slug, campaign)
@@ -140,7 +140,7 @@ def cmd_attempts(args):
             "artifact_path",
             "config_hash",
         ]
-        print("\t".join(header))
+        lines = ["\t".join(header)]
 
         for a in attempts:
             config_hash = ""
@@ -159,7 +159,11 @@ def cmd_attempts(args):
                 a.relative_path or "",
                 config_hash,
             ]
-            print("\t".join(row))
+            lines.append("\t".join(row))
+
+        # Emit the whole table with a single write instead of one print per row.
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
     except Exception as e:
         logger.error(f"Failed to list attempts: {e}")
@@ -3,6 +3,7 @@ MatterStack CLI entry point.
 
 This module contains:
 - Argparse setup for all subcommands
+- A lightweight fast-path parser for simple positional subcommands
 - main() entry point (referenced by pyproject.toml: matterstack.cli.main:main)
 
 Command implementations are in the commands/ subpackage.
@@ -10,6 +11,8 @@ Command implementations are in the commands/ subpackage.
 
 import argparse
 import logging
+import sys
+from typing import Callable, Optional, Sequence
 
 from matterstack.cli.commands import (
     cmd_attempts,
@@ -35,7 +38,81 @@ from matterstack.cli.reset import cmd_reset
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
 
+def _fast_path_commands() -> dict[str, tuple[tuple[str, ...], frozenset[str], bool, Callable]]:
+    """
+    Schema table for subcommands that can be parsed without argparse.
+
+    Each entry maps a subcommand to (positional names, boolean flags, accepts --action, handler).
+    Built per call so handlers are looked up from module globals at dispatch time.
+    """
+    return {
+        "status": (("run_id",), frozenset(), False, cmd_status),
+        "cancel": (("run_id",), frozenset(), False, cmd_cancel),
+        "pause": (("run_id",), frozenset(), False, cmd_pause),
+        "resume": (("run_id",), frozenset(), False, cmd_resume),
+        "export-evidence": (("run_id",), frozenset(), False, cmd_export_evidence),
+        "explain": (("run_id",), frozenset(), False, cmd_explain),
+        "revive": (("run_id",), frozenset(), False, cmd_revive),
+        "rerun": (("run_id", "task_id"), frozenset({"recursive", "force"}), False, cmd_rerun),
+        "attempts": (("run_id", "task_id"), frozenset(), False, cmd_attempts),
+        "cancel-attempt": (("run_id", "attempt_id"), frozenset({"force"}), False, cmd_cancel_attempt),
+        "reset-run": (("run_id", "task_id"), frozenset({"recursive", "force"}), True, cmd_reset),
+    }
+
+
+def _try_fast_parse(argv: Sequence[str]) -> Optional[argparse.Namespace]:
+    """
+    Hand-parse the common case of a known subcommand with a small fixed schema.
+
+    Returns None whenever the input is not trivially unambiguous (help flags, unknown
+    options, wrong arity, invalid --action), so the caller falls back to argparse,
+    which owns all error reporting and help output.
+    """
+    if not argv:
+        return None
+
+    spec = _fast_path_commands().get(argv[0])
+    if spec is None:
+        return None
+    positional_names, flag_names, accepts_action, func = spec
+
+    positionals: list[str] = []
+    flags = dict.fromkeys(flag_names, False)
+    action = "reset"
+
+    it = iter(argv[1:])
+    for token in it:
+        if not token.startswith("-"):
+            positionals.append(token)
+            continue
+        name, sep, value = token[2:].partition("=")
+        if not token.startswith("--") or not name:
+            return None
+        if name in flag_names and not sep:
+            flags[name] = True
+        elif accepts_action and name == "action":
+            action_value: Optional[str] = value if sep else next(it, None)
+            if action_value is None or action_value not in ("reset", "delete"):
+                return None
+            action = action_value
+        else:
+            return None
+
+    if len(positionals) != len(positional_names):
+        return None
+
+    ns = argparse.Namespace(command=argv[0], func=func, **dict(zip(positional_names, positionals)), **flags)
+    if accepts_action:
+        ns.action = action
+    return ns
+
+
 def main():
+    fast_args = _try_fast_parse(sys.argv[1:])
+    if fast_args is not None:
+        fast_args.func(fast_args)
+        return
+
     parser = argparse.ArgumentParser(description="MatterStack CLI")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
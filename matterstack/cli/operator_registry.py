@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
-
-import yaml
+from typing import Any, Dict, Optional, Tuple, Union
 
+from matterstack.config._yaml_loading import load_yaml_file
 from matterstack.config.operators import load_operators_config
 from matterstack.config.profiles import ExecutionProfile, SlurmProfile, load_profile
 from matterstack.core.operator_keys import split_operator_key
@@ -46,6 +47,35 @@ def _profile_from_hpc_yaml(path: Union[str, Path]) -> ExecutionProfile:
     """
     Compatibility adapter for existing CURC HPC YAML config format.
 
+    Parsed profiles are memoized per process by (path, device, inode, mtime_ns, size), so the CLI
+    adapter and the operators.yaml `hpc_yaml` backend share one parse of the same file.
+    See `_parse_hpc_yaml_profile()` for the schema.
+    """
+    p = Path(path)
+    try:
+        st = os.stat(p)
+    except OSError:
+        # Nothing to key the cache on; let the parser raise the usual file error.
+        return _parse_hpc_yaml_profile(p)
+    return _load_hpc_yaml_profile(str(p), st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_hpc_yaml_profile(path_str: str, dev: int, ino: int, mtime_ns: int, size: int) -> ExecutionProfile:
+    """
+    Cached `_parse_hpc_yaml_profile()`.
+
+    `dev`, `ino`, `mtime_ns` and `size` only participate in the cache key: the (dev, inode) pair
+    names the file a relative path or symlink resolves to without a realpath walk, and an
+    atomic replace changes the inode even when mtime and size match.
+    """
+    return _parse_hpc_yaml_profile(Path(path_str))
+
+
+def _parse_hpc_yaml_profile(p: Path) -> ExecutionProfile:
+    """
+    Parse a CURC HPC YAML config into an ExecutionProfile.
+
     Expected schema (subset used):
       cluster:
         ssh: {host, user, key_path}
@@ -55,8 +85,7 @@ def _profile_from_hpc_yaml(path: Union[str, Path]) -> ExecutionProfile:
     Returns:
       ExecutionProfile(type="slurm") ready to .create_backend().
     """
-    p = Path(path)
-    data = yaml.safe_load(p.read_text()) or {}
+    data = load_yaml_file(p)
     if not isinstance(data, dict):
         raise ValueError(f"HPC config {p} must contain a YAML mapping at top-level.")
 
@@ -109,6 +138,11 @@ def _profile_from_hpc_yaml(path: Union[str, Path]) -> ExecutionProfile:
     )
 
 
+# Aliased views keyed by id() of the (process-cached) canonical registry. The source
+# registry is stored alongside so the id cannot be recycled while the entry is alive.
+_ALIASED_REGISTRY_CACHE: Dict[int, Tuple[Dict[str, Operator], Dict[str, Operator]]] = {}
+
+
 def _with_legacy_aliases(reg: Dict[str, Operator]) -> Dict[str, Operator]:
     """
     Orchestrator compatibility adapter.
@@ -145,6 +179,22 @@ def _with_legacy_aliases(reg: Dict[str, Operator]) -> Dict[str, Operator]:
     return out
 
 
+def _cached_with_legacy_aliases(reg: Dict[str, Operator]) -> Dict[str, Operator]:
+    """
+    Memoized `_with_legacy_aliases()` for registries returned by the per-process cache.
+
+    `reg` is shared with the registry cache, so it must not be mutated in place; instead the
+    aliased copy is built once per cached registry and reused on subsequent calls.
+    """
+    cached = _ALIASED_REGISTRY_CACHE.get(id(reg))
+    if cached is not None and cached[0] is reg:
+        return cached[1]
+
+    out = _with_legacy_aliases(reg)
+    _ALIASED_REGISTRY_CACHE[id(reg)] = (reg, out)
+    return out
+
+
 def build_operator_registry(
     run_handle: RunHandle,
     *,
@@ -163,7 +213,7 @@ def build_operator_registry(
         reg = get_cached_operator_registry_from_operators_config(
             run_handle, ops_cfg, profiles_config_path=registry_config.config_path
         )
-        return _with_legacy_aliases(reg)
+        return _cached_with_legacy_aliases(reg)
 
     # Legacy behavior: keep Local operator rooted at run root for backward-compatible evidence layout.
     local_backend = LocalBackend(workspace_root=str(run_handle.root_path))
@@ -1,4 +1,6 @@
+import bisect
 import time
+from typing import List, Optional
 
 from rich import box
 from rich.console import Console
@@ -19,6 +21,21 @@ class CampaignMonitor:
         self.poll_interval = poll_interval
         self.store = SQLiteStateStore(handle.db_path)
         self.console = Console()
+        # Stable task ordering across ticks; task IDs do not change mid-run.
+        self._sorted_task_ids: Optional[List[str]] = None
+        # Workspace and run ID are invariant for the monitor's lifetime, so the
+        # header body is built once; each tick only recomputes the panel title.
+        self._header_body = self._build_header_body()
+
+    def _build_header_body(self) -> Table:
+        grid = Table.grid(expand=True)
+        grid.add_column(justify="left", ratio=1)
+        grid.add_column(justify="right", ratio=1)
+        grid.add_row(
+            Text.from_markup(f"Workspace: [bold]{self.handle.workspace_slug}[/bold]"),
+            Text.from_markup(f"Run ID: [bold]{self.handle.run_id}[/bold]"),
+        )
+        return grid
 
     def get_layout(self) -> Layout:
         layout = Layout()
@@ -42,15 +59,7 @@ class CampaignMonitor:
             else "blue"
         )
 
-        grid = Table.grid(expand=True)
-        grid.add_column(justify="left", ratio=1)
-        grid.add_column(justify="right", ratio=1)
-
-        grid.add_row(
-            f"Workspace: [bold]{self.handle.workspace_slug}[/bold]", f"Run ID: [bold]{self.handle.run_id}[/bold]"
-        )
-
-        return Panel(grid, title=f"MatterStack Mission Control - [{style}]{status}[/{style}]", border_style=style)
+        return Panel(self._header_body, title=f"MatterStack Mission Control - [{style}]{status}[/{style}]", border_style=style)
 
     def generate_task_table(self) -> Table:
         try:
@@ -66,10 +75,10 @@ class CampaignMonitor:
         table.add_column("Status")
         table.add_column("Info")
 
-        # Sort tasks by ID
-        tasks.sort(key=lambda t: t.task_id)
+        tasks_by_id = {t.task_id: t for t in tasks}
 
-        for task in tasks:
+        for task_id in self._ordered_task_ids(tasks_by_id.keys()):
+            task = tasks_by_id[task_id]
             status = self.store.get_task_status(task.task_id) or "PENDING"
 
             # Status styling
@@ -94,6 +103,25 @@ class CampaignMonitor:
 
         return table
 
+    def _ordered_task_ids(self, task_ids) -> List[str]:
+        """
+        Return task IDs sorted, reusing the cached order from previous ticks.
+
+        New IDs are merge-inserted into the cached order; a full sort only happens
+        on the first tick or when tasks disappear (e.g. reset-run --action delete).
+        """
+        current = set(task_ids)
+        cached = self._sorted_task_ids
+
+        if cached is None or not current.issuperset(cached):
+            cached = sorted(current)
+        elif len(current) != len(cached):
+            for task_id in current.difference(cached):
+                bisect.insort(cached, task_id)
+
+        self._sorted_task_ids = cached
+        return cached
+
     def generate_footer(self) -> Panel:
         try:
             status = self.store.get_run_status(self.handle.run_id)
@@ -1,14 +1,19 @@
 import importlib.util
 import os
 import sys
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 from matterstack.core.run import RunHandle
 
 # Environment variable for workspaces root path
 _ENV_WORKSPACES_ROOT = "MATTERSTACK_WORKSPACES_ROOT"
 
+# Attribute stamped on executed workspace modules: the (resolved path, mtime_ns) they came from.
+_MODULE_STAMP_ATTR = "_matterstack_source_stamp"
+
 
 def _find_project_root() -> Optional[Path]:
     """
@@ -61,6 +66,19 @@ def _resolve_workspaces_root() -> Optional[Path]:
     return None
 
 
+@lru_cache(maxsize=128)
+def _resolve_workspace_paths(base_path: Path, workspace_slug: str) -> Tuple[Path, str]:
+    """
+    Return (main.py path, module name) for a workspace slug under base_path.
+
+    Pure string/path arithmetic (no filesystem access), so results are cached per process.
+    """
+    main_py = base_path / workspace_slug / "main.py"
+    # Create valid Python module name: demos/battery_screening -> workspace.demos.battery_screening
+    module_name = f"workspace.{workspace_slug.replace('/', '.')}"
+    return main_py, module_name
+
+
 def load_workspace_context(workspace_slug: str, base_path: Optional[Path] = None) -> Any:
     """
     Dynamically load the workspace module and retrieve the campaign.
@@ -69,7 +87,10 @@ def load_workspace_context(workspace_slug: str, base_path: Optional[Path] = None
     Supports nested slugs like 'demos/battery_screening' which resolve to
     '{base_path}/demos/battery_screening/main.py'.
 
-    It looks for a 'get_campaign()' function in the module.
+    It looks for a 'get_campaign()' function in the module. The executed module is reused
+    per process while main.py is unchanged (same resolved path and mtime_ns), but
+    get_campaign() is called on every load: campaigns may hold per-run state (e.g. a seeded
+    RNG), so each caller gets its own instance.
 
     Args:
         workspace_slug: Workspace identifier, may contain '/' for nested paths.
@@ -98,22 +119,26 @@ def load_workspace_context(workspace_slug: str, base_path: Optional[Path] = None
                 "  3. Ensure 'workspaces' directory exists in current directory"
             )
 
-    workspace_path = base_path / workspace_slug
-    main_py = workspace_path / "main.py"
+    main_py, module_name = _resolve_workspace_paths(base_path, workspace_slug)
 
-    if not main_py.exists():
-        raise FileNotFoundError(f"Workspace main file not found: {main_py}")
+    try:
+        st = main_py.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Workspace main file not found: {main_py}") from None
 
-    # Create valid Python module name: demos/battery_screening -> workspace.demos.battery_screening
-    module_name = f"workspace.{workspace_slug.replace('/', '.')}"
+    source_stamp = (str(main_py.resolve()), st.st_mtime_ns)
 
-    spec = importlib.util.spec_from_file_location(module_name, main_py)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load spec for {main_py}")
+    # Reuse an already-executed module when it came from this exact, unmodified file.
+    module = sys.modules.get(module_name)
+    if module is None or getattr(module, _MODULE_STAMP_ATTR, None) != source_stamp:
+        spec = importlib.util.spec_from_file_location(module_name, main_py)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load spec for {main_py}")
 
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        setattr(module, _MODULE_STAMP_ATTR, source_stamp)
 
     if hasattr(module, "get_campaign"):
         return module.get_campaign()
@@ -121,11 +146,35 @@ def load_workspace_context(workspace_slug: str, base_path: Optional[Path] = None
         raise AttributeError(f"Workspace module {main_py} does not export 'get_campaign()'.")
 
 
+def _iter_runs_dirs(base_path: Path) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (workspace_dir, runs_dir) for every directory under base_path containing 'runs/'.
+
+    Walks breadth-first with os.scandir (cached d_type, no per-entry stat) and does not
+    descend into 'runs' directories themselves, so run artifact trees are never listed.
+    """
+    pending = deque([os.fspath(base_path)])
+    while pending:
+        current = pending.popleft()
+        try:
+            with os.scandir(current) as it:
+                subdirs = [entry for entry in it if entry.is_dir()]
+        except OSError:
+            continue
+
+        for entry in subdirs:
+            if entry.name == "runs":
+                yield current, entry.path
+            else:
+                pending.append(entry.path)
+
+
 def find_run(run_id: str, base_path: Optional[Path] = None) -> Optional[RunHandle]:
     """
     Locate a run directory by searching all workspaces, including nested ones.
 
-    Searches recursively for any workspace that contains runs/{run_id}.
+    Searches recursively for any workspace that contains runs/{run_id}, probing each
+    workspace's runs/ directory directly instead of walking run contents.
     For nested workspaces like demos/battery_screening, returns the full
     relative path as workspace_slug.
 
@@ -140,22 +189,57 @@ def find_run(run_id: str, base_path: Optional[Path] = None) -> Optional[RunHandl
         RunHandle if found, None otherwise. For nested workspaces,
         workspace_slug will contain the full path (e.g., 'demos/battery_screening').
     """
+    return find_runs([run_id], base_path=base_path).get(run_id)
+
+
+def find_runs(run_ids: Iterable[str], base_path: Optional[Path] = None) -> Dict[str, RunHandle]:
+    """
+    Locate several runs with a single pass over the workspaces tree.
+
+    Each workspace's runs/ directory is visited at most once: with one id left to find it
+    is probed directly, otherwise it is listed once and matched by set membership. The
+    walk stops as soon as every requested run has been found. When a run_id exists in
+    more than one workspace, the first match (shallowest workspace) wins, as in find_run().
+
+    Args:
+        run_ids: Run identifiers to locate.
+        base_path: The base directory to search (same resolution rules as find_run()).
+
+    Returns:
+        Mapping of run_id -> RunHandle for the runs that were found; missing ids are omitted.
+    """
+    remaining = set(run_ids)
+    found: Dict[str, RunHandle] = {}
+    if not remaining:
+        return found
+
     if base_path is None:
         base_path = _resolve_workspaces_root()
         if base_path is None:
-            return None
+            return found
 
     if not base_path.exists():
-        return None
-
-    # Search for any 'runs' directory that contains the run_id
-    for runs_dir in base_path.rglob("runs"):
-        if runs_dir.is_dir():
-            run_dir = runs_dir / run_id
-            if run_dir.exists():
-                # Calculate workspace_slug relative to base_path
-                # runs_dir.parent is the workspace directory
-                workspace_path = runs_dir.parent
-                workspace_slug = str(workspace_path.relative_to(base_path))
-                return RunHandle(workspace_slug=workspace_slug, run_id=run_id, root_path=run_dir)
-    return None
+        return found
+
+    # Never descend into run directories; only runs/ listings or direct probes.
+    for workspace_dir, runs_dir in _iter_runs_dirs(base_path):
+        if len(remaining) == 1:
+            hits = [rid for rid in remaining if os.path.exists(os.path.join(runs_dir, rid))]
+        else:
+            try:
+                hits = list(remaining.intersection(os.listdir(runs_dir)))
+            except OSError:
+                continue
+
+        if hits:
+            # Calculate workspace_slug relative to base_path
+            workspace_slug = os.path.relpath(workspace_dir, base_path)
+            for rid in hits:
+                found[rid] = RunHandle(
+                    workspace_slug=workspace_slug, run_id=rid, root_path=Path(os.path.join(runs_dir, rid))
+                )
+            remaining.difference_update(hits)
+            if not remaining:
+                break
+
+    return found
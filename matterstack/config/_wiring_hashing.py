@@ -0,0 +1,159 @@
+"""
+Internal SHA256 helpers for operator wiring snapshots.
+
+This module contains the digest functions for source bytes and snapshot files, together with
+the in-process memo and the `operators.yaml.sha256` sidecar that cache snapshot digests.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ._wiring_io import _is_regular_file, _read_bytes, _safe_stat
+from ._wiring_json import _dumps_json_line, _loads_json
+
+# (bytes object, hex digest) of the last `_sha256_bytes()` call. Holding the reference keeps
+# the identity check sound: source bytes are served from in-process caches, so re-resolving
+# an unchanged source hands back the very same object.
+_LAST_SHA256: Tuple[Optional[bytes], str] = (None, "")
+
+
+def _sha256_bytes(data: bytes) -> str:
+    """Compute SHA256 hash of bytes data (reused when called again with the same object)."""
+    global _LAST_SHA256
+    last_data, last_sha = _LAST_SHA256
+    if data is last_data:
+        return last_sha
+    sha = hashlib.sha256(data).hexdigest()
+    _LAST_SHA256 = (data, sha)
+    return sha
+
+
+# Snapshots up to this size are read in one call and hashed one-shot; larger ones are
+# streamed through `hashlib.file_digest` (which always allocates a 256 KiB read buffer).
+# Both paths use the OpenSSL-backed sha256 constructor.
+_ONE_SHOT_HASH_MAX_BYTES = 1 << 20
+
+
+def _sha256_sidecar_path(snapshot_path: Path) -> Path:
+    """Return the path of the cached-digest sidecar for a snapshot file."""
+    return snapshot_path.with_name(snapshot_path.name + ".sha256")
+
+
+def _stat_fingerprint(st: os.stat_result) -> Dict[str, int]:
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "ino": st.st_ino}
+
+
+# In-process layer in front of the sidecar: (path, mtime_ns, size, ino) -> sha256.
+_SHA256_MEMO: Dict[Tuple[str, int, int, int], str] = {}
+_SHA256_MEMO_MAX = 256
+
+
+def _sha256_memo_key(snapshot_path: Path, st: os.stat_result) -> Tuple[str, int, int, int]:
+    return (os.fspath(snapshot_path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _remember_sha256(snapshot_path: Path, st: os.stat_result, sha256: str) -> None:
+    if len(_SHA256_MEMO) >= _SHA256_MEMO_MAX:
+        _SHA256_MEMO.clear()
+    _SHA256_MEMO[_sha256_memo_key(snapshot_path, st)] = sha256
+
+
+def _read_sha256_sidecar(snapshot_path: Path, st: os.stat_result) -> Optional[str]:
+    """
+    Return the cached digest if the sidecar was recorded for the file's current stat.
+
+    Any mismatch or unreadable sidecar returns None, so callers fall back to hashing.
+    """
+    try:
+        cached = _loads_json(_read_bytes(_sha256_sidecar_path(snapshot_path)))
+    except Exception:
+        return None
+    if not isinstance(cached, dict) or cached.get("stat") != _stat_fingerprint(st):
+        return None
+    sha = cached.get("sha256")
+    return sha if isinstance(sha, str) else None
+
+
+def _write_sha256_sidecar(snapshot_path: Path, sha256: str, st: Optional[os.stat_result] = None) -> None:
+    """Best-effort: record `sha256` for the snapshot's current stat (never raises)."""
+    try:
+        if st is None:
+            st = os.stat(snapshot_path)
+        _remember_sha256(snapshot_path, st, sha256)
+        data = _dumps_json_line({"sha256": sha256, "stat": _stat_fingerprint(st)})
+    except Exception:
+        return
+
+    # Concurrent writers each create their own temp file (O_EXCL) and race only on the rename.
+    sidecar = _sha256_sidecar_path(snapshot_path)
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except OSError:
+        return
+    try:
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def _load_snapshot_sha256_if_present(
+    snapshot_path: Path,
+    st: Optional[os.stat_result] = None,
+    *,
+    expected: Optional[Tuple[bytes, str]] = None,
+) -> Optional[str]:
+    """
+    Load the SHA256 hash of a snapshot file if it exists.
+
+    The digest is served from an in-process memo, then from the `operators.yaml.sha256`
+    sidecar, when the snapshot's (mtime_ns, size, inode) still match; otherwise the file is
+    hashed (one-shot for small files, `hashlib.file_digest` otherwise) and the sidecar is
+    refreshed. Pass `st` when the caller has already stat'ed the snapshot.
+
+    `expected` is an optional (bytes, sha256) pair the caller already holds: a small file of
+    the same size is compared byte-for-byte and, when equal, reuses that digest instead of
+    hashing the file again.
+    """
+    if st is None:
+        st = _safe_stat(snapshot_path)
+    if st is None or not _is_regular_file(st):
+        return None
+
+    memo_key = _sha256_memo_key(snapshot_path, st)
+    cached = _SHA256_MEMO.get(memo_key)
+    if cached is not None:
+        return cached
+
+    cached = _read_sha256_sidecar(snapshot_path, st)
+    if cached is not None:
+        _remember_sha256(snapshot_path, st, cached)
+        return cached
+
+    try:
+        if st.st_size <= _ONE_SHOT_HASH_MAX_BYTES:
+            # Hash directly rather than via `_sha256_bytes`: the buffer is transient, so it
+            # should neither be kept alive nor displace the memoized source-bytes digest.
+            data = _read_bytes(snapshot_path, st.st_size)
+            if expected is not None and data == expected[0]:
+                sha = expected[1]
+            else:
+                sha = hashlib.sha256(data).hexdigest()
+        else:
+            with snapshot_path.open("rb") as f:
+                sha = hashlib.file_digest(f, hashlib.sha256).hexdigest()
+    except Exception:
+        return None
+
+    _write_sha256_sidecar(snapshot_path, sha, st)
+    return sha
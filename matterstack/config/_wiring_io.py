@@ -0,0 +1,114 @@
+"""
+Internal filesystem helpers for operator wiring.
+
+This module contains stat helpers and raw os-level read/write/append functions, including
+the temp file + rename used to replace snapshot files atomically.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import os
+import stat
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def _safe_stat(path: Path) -> Optional[os.stat_result]:
+    """`os.stat(path)`, or None if the path cannot be stat'ed (missing, permission, ...)."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _stat_cached(path: Path, cache: Optional[Dict[str, Optional[os.stat_result]]]) -> Optional[os.stat_result]:
+    """Stat `path` at most once per `cache` (one cache per resolution pass); no cache means a fresh stat."""
+    if cache is None:
+        return _safe_stat(path)
+    key = os.fspath(path)
+    if key not in cache:
+        cache[key] = _safe_stat(path)
+    return cache[key]
+
+
+def _is_regular_file(st: Optional[os.stat_result]) -> bool:
+    """Equivalent of `Path.is_file()` for an already-fetched stat result."""
+    return st is not None and stat.S_ISREG(st.st_mode)
+
+
+def _ensure_explicit_path_exists(
+    path: Path,
+    *,
+    what: str,
+    stat_cache: Optional[Dict[str, Optional[os.stat_result]]] = None,
+) -> None:
+    """Raise FileNotFoundError if the path does not exist."""
+    st = _stat_cached(path, stat_cache)
+    if not _is_regular_file(st):
+        raise FileNotFoundError(f"{what} file not found: {path}")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _read_bytes(path: Path, size_hint: int = -1) -> bytes:
+    """
+    Read a whole file with raw os.open/os.read (no buffered file object).
+
+    `size_hint` (e.g. `st_size` from an earlier stat) lets small files be read in one call;
+    reading continues until EOF, so a stale hint is harmless.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunk = os.read(fd, size_hint + 1 if size_hint >= 0 else 65536)
+        if not chunk:
+            return b""
+        chunks = [chunk]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    """Append `data` to `path` (created if missing) with one O_APPEND write."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+# Temp files for `_atomic_write_bytes` are created exclusively under a per-process, per-call name,
+# so concurrent writers of the same target never write into (or publish) each other's temp file.
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+_TMP_COUNTER = itertools.count()
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write `data` to a unique temp file next to `path` and rename it over `path`.
+
+    Readers never see a partial file; the temp file is removed if the write or rename fails.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{next(_TMP_COUNTER)}.tmp")
+    fd = os.open(tmp_path, _TMP_FLAGS, 0o644)
+    try:
+        try:
+            _write_all(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,113 @@
+"""
+Internal JSON helpers for operator wiring snapshots.
+
+This module contains the JSON record encoder/decoder (orjson when installed) and the fixed
+metadata.json layout used to render and partially read run metadata.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, Optional, Tuple
+
+# C-accelerated `json.dumps(str)` (ensure_ascii=True), as used by json's default encoder.
+_encode_json_str = json.encoder.encode_basestring_ascii
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup for JSON encoding/decoding
+    orjson = None  # type: ignore[assignment]
+
+
+# Stdlib fallback encoder for `_dumps_json_line`. `json.dumps` with non-default options builds
+# a new JSONEncoder on every call, so one preconfigured instance is shared instead.
+_JSON_LINE_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _dumps_json_line(line: Dict[str, Any]) -> bytes:
+    """
+    Encode one JSON record (sorted keys, compact, trailing newline), e.g. a history.jsonl event.
+
+    Uses orjson when installed; the stdlib fallback is configured to emit the same bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(line, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (_JSON_LINE_ENCODER.encode(line) + "\n").encode("utf-8")
+
+
+def _loads_json(data: bytes) -> Any:
+    """Decode a JSON document from raw bytes (orjson when installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# `json.dumps(payload, indent=2, sort_keys=True) + "\n"` of the metadata.json document, with
+# each value pre-encoded by `_json_scalar`. The layout is fixed, so no dict is built per write.
+_METADATA_TEMPLATE = """{{
+  "created_at_utc": {created_at_utc},
+  "effective": {{
+    "resolved_path": {resolved_path},
+    "sha256": {sha256},
+    "snapshot_relpath": {snapshot_relpath},
+    "source": {source}
+  }},
+  "history_relpath": {history_relpath},
+  "provenance": {{
+    "cli": {{
+      "force_wiring_override": {force_wiring_override},
+      "operators_config": {cli_operators_config}
+    }},
+    "env_var_name": {env_var_name},
+    "legacy": {{
+      "hpc_config": {legacy_hpc_config},
+      "profile": {legacy_profile},
+      "profiles_config_path": {profiles_config_path}
+    }},
+    "workspace_slug": {workspace_slug}
+  }},
+  "schema_version": 1,
+  "updated_at_utc": {updated_at_utc}
+}}
+"""
+
+# Top-level keys of the layout above: a line starting with exactly two spaces and a quote.
+# JSON strings cannot contain raw newlines, so these anchors only ever match structural keys.
+_CREATED_AT_KEY_RE = re.compile(r'^  "created_at_utc": ', re.MULTILINE)
+_UPDATED_AT_KEY_RE = re.compile(r'^  "updated_at_utc": ', re.MULTILINE)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_metadata_timestamps(text: str) -> Optional[Tuple[Any, Any]]:
+    """
+    Decode only `created_at_utc` and `updated_at_utc` from metadata.json text.
+
+    Returns None when either key is not found in the `_METADATA_TEMPLATE` layout, so
+    callers fall back to a full parse.
+    """
+    values = []
+    for key_re in (_CREATED_AT_KEY_RE, _UPDATED_AT_KEY_RE):
+        m = key_re.search(text)
+        if m is None:
+            return None
+        try:
+            value, _end = _JSON_DECODER.raw_decode(text, m.end())
+        except ValueError:
+            return None
+        values.append(value)
+    return values[0], values[1]
+
+
+def _json_scalar(value: Any) -> str:
+    """
+    `json.dumps(value)` for the str/None values in metadata.json, via the C string encoder.
+
+    Anything else (e.g. a non-string `created_at_utc` read back from a hand-edited file)
+    goes through json.dumps unchanged.
+    """
+    if isinstance(value, str):
+        return _encode_json_str(value)
+    if value is None:
+        return "null"
+    return json.dumps(value)
@@ -7,12 +7,105 @@ from legacy CLI inputs (--hpc-config, --profile).
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
-import yaml
-
 from ._wiring_types import OperatorWiringSource
 
+# Pre-rendered `yaml.safe_dump(..., sort_keys=True)` output of the legacy operators doc.
+# Only the hpc.default backend value varies; it is interpolated with `%` formatting.
+_LEGACY_TEMPLATE_HPC_YAML = b"""operators:
+  experiment.default:
+    kind: experiment
+  hpc.default:
+    backend:
+      path: %b
+      type: hpc_yaml
+    kind: hpc
+  human.default:
+    kind: human
+  local.default:
+    backend:
+      type: local
+    kind: local
+"""
+
+_LEGACY_TEMPLATE_PROFILE = b"""operators:
+  experiment.default:
+    kind: experiment
+  hpc.default:
+    backend:
+      name: %b
+      type: profile
+    kind: hpc
+  human.default:
+    kind: human
+  local.default:
+    backend:
+      type: local
+    kind: local
+"""
+
+# Values the YAML emitter writes as plain (unquoted, unwrapped) scalars: identifiers and
+# absolute paths, plus relative paths led by "./", "../" or "~/" (a leading "." or "~" alone
+# could resolve to a float or null). Anything else, including words YAML would resolve to
+# bool/null, goes through the real emitter.
+_PLAIN_SCALAR_RE = re.compile(r"(?:[A-Za-z_/]|(?:~|\.\.?)/)[A-Za-z0-9_./-]*")
+_YAML_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "true", "false", "on", "off", "null"})
+
+
+def _is_plain_yaml_scalar(value: str) -> bool:
+    return _PLAIN_SCALAR_RE.fullmatch(value) is not None and value.lower() not in _YAML_RESERVED_WORDS
+
+
+# Operators shared by every legacy snapshot; only `hpc.default` depends on the inputs.
+# The templates above are the rendered form of this doc (the dumper sorts keys).
+_LEGACY_BASE_OPERATORS: Dict[str, Any] = {
+    "human.default": {"kind": "human"},
+    "experiment.default": {"kind": "experiment"},
+    "local.default": {"kind": "local", "backend": {"type": "local"}},
+}
+
+
+def _dump_legacy_operators_doc(hpc_backend: Dict[str, Any]) -> bytes:
+    operators_doc = {
+        "operators": {**_LEGACY_BASE_OPERATORS, "hpc.default": {"kind": "hpc", "backend": hpc_backend}},
+    }
+    # Imported here: only values the constant templates cannot render need the emitter.
+    import yaml
+
+    # Always the pure-Python SafeDumper: libyaml's CSafeDumper wraps long double-quoted scalars
+    # differently, which would make the snapshot bytes (and sha256) depend on the host's build.
+    dumped = yaml.dump(
+        operators_doc, Dumper=yaml.SafeDumper, sort_keys=True, default_flow_style=False, encoding="utf-8"
+    )
+    return bytes(dumped)
+
+
+@lru_cache(maxsize=64)
+def _snapshot_bytes_for(hpc_path: Optional[str], profile: Optional[str]) -> bytes:
+    """
+    Render the legacy operators.yaml bytes for (hpc_path, profile); `hpc_path` wins if both are set.
+
+    Inputs are plain strings and the output is immutable bytes, so results are memoized.
+    """
+    if hpc_path:
+        template = _LEGACY_TEMPLATE_HPC_YAML
+        value = hpc_path
+        hpc_backend: Dict[str, Any] = {"type": "hpc_yaml", "path": hpc_path}
+    elif profile:
+        template = _LEGACY_TEMPLATE_PROFILE
+        value = profile
+        hpc_backend = {"type": "profile", "name": profile}
+    else:
+        raise ValueError("Legacy snapshot generation requested without legacy inputs.")
+
+    if _is_plain_yaml_scalar(value):
+        return template % value.encode("ascii")
+
+    return _dump_legacy_operators_doc(hpc_backend)
+
 
 def _generate_legacy_operators_yaml_bytes(
     *,
@@ -22,28 +115,23 @@ def _generate_legacy_operators_yaml_bytes(
     """
     Generate a minimal operators.yaml snapshot from legacy CLI inputs.
 
+    The output is stable, human-readable YAML for hashing/provenance and is byte-identical
+    to `yaml.safe_dump(operators_doc, sort_keys=True)`. Common values (plain paths/names)
+    are rendered from a constant template; others fall back to the YAML emitter. The bytes
+    are cached per (hpc_config, profile) by `_snapshot_bytes_for`.
+
     Returns: (source, resolved_path, snapshot_bytes)
     """
     if legacy_hpc_config_path:
         source = OperatorWiringSource.LEGACY_HPC_CONFIG
         resolved = legacy_hpc_config_path
-        hpc_backend: Dict[str, Any] = {"type": "hpc_yaml", "path": legacy_hpc_config_path}
+        # The profile does not affect the output when an HPC config path is given.
+        snapshot_bytes = _snapshot_bytes_for(legacy_hpc_config_path, None)
     elif legacy_profile:
         source = OperatorWiringSource.LEGACY_PROFILE
         resolved = legacy_profile
-        hpc_backend = {"type": "profile", "name": legacy_profile}
+        snapshot_bytes = _snapshot_bytes_for(None, legacy_profile)
     else:
         raise ValueError("Legacy snapshot generation requested without legacy inputs.")
 
-    operators_doc = {
-        "operators": {
-            "human.default": {"kind": "human"},
-            "experiment.default": {"kind": "experiment"},
-            "local.default": {"kind": "local", "backend": {"type": "local"}},
-            "hpc.default": {"kind": "hpc", "backend": hpc_backend},
-        }
-    }
-
-    # Stable, human-readable YAML for hashing/provenance.
-    snapshot_text = yaml.safe_dump(operators_doc, sort_keys=True)
-    return source, resolved, snapshot_text.encode("utf-8")
+    return source, resolved, snapshot_bytes
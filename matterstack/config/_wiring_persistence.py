@@ -7,48 +7,135 @@ including history tracking and metadata management.
 
 from __future__ import annotations
 
-import hashlib
 import json
-from datetime import datetime, timezone
+import os
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
+from ._wiring_hashing import _load_snapshot_sha256_if_present, _sha256_bytes, _write_sha256_sidecar
+from ._wiring_io import _append_bytes, _atomic_write_bytes, _is_regular_file, _read_bytes, _stat_cached
+from ._wiring_json import (
+    _METADATA_TEMPLATE,
+    _dumps_json_line,
+    _extract_metadata_timestamps,
+    _json_scalar,
+    _loads_json,
+)
 from ._wiring_types import _ENV_OPERATORS_CONFIG, OperatorWiringSource
 
+# (unix second, formatted string) of the last `_utc_now_iso()` call. Stored as one tuple so
+# concurrent readers never see a second paired with another second's string.
+_LAST_UTC_ISO: Tuple[int, str] = (-1, "")
+
 
 def _utc_now_iso() -> str:
-    """Return the current UTC time as an ISO 8601 string."""
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    """
+    Return the current UTC time as an ISO 8601 string (second precision, "Z" suffix).
+
+    The formatted value is memoized per whole second, so bursts of events reuse it.
+    """
+    global _LAST_UTC_ISO
+    now = int(time.time())
+    last_second, last_iso = _LAST_UTC_ISO
+    if now == last_second:
+        return last_iso
+    iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    _LAST_UTC_ISO = (now, iso)
+    return iso
+
+
+_SNAPSHOT_DIRNAME = "operators_snapshot"
+_SNAPSHOT_RELPATH = "operators_snapshot/operators.yaml"
+_HISTORY_RELPATH = "operators_snapshot/history.jsonl"
+_METADATA_RELPATH = os.path.join(_SNAPSHOT_DIRNAME, "metadata.json")
+
+# Plain value of each wiring source, resolved once instead of through `Enum.value` per record.
+_SOURCE_VALUES: Dict[OperatorWiringSource, str] = {s: str(s.value) for s in OperatorWiringSource}
+
+
+@dataclass(frozen=True, slots=True)
+class _SnapshotLayout:
+    """
+    Standard snapshot file locations for one run root.
 
+    Iterates as (snapshot_dir, snapshot_yaml, metadata_json, history_jsonl) Paths for tuple
+    unpacking; the `*_str` fields hold the same locations as precomputed strings.
+    """
+
+    snapshot_dir: Path
+    snapshot_yaml: Path
+    metadata_json: Path
+    history_jsonl: Path
 
-def _sha256_bytes(data: bytes) -> str:
-    """Compute SHA256 hash of bytes data."""
-    h = hashlib.sha256()
-    h.update(data)
-    return h.hexdigest()
+    snapshot_dir_str: str
+    snapshot_yaml_str: str
+    metadata_json_str: str
+    history_jsonl_str: str
 
+    # The run root itself, as a string (e.g. for cache keys).
+    run_root_str: str
 
-def _ensure_explicit_path_exists(path: Path, *, what: str) -> None:
-    """Raise FileNotFoundError if the path does not exist."""
-    if not path.is_file():
-        raise FileNotFoundError(f"{what} file not found: {path}")
+    def __iter__(self) -> Iterator[Path]:
+        return iter((self.snapshot_dir, self.snapshot_yaml, self.metadata_json, self.history_jsonl))
 
 
-def _snapshot_paths(run_root: Path) -> Tuple[Path, Path, Path, Path]:
+@lru_cache(maxsize=64)
+def _snapshot_paths(run_root: Path) -> _SnapshotLayout:
     """
     Return the standard paths for operator wiring snapshot files.
 
-    Returns: (snapshot_dir, snapshot_yaml, metadata_json, history_jsonl)
+    Returns: layout unpackable as (snapshot_dir, snapshot_yaml, metadata_json, history_jsonl)
     """
-    snap_dir = run_root / "operators_snapshot"
-    snap_yaml = snap_dir / "operators.yaml"
-    meta_json = snap_dir / "metadata.json"
-    hist_jsonl = snap_dir / "history.jsonl"
-    return snap_dir, snap_yaml, meta_json, hist_jsonl
+    root = os.fspath(run_root)
+    snap_dir = os.path.join(root, _SNAPSHOT_DIRNAME)
+    snap_yaml = os.path.join(snap_dir, "operators.yaml")
+    meta_json = os.path.join(snap_dir, "metadata.json")
+    hist_jsonl = os.path.join(snap_dir, "history.jsonl")
+    return _SnapshotLayout(
+        snapshot_dir=Path(snap_dir),
+        snapshot_yaml=Path(snap_yaml),
+        metadata_json=Path(meta_json),
+        history_jsonl=Path(hist_jsonl),
+        snapshot_dir_str=snap_dir,
+        snapshot_yaml_str=snap_yaml,
+        metadata_json_str=meta_json,
+        history_jsonl_str=hist_jsonl,
+        run_root_str=root,
+    )
 
 
-def _append_history(
-    history_path: Path,
+def _scan_snapshot_dir(snapshot_dir: str) -> Dict[str, os.DirEntry[str]]:
+    """List the snapshot directory once as {name: DirEntry}; empty if it does not exist."""
+    try:
+        with os.scandir(snapshot_dir) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _entry_stat(entry: Optional[os.DirEntry[str]]) -> Optional[os.stat_result]:
+    """`os.stat` of a scanned entry (following symlinks), or None if it is missing."""
+    if entry is None:
+        return None
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+def _snapshot_relpath(snapshot_path: Optional[Path], run_root: Path) -> Optional[str]:
+    """Relative path of `snapshot_path` under `run_root`, without Path arithmetic for the standard location."""
+    if snapshot_path is None:
+        return None
+    if os.fspath(snapshot_path) == _snapshot_paths(run_root).snapshot_yaml_str:
+        return _SNAPSHOT_RELPATH
+    return str(snapshot_path.relative_to(run_root))
+
+
+def _encode_history_line(
     *,
     run_root: Path,
     event: str,
@@ -57,23 +144,27 @@ def _append_history(
     resolved_path: Optional[str],
     snapshot_path: Optional[Path],
     details: Optional[Dict[str, Any]] = None,
-) -> None:
-    """Append an event to the history.jsonl file."""
-    history_path.parent.mkdir(parents=True, exist_ok=True)
+    now_iso: Optional[str] = None,
+) -> bytes:
+    """Build one encoded history.jsonl event, stamped with `now_iso` (default: the current time)."""
     line = {
-        "at_utc": _utc_now_iso(),
+        "at_utc": now_iso or _utc_now_iso(),
         "event": event,
-        "source": str(source.value),
+        "source": _SOURCE_VALUES[source],
         "sha256": sha256,
         "resolved_path": resolved_path,
-        "snapshot_relpath": str(snapshot_path.relative_to(run_root)) if snapshot_path else None,
+        "snapshot_relpath": _snapshot_relpath(snapshot_path, run_root),
         "details": details or {},
     }
-    with history_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(line, sort_keys=True) + "\n")
+    return _dumps_json_line(line)
+
+
+_JSON_ENV_VAR_NAME = json.dumps(_ENV_OPERATORS_CONFIG)
+_JSON_HISTORY_RELPATH = json.dumps(_HISTORY_RELPATH)
+_JSON_SOURCE_VALUES = {source: json.dumps(value) for source, value in _SOURCE_VALUES.items()}
 
 
-def _write_metadata(
+def _encode_metadata(
     metadata_path: Path,
     *,
     run_root: Path,
@@ -87,57 +178,138 @@ def _write_metadata(
     legacy_profile: Optional[str],
     legacy_hpc_config_path: Optional[str],
     profiles_config_path: Optional[str],
-) -> None:
-    """Write or update the metadata.json file."""
-    created_at = _utc_now_iso()
-    if metadata_path.is_file():
+    now_iso: Optional[str] = None,
+) -> Optional[bytes]:
+    """
+    Build the encoded metadata.json payload.
+
+    `now_iso` (default: the current time) stamps `updated_at_utc`, and `created_at_utc` for a
+    new file. Returns None when the existing file already holds the same payload apart from
+    `updated_at_utc`, i.e. when there is nothing to write.
+    """
+    now_iso = now_iso or _utc_now_iso()
+    created_at = now_iso
+    existing_bytes: Optional[bytes]
+    existing_updated_at: Any = None
+    try:
+        # EAFP: a missing file (or a directory) fails the read, so no separate stat is needed.
+        existing_bytes = _read_bytes(metadata_path)
+    except OSError:
+        existing_bytes = None
+    if existing_bytes is not None:
         try:
-            existing = json.loads(metadata_path.read_text(encoding="utf-8") or "{}")
-            created_at = existing.get("created_at_utc") or created_at
+            # Only the two timestamps are needed; skip building the whole document when possible.
+            timestamps = _extract_metadata_timestamps(existing_bytes.decode("utf-8"))
+            if timestamps is None:
+                existing = _loads_json(existing_bytes or b"{}")
+                timestamps = (existing.get("created_at_utc"), existing.get("updated_at_utc"))
+            existing_created_at, existing_updated_at = timestamps
+            created_at = existing_created_at or created_at
         except Exception:
             # If metadata is corrupt, we still want to be able to proceed; treat as new.
-            created_at = created_at
-
-    snap_rel = str(snapshot_path.relative_to(run_root)) if snapshot_path else None
-
-    payload = {
-        "schema_version": 1,
-        "created_at_utc": created_at,
-        "updated_at_utc": _utc_now_iso(),
-        "effective": {
-            "source": str(source.value),
-            "resolved_path": resolved_path,
-            "sha256": sha256,
-            "snapshot_relpath": snap_rel,
-        },
-        "provenance": {
-            "workspace_slug": workspace_slug,
-            "env_var_name": _ENV_OPERATORS_CONFIG,
-            "cli": {
-                "operators_config": cli_operators_config_path,
-                "force_wiring_override": bool(force_override),
-            },
-            "legacy": {
-                "profile": legacy_profile,
-                "hpc_config": legacy_hpc_config_path,
-                "profiles_config_path": profiles_config_path,
-            },
-        },
-        "history_relpath": str((run_root / "operators_snapshot" / "history.jsonl").relative_to(run_root)),
+            existing_bytes = None
+
+    fields = {
+        "created_at_utc": _json_scalar(created_at),
+        "source": _JSON_SOURCE_VALUES[source],
+        "resolved_path": _json_scalar(resolved_path),
+        "sha256": _json_scalar(sha256),
+        "snapshot_relpath": _json_scalar(_snapshot_relpath(snapshot_path, run_root)),
+        "workspace_slug": _json_scalar(workspace_slug),
+        "env_var_name": _JSON_ENV_VAR_NAME,
+        "cli_operators_config": _json_scalar(cli_operators_config_path),
+        "force_wiring_override": "true" if force_override else "false",
+        "legacy_profile": _json_scalar(legacy_profile),
+        "legacy_hpc_config": _json_scalar(legacy_hpc_config_path),
+        "profiles_config_path": _json_scalar(profiles_config_path),
+        "history_relpath": _JSON_HISTORY_RELPATH,
     }
 
-    metadata_path.parent.mkdir(parents=True, exist_ok=True)
-    metadata_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if existing_bytes is not None:
+        # Same document apart from updated_at_utc: render with the stored timestamp and compare.
+        rendered = _METADATA_TEMPLATE.format(updated_at_utc=_json_scalar(existing_updated_at), **fields)
+        if rendered.encode("utf-8") == existing_bytes:
+            return None
 
+    return _METADATA_TEMPLATE.format(updated_at_utc=_json_scalar(now_iso), **fields).encode("utf-8")
 
-def _load_snapshot_sha256_if_present(snapshot_path: Path) -> Optional[str]:
-    """Load the SHA256 hash of a snapshot file if it exists."""
-    if not snapshot_path.is_file():
-        return None
-    try:
-        return _sha256_bytes(snapshot_path.read_bytes())
-    except Exception:
-        return None
+
+def _commit_snapshot_files(
+    snapshot_yaml_path: Path,
+    snapshot_bytes: bytes,
+    sha256: str,
+    *,
+    metadata_path: Path,
+    metadata_bytes: Optional[bytes],
+    history_path: Path,
+    history_bytes: bytes,
+) -> None:
+    """
+    Write a new snapshot together with its metadata and history event.
+
+    All buffers are encoded by the caller before anything touches disk. The snapshot and
+    metadata are swapped in atomically (temp file + os.replace), so a crash mid-write never
+    leaves a truncated file; metadata is written only when `metadata_bytes` is not None.
+    The snapshot directory must already exist.
+    """
+    _atomic_write_bytes(snapshot_yaml_path, snapshot_bytes)
+    _write_sha256_sidecar(snapshot_yaml_path, sha256)
+
+    if metadata_bytes is not None:
+        _atomic_write_bytes(metadata_path, metadata_bytes)
+    _append_bytes(history_path, history_bytes)
+
+
+def _reconstruct_metadata_and_history(
+    *,
+    run_root: Path,
+    snapshot_yaml_path: Path,
+    metadata_path: Path,
+    history_path: Path,
+    sha256: Optional[str],
+    workspace_slug: str,
+    cli_operators_config_path: Optional[str],
+    force_override: bool,
+    legacy_profile: Optional[str],
+    legacy_hpc_config_path: Optional[str],
+    profiles_config_path: Optional[str],
+) -> None:
+    """
+    Recreate missing metadata.json plus its WIRING_PERSISTED history event for an existing snapshot.
+
+    Both payloads are encoded first, then written with one raw write each (metadata via a
+    temp file + os.replace); the snapshot directory is known to exist, so no mkdir is issued.
+    """
+    resolved_path = str(snapshot_yaml_path)
+    now_iso = _utc_now_iso()
+    metadata_bytes = _encode_metadata(
+        metadata_path,
+        run_root=run_root,
+        source=OperatorWiringSource.RUN_PERSISTED,
+        resolved_path=resolved_path,
+        sha256=sha256,
+        snapshot_path=snapshot_yaml_path,
+        workspace_slug=workspace_slug,
+        cli_operators_config_path=cli_operators_config_path,
+        force_override=force_override,
+        legacy_profile=legacy_profile,
+        legacy_hpc_config_path=legacy_hpc_config_path,
+        profiles_config_path=profiles_config_path,
+        now_iso=now_iso,
+    )
+    history_bytes = _encode_history_line(
+        run_root=run_root,
+        event="WIRING_PERSISTED",
+        source=OperatorWiringSource.RUN_PERSISTED,
+        sha256=sha256,
+        resolved_path=resolved_path,
+        snapshot_path=snapshot_yaml_path,
+        details={"note": "Reconstructed metadata/history for existing snapshot"},
+        now_iso=now_iso,
+    )
+    if metadata_bytes is not None:
+        _atomic_write_bytes(metadata_path, metadata_bytes)
+    _append_bytes(history_path, history_bytes)
 
 
 def _persist_snapshot_bytes(
@@ -157,76 +329,33 @@ def _persist_snapshot_bytes(
     profiles_config_path: Optional[str],
     workspace_slug: str,
     allow_override: bool,
+    stat_cache: Optional[Dict[str, Optional[os.stat_result]]] = None,
 ) -> Tuple[str, Path, bool]:
     """
     Persist `snapshot_bytes` into the run snapshot (idempotent), enforcing override safety.
 
+    When the snapshot already holds these bytes (and metadata exists) this returns without
+    touching the filesystem beyond the stats, which come from `stat_cache` when given.
+
     Returns: (sha256, snapshot_yaml_path, did_write)
     """
-    snapshot_dir.mkdir(parents=True, exist_ok=True)
-
     desired_sha = _sha256_bytes(snapshot_bytes)
-    existing_sha = _load_snapshot_sha256_if_present(snapshot_yaml_path)
-
-    if existing_sha is not None and existing_sha != desired_sha:
-        if not allow_override:
-            # Record refusal (no mutation).
-            _append_history(
-                history_path,
-                run_root=run_root,
-                event="WIRING_OVERRIDE_REFUSED",
-                source=OperatorWiringSource.CLI_OVERRIDE,
-                sha256=existing_sha,
-                resolved_path=resolved_path,
-                snapshot_path=snapshot_yaml_path,
-                details={
-                    "attempted_sha256": desired_sha,
-                    "note": "Override refused; rerun with --force-wiring-override",
-                },
-            )
-            raise ValueError(
-                "Refusing to override persisted operator wiring for this run. "
-                "Re-run with --force-wiring-override to replace the run snapshot."
-            )
-
-        # Forced override: overwrite snapshot + update metadata.
-        snapshot_yaml_path.write_bytes(snapshot_bytes)
-        _write_metadata(
-            metadata_path,
-            run_root=run_root,
-            source=source,
-            resolved_path=resolved_path,
-            sha256=desired_sha,
-            snapshot_path=snapshot_yaml_path,
-            workspace_slug=workspace_slug,
-            cli_operators_config_path=cli_operators_config_path,
-            force_override=force_override,
-            legacy_profile=legacy_profile,
-            legacy_hpc_config_path=legacy_hpc_config_path,
-            profiles_config_path=profiles_config_path,
-        )
-        _append_history(
-            history_path,
-            run_root=run_root,
-            event="WIRING_OVERRIDE_FORCED",
-            source=source,
-            sha256=desired_sha,
-            resolved_path=resolved_path,
-            snapshot_path=snapshot_yaml_path,
-            details={"prior_sha256": existing_sha},
-        )
-        return desired_sha, snapshot_yaml_path, True
+    snapshot_stat = _stat_cached(snapshot_yaml_path, stat_cache)
+    existing_sha = (
+        _load_snapshot_sha256_if_present(snapshot_yaml_path, snapshot_stat, expected=(snapshot_bytes, desired_sha))
+        if snapshot_stat
+        else None
+    )
 
     if existing_sha == desired_sha:
         # Already matches; ensure metadata/history exist for resilience (e.g., older runs).
-        if not metadata_path.is_file():
-            _write_metadata(
-                metadata_path,
+        if not _is_regular_file(_stat_cached(metadata_path, stat_cache)):
+            _reconstruct_metadata_and_history(
                 run_root=run_root,
-                source=OperatorWiringSource.RUN_PERSISTED,
-                resolved_path=str(snapshot_yaml_path),
+                snapshot_yaml_path=snapshot_yaml_path,
+                metadata_path=metadata_path,
+                history_path=history_path,
                 sha256=desired_sha,
-                snapshot_path=snapshot_yaml_path,
                 workspace_slug=workspace_slug,
                 cli_operators_config_path=cli_operators_config_path,
                 force_override=force_override,
@@ -234,42 +363,88 @@ def _persist_snapshot_bytes(
                 legacy_hpc_config_path=legacy_hpc_config_path,
                 profiles_config_path=profiles_config_path,
             )
-            _append_history(
+        return desired_sha, snapshot_yaml_path, False
+
+    # One timestamp for every record this call writes.
+    now_iso = _utc_now_iso()
+    metadata_fields: Dict[str, Any] = {
+        "run_root": run_root,
+        "source": source,
+        "resolved_path": resolved_path,
+        "sha256": desired_sha,
+        "snapshot_path": snapshot_yaml_path,
+        "workspace_slug": workspace_slug,
+        "cli_operators_config_path": cli_operators_config_path,
+        "force_override": force_override,
+        "legacy_profile": legacy_profile,
+        "legacy_hpc_config_path": legacy_hpc_config_path,
+        "profiles_config_path": profiles_config_path,
+        "now_iso": now_iso,
+    }
+
+    if existing_sha is not None and existing_sha != desired_sha:
+        if not allow_override:
+            # Record refusal (no mutation). The snapshot exists, so its directory does too.
+            _append_bytes(
                 history_path,
+                _encode_history_line(
+                    run_root=run_root,
+                    event="WIRING_OVERRIDE_REFUSED",
+                    source=OperatorWiringSource.CLI_OVERRIDE,
+                    sha256=existing_sha,
+                    resolved_path=resolved_path,
+                    snapshot_path=snapshot_yaml_path,
+                    details={
+                        "attempted_sha256": desired_sha,
+                        "note": "Override refused; rerun with --force-wiring-override",
+                    },
+                    now_iso=now_iso,
+                ),
+            )
+            raise ValueError(
+                "Refusing to override persisted operator wiring for this run. "
+                "Re-run with --force-wiring-override to replace the run snapshot."
+            )
+
+        # Forced override: overwrite snapshot + update metadata.
+        _commit_snapshot_files(
+            snapshot_yaml_path,
+            snapshot_bytes,
+            desired_sha,
+            metadata_path=metadata_path,
+            metadata_bytes=_encode_metadata(metadata_path, **metadata_fields),
+            history_path=history_path,
+            history_bytes=_encode_history_line(
                 run_root=run_root,
-                event="WIRING_PERSISTED",
-                source=OperatorWiringSource.RUN_PERSISTED,
+                event="WIRING_OVERRIDE_FORCED",
+                source=source,
                 sha256=desired_sha,
-                resolved_path=str(snapshot_yaml_path),
+                resolved_path=resolved_path,
                 snapshot_path=snapshot_yaml_path,
-                details={"note": "Reconstructed metadata/history for existing snapshot"},
-            )
-        return desired_sha, snapshot_yaml_path, False
+                details={"prior_sha256": existing_sha},
+                now_iso=now_iso,
+            ),
+        )
+        return desired_sha, snapshot_yaml_path, True
 
     # No existing snapshot: write initial snapshot + metadata + history.
-    snapshot_yaml_path.write_bytes(snapshot_bytes)
-    _write_metadata(
-        metadata_path,
-        run_root=run_root,
-        source=source,
-        resolved_path=resolved_path,
-        sha256=desired_sha,
-        snapshot_path=snapshot_yaml_path,
-        workspace_slug=workspace_slug,
-        cli_operators_config_path=cli_operators_config_path,
-        force_override=force_override,
-        legacy_profile=legacy_profile,
-        legacy_hpc_config_path=legacy_hpc_config_path,
-        profiles_config_path=profiles_config_path,
-    )
-    _append_history(
-        history_path,
-        run_root=run_root,
-        event="WIRING_PERSISTED",
-        source=source,
-        sha256=desired_sha,
-        resolved_path=resolved_path,
-        snapshot_path=snapshot_yaml_path,
-        details={"note": "Initial persistence"},
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    _commit_snapshot_files(
+        snapshot_yaml_path,
+        snapshot_bytes,
+        desired_sha,
+        metadata_path=metadata_path,
+        metadata_bytes=_encode_metadata(metadata_path, **metadata_fields),
+        history_path=history_path,
+        history_bytes=_encode_history_line(
+            run_root=run_root,
+            event="WIRING_PERSISTED",
+            source=source,
+            sha256=desired_sha,
+            resolved_path=resolved_path,
+            snapshot_path=snapshot_yaml_path,
+            details={"note": "Initial persistence"},
+            now_iso=now_iso,
+        ),
     )
     return desired_sha, snapshot_yaml_path, True
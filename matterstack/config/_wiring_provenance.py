@@ -7,10 +7,14 @@ information from run metadata files.
 
 from __future__ import annotations
 
-import json
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Tuple
 
+from ._wiring_json import _CREATED_AT_KEY_RE, _JSON_DECODER, _loads_json
+from ._wiring_persistence import _METADATA_RELPATH
 from ._wiring_types import OperatorWiringProvenance
 
 
@@ -18,15 +22,69 @@ def load_wiring_provenance_from_run_root(run_root: Path) -> Optional[OperatorWir
     """
     Best-effort: load wiring provenance from `<run_root>/operators_snapshot/metadata.json`.
 
+    Parsed results are memoized by (path, mtime_ns, size, inode), so repeated `explain` calls
+    on an unchanged run skip JSON decoding; an atomic replace changes the inode even when
+    mtime and size happen to match.
+
     Returns None if the metadata file is missing or unreadable.
     """
     try:
-        meta_path = run_root / "operators_snapshot" / "metadata.json"
-        if not meta_path.is_file():
-            return None
+        # A single stat doubles as the existence check; OSError means "missing".
+        meta_path = os.path.join(run_root, _METADATA_RELPATH)
+        st = os.stat(meta_path)
+        return _load_wiring_provenance_cached(meta_path, st.st_mtime_ns, st.st_size, st.st_ino)
+    except Exception:
+        return None
+
+
+# Top-level keys as laid out by `_encode_metadata` (json.dumps(indent=2)): a line starting with
+# exactly two spaces and a quote. JSON strings cannot contain raw newlines, so these anchors
+# only ever match structural keys.
+_EFFECTIVE_KEY_RE = re.compile(r'^  "effective": ', re.MULTILINE)
+
+
+def _extract_provenance_fields(text: str) -> Optional[Tuple[Any, Any]]:
+    """
+    Decode only the `effective` object and `created_at_utc` value from metadata.json text.
+
+    Skips building the rest of the document (the `provenance` tree). Returns None when the
+    text is not in the layout written by `_encode_metadata`, so callers fall back to a full parse.
+    """
+    m = _EFFECTIVE_KEY_RE.search(text)
+    if m is None:
+        return None
+    try:
+        effective, _end = _JSON_DECODER.raw_decode(text, m.end())
+        created_at_utc = None
+        m = _CREATED_AT_KEY_RE.search(text)
+        if m is not None:
+            created_at_utc, _end = _JSON_DECODER.raw_decode(text, m.end())
+    except ValueError:
+        return None
+    return effective, created_at_utc
+
 
-        payload = json.loads(meta_path.read_text(encoding="utf-8") or "{}")
-        effective = payload.get("effective") if isinstance(payload, dict) else None
+@lru_cache(maxsize=256)
+def _load_wiring_provenance_cached(
+    meta_path_str: str, mtime_ns: int, size: int, ino: int
+) -> Optional[OperatorWiringProvenance]:
+    """
+    Parse metadata.json into a provenance view.
+
+    `mtime_ns`, `size` and `ino` only key the cache; OperatorWiringProvenance is frozen, so cached
+    instances are safe to share between callers.
+    """
+    try:
+        with open(meta_path_str, "rb") as f:
+            data = f.read()
+
+        extracted = _extract_provenance_fields(data.decode("utf-8"))
+        if extracted is not None:
+            effective, created_at_utc = extracted
+        else:
+            payload = _loads_json(data or b"{}")
+            effective = payload.get("effective") if isinstance(payload, dict) else None
+            created_at_utc = payload.get("created_at_utc") if isinstance(payload, dict) else None
         if not isinstance(effective, dict):
             return None
 
@@ -36,8 +94,6 @@ def load_wiring_provenance_from_run_root(run_root: Path) -> Optional[OperatorWir
 
         sha256 = effective.get("sha256")
         snapshot_relpath = effective.get("snapshot_relpath")
-
-        created_at_utc = payload.get("created_at_utc") if isinstance(payload, dict) else None
         resolved_path = effective.get("resolved_path")
 
         return OperatorWiringProvenance(
@@ -29,7 +29,7 @@ class OperatorWiringSource(str, Enum):
     NONE = "NONE"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedOperatorWiring:
     """
     Result of resolving operator wiring for a run.
@@ -54,7 +54,7 @@ class ResolvedOperatorWiring:
     warnings: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OperatorWiringProvenance:
     """
     Lightweight wiring provenance view loaded from `<run_root>/operators_snapshot/metadata.json`.
@@ -0,0 +1,36 @@
+"""
+Internal YAML loading shared by the config readers.
+
+PyYAML is imported on first use rather than at module import, so commands that never
+read a YAML config (e.g. `matterstack explain`) do not pay for loading it.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import IO, Any, Union
+
+
+def safe_load_yaml(data: Union[str, bytes, IO[bytes]]) -> Any:
+    """
+    Parse YAML with safe semantics (equivalent to `yaml.safe_load`).
+
+    Uses the libyaml parser when available; it builds the same objects as the
+    pure-Python SafeLoader. Callers pass raw file bytes, or a binary file object to
+    let the parser read in chunks, so the loader detects the encoding (UTF-8/UTF-16 BOM)
+    itself instead of Python decoding the whole file first.
+    """
+    import yaml
+
+    return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def load_yaml_file(path: Union[str, os.PathLike[str]]) -> Any:
+    """
+    Parse the YAML file at `path` with `safe_load_yaml`; an empty document loads as `{}`.
+
+    The open file is handed to the parser, so libyaml reads it in chunks instead of a full
+    copy of the file. Open errors (missing file, permissions) propagate to the caller.
+    """
+    with open(path, "rb") as f:
+        return safe_load_yaml(f) or {}
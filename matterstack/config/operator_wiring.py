@@ -16,27 +16,30 @@ Public API:
 from __future__ import annotations
 
 import os
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-# Import legacy support
-from ._wiring_legacy import _generate_legacy_operators_yaml_bytes
+from matterstack._lazy import lazy_exports
 
 # Import internal persistence functions
+from ._wiring_hashing import _load_snapshot_sha256_if_present
+from ._wiring_io import _ensure_explicit_path_exists, _is_regular_file, _read_bytes, _stat_cached
 from ._wiring_persistence import (
-    _append_history,
-    _ensure_explicit_path_exists,
-    _load_snapshot_sha256_if_present,
+    _entry_stat,
     _persist_snapshot_bytes,
+    _reconstruct_metadata_and_history,
+    _scan_snapshot_dir,
     _snapshot_paths,
-    _write_metadata,
+    _SnapshotLayout,
 )
 
-# Re-export provenance functions
-from ._wiring_provenance import (
-    format_operator_wiring_explain_line,
-    load_wiring_provenance_from_run_root,
-)
+if TYPE_CHECKING:
+    from ._wiring_provenance import (
+        format_operator_wiring_explain_line,
+        load_wiring_provenance_from_run_root,
+    )
 
 # Re-export types from internal modules
 from ._wiring_types import (
@@ -55,6 +58,89 @@ __all__ = [
     "format_operator_wiring_explain_line",
 ]
 
+# Re-exported provenance functions, imported on first attribute access (PEP 562) so that
+# resolution-only callers do not load the provenance module.
+_LAZY_EXPORTS = {
+    "format_operator_wiring_explain_line": "._wiring_provenance",
+    "load_wiring_provenance_from_run_root": "._wiring_provenance",
+}
+
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
+
+
+# Process-level LRU of resolution results, keyed by the inputs plus a stat fingerprint of
+# every file the precedence ladder would consult (see `_resolution_cache_key`).
+_RESOLUTION_CACHE: "OrderedDict[Tuple[Any, ...], ResolvedOperatorWiring]" = OrderedDict()
+_RESOLUTION_CACHE_MAXSIZE = 64
+
+_StatFingerprint = Optional[Tuple[int, int, int, int]]
+
+
+def _clear_resolution_cache() -> None:
+    """Drop every cached resolution result (e.g. between tests)."""
+    _RESOLUTION_CACHE.clear()
+
+
+def _fingerprint(st: Optional[os.stat_result]) -> _StatFingerprint:
+    if st is None:
+        return None
+    return (st.st_mode, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _resolution_cache_key(
+    *,
+    workspace_slug: str,
+    workspace_default: Path,
+    layout: _SnapshotLayout,
+    snapshot_entry: Optional[os.DirEntry[str]],
+    metadata_present: bool,
+    cli_operators_config_path: Optional[str],
+    force_override: bool,
+    legacy_hpc_config_path: Optional[str],
+    legacy_profile: Optional[str],
+    profiles_config_path: Optional[str],
+    env_path_raw: Optional[str],
+    stat_cache: Dict[str, Optional[os.stat_result]],
+) -> Tuple[Any, ...]:
+    """
+    Build the cache key for one resolution.
+
+    `snapshot_entry` and `metadata_present` come from one listing of the snapshot directory:
+    the snapshot is stat'ed through its DirEntry and metadata.json only needs to exist (its
+    contents never change the result). Only files that can influence the outcome are
+    stat'ed: once a run snapshot exists (and no CLI override is given) the lower-precedence
+    sources are never consulted. The stats land in `stat_cache`, so a cache miss reuses them
+    during resolution.
+    """
+    snapshot_stat = _entry_stat(snapshot_entry)
+    stat_cache[layout.snapshot_yaml_str] = snapshot_stat
+
+    fingerprints: list[Any] = [_fingerprint(snapshot_stat), metadata_present]
+    if cli_operators_config_path:
+        fingerprints.append(_fingerprint(_stat_cached(Path(cli_operators_config_path), stat_cache)))
+    elif not _is_regular_file(snapshot_stat):
+        fingerprints.append(_fingerprint(_stat_cached(workspace_default, stat_cache)))
+        if env_path_raw:
+            fingerprints.append(_fingerprint(_stat_cached(Path(env_path_raw), stat_cache)))
+        if legacy_hpc_config_path:
+            fingerprints.append(_fingerprint(_stat_cached(Path(legacy_hpc_config_path), stat_cache)))
+
+    return (
+        layout.run_root_str,
+        workspace_slug,
+        os.fspath(workspace_default),
+        cli_operators_config_path,
+        bool(force_override),
+        legacy_hpc_config_path,
+        legacy_profile,
+        profiles_config_path,
+        env_path_raw,
+        # Relative inputs resolve against the working directory.
+        os.getcwd(),
+        tuple(fingerprints),
+    )
+
 
 def resolve_operator_wiring(
     run_handle: Any,
@@ -79,6 +165,11 @@ def resolve_operator_wiring(
     Override safety:
       - If a run snapshot exists and CLI `--operators-config` is provided, refuse unless
         `force_override=True`. Refusals and forced overrides are recorded in history.jsonl.
+
+    Results are cached per process while the inputs and the stat of every consulted file
+    are unchanged, so repeated calls (e.g. the multi-run scheduler loop) skip resolution.
+    Cached results are shared; treat them as read-only. `_clear_resolution_cache()` empties
+    the cache.
     """
     run_root = Path(run_handle.root_path)
     workspace_slug = str(getattr(run_handle, "workspace_slug", ""))
@@ -87,58 +178,156 @@ def resolve_operator_wiring(
         workspace_slug = "UNKNOWN_WORKSPACE"
 
     workspace_base = workspace_base_path or Path("workspaces")
-    snapshot_dir, snapshot_yaml, metadata_json, history_jsonl = _snapshot_paths(run_root)
+    workspace_default = workspace_base / workspace_slug / "operators.yaml"
+    layout = _snapshot_paths(run_root)
+
+    # Each candidate path is stat'ed at most once per call (cache key + precedence ladder).
+    stat_cache: Dict[str, Optional[os.stat_result]] = {}
+    env_path_raw = os.environ.get(_ENV_OPERATORS_CONFIG)
+    # One listing of the snapshot directory serves the cache key and the precedence ladder.
+    entries = _scan_snapshot_dir(layout.snapshot_dir_str)
+    metadata_entry = entries.get("metadata.json")
+    metadata_present = metadata_entry is not None and metadata_entry.is_file()
+    key = _resolution_cache_key(
+        workspace_slug=workspace_slug,
+        workspace_default=workspace_default,
+        layout=layout,
+        snapshot_entry=entries.get("operators.yaml"),
+        metadata_present=metadata_present,
+        cli_operators_config_path=cli_operators_config_path,
+        force_override=force_override,
+        legacy_hpc_config_path=legacy_hpc_config_path,
+        legacy_profile=legacy_profile,
+        profiles_config_path=profiles_config_path,
+        env_path_raw=env_path_raw,
+        stat_cache=stat_cache,
+    )
+    snapshot_present = _is_regular_file(stat_cache[layout.snapshot_yaml_str])
+    cached = _RESOLUTION_CACHE.get(key)
+    if cached is not None:
+        _RESOLUTION_CACHE.move_to_end(key)
+        return cached
+
+    resolved = _resolve_operator_wiring_uncached(
+        run_root=run_root,
+        workspace_slug=workspace_slug,
+        workspace_default=workspace_default,
+        layout=layout,
+        metadata_present=metadata_present,
+        cli_operators_config_path=cli_operators_config_path,
+        force_override=force_override,
+        legacy_hpc_config_path=legacy_hpc_config_path,
+        legacy_profile=legacy_profile,
+        profiles_config_path=profiles_config_path,
+        env_path_raw=env_path_raw,
+        stat_cache=stat_cache,
+    )
+    # Only cache results that found the snapshot and its metadata already on disk. A call
+    # that wrote them is keyed on their absence, so caching it would serve a "persisted"
+    # result to a later call that finds them deleted again. Results carrying warnings
+    # describe a degraded state; re-check those every time.
+    if snapshot_present and metadata_present and not resolved.warnings:
+        _RESOLUTION_CACHE[key] = resolved
+        if len(_RESOLUTION_CACHE) > _RESOLUTION_CACHE_MAXSIZE:
+            _RESOLUTION_CACHE.popitem(last=False)
+    return resolved
+
+
+# Contents and realpath of recently read source operators.yaml files (workspace default /
+# env var / CLI), keyed by absolute path and validated against the file's stat fingerprint.
+# Many runs in a process typically share one source, so only its first resolution reads the
+# file and walks its symlinks.
+_SOURCE_CACHE: "OrderedDict[str, Tuple[_StatFingerprint, bytes, str]]" = OrderedDict()
+_SOURCE_CACHE_MAXSIZE = 8
+
+
+def _read_source(path: Path, stat_cache: Dict[str, Optional[os.stat_result]]) -> Tuple[bytes, str]:
+    """
+    Return (contents, realpath) of a source operators.yaml, reused while its stat is unchanged.
+
+    The realpath equals `str(path.resolve())`.
+    """
+    st = _stat_cached(path, stat_cache)
+    key = os.path.abspath(path)
+    fingerprint = _fingerprint(st)
+    cached = _SOURCE_CACHE.get(key)
+    if cached is not None and fingerprint is not None and cached[0] == fingerprint:
+        return cached[1], cached[2]
+
+    data = _read_bytes(path, st.st_size if st is not None else -1)
+    real_path = os.path.realpath(key)
+    if fingerprint is not None:
+        _SOURCE_CACHE[key] = (fingerprint, data, real_path)
+        if len(_SOURCE_CACHE) > _SOURCE_CACHE_MAXSIZE:
+            _SOURCE_CACHE.popitem(last=False)
+    return data, real_path
+
+
+def _resolve_operator_wiring_uncached(
+    *,
+    run_root: Path,
+    workspace_slug: str,
+    workspace_default: Path,
+    layout: _SnapshotLayout,
+    metadata_present: bool,
+    cli_operators_config_path: Optional[str],
+    force_override: bool,
+    legacy_hpc_config_path: Optional[str],
+    legacy_profile: Optional[str],
+    profiles_config_path: Optional[str],
+    env_path_raw: Optional[str],
+    stat_cache: Dict[str, Optional[os.stat_result]],
+) -> ResolvedOperatorWiring:
+    """
+    Walk the precedence ladder of `resolve_operator_wiring` (no result caching).
+
+    Result paths come from the precomputed strings on `layout`, not per-branch `str()` calls.
+    `metadata_present` is what the caller's snapshot directory listing saw for metadata.json,
+    so the run-snapshot branch needs no extra stat to decide whether to reconstruct it.
+    """
+    snapshot_dir, snapshot_yaml, metadata_json, history_jsonl = layout
 
     warnings: list[str] = []
 
     # 1) CLI override: highest precedence.
     if cli_operators_config_path:
         p = Path(cli_operators_config_path)
-        _ensure_explicit_path_exists(p, what="CLI --operators-config")
-        snapshot_bytes = p.read_bytes()
-        sha, snap_path, _did_write = _persist_snapshot_bytes(
+        _ensure_explicit_path_exists(p, what="CLI --operators-config", stat_cache=stat_cache)
+        snapshot_bytes, resolved_cli_path = _read_source(p, stat_cache)
+        sha, _snap_path, _did_write = _persist_snapshot_bytes(
             run_root=run_root,
             snapshot_dir=snapshot_dir,
             snapshot_yaml_path=snapshot_yaml,
             metadata_path=metadata_json,
             history_path=history_jsonl,
             source=OperatorWiringSource.CLI_OVERRIDE,
-            resolved_path=str(p.resolve()),
+            resolved_path=resolved_cli_path,
             snapshot_bytes=snapshot_bytes,
-            cli_operators_config_path=str(p.resolve()),
+            cli_operators_config_path=resolved_cli_path,
             force_override=force_override,
             legacy_profile=legacy_profile,
             legacy_hpc_config_path=legacy_hpc_config_path,
             profiles_config_path=profiles_config_path,
             workspace_slug=workspace_slug,
             allow_override=bool(force_override),
+            stat_cache=stat_cache,
         )
-        return ResolvedOperatorWiring(
-            source=OperatorWiringSource.CLI_OVERRIDE,
-            resolved_path=str(p.resolve()),
-            sha256=sha,
-            snapshot_path=str(snap_path),
-            snapshot_dir=str(snapshot_dir),
-            metadata_path=str(metadata_json),
-            history_path=str(history_jsonl),
-            is_persisted=True,
-            warnings=warnings,
-        )
+        return _persisted_wiring(OperatorWiringSource.CLI_OVERRIDE, resolved_cli_path, sha, layout, warnings)
 
     # 2) Run snapshot.
-    if snapshot_yaml.is_file():
-        sha = _load_snapshot_sha256_if_present(snapshot_yaml)
-        if sha is None:
+    snapshot_stat = _stat_cached(snapshot_yaml, stat_cache)
+    if _is_regular_file(snapshot_stat):
+        snapshot_sha = _load_snapshot_sha256_if_present(snapshot_yaml, snapshot_stat)
+        if snapshot_sha is None:
             warnings.append("Failed to compute sha256 for existing run snapshot; treating as unknown.")
         # Ensure metadata/history exist for resilience.
-        if not metadata_json.is_file():
-            _write_metadata(
-                metadata_json,
+        if not metadata_present:
+            _reconstruct_metadata_and_history(
                 run_root=run_root,
-                source=OperatorWiringSource.RUN_PERSISTED,
-                resolved_path=str(snapshot_yaml),
-                sha256=sha,
-                snapshot_path=snapshot_yaml,
+                snapshot_yaml_path=snapshot_yaml,
+                metadata_path=metadata_json,
+                history_path=history_jsonl,
+                sha256=snapshot_sha,
                 workspace_slug=workspace_slug,
                 cli_operators_config_path=None,
                 force_override=False,
@@ -146,40 +335,21 @@ def resolve_operator_wiring(
                 legacy_hpc_config_path=None,
                 profiles_config_path=profiles_config_path,
             )
-            _append_history(
-                history_jsonl,
-                run_root=run_root,
-                event="WIRING_PERSISTED",
-                source=OperatorWiringSource.RUN_PERSISTED,
-                sha256=sha,
-                resolved_path=str(snapshot_yaml),
-                snapshot_path=snapshot_yaml,
-                details={"note": "Reconstructed metadata/history for existing snapshot"},
-            )
-        return ResolvedOperatorWiring(
-            source=OperatorWiringSource.RUN_PERSISTED,
-            resolved_path=str(snapshot_yaml),
-            sha256=sha,
-            snapshot_path=str(snapshot_yaml),
-            snapshot_dir=str(snapshot_dir),
-            metadata_path=str(metadata_json),
-            history_path=str(history_jsonl),
-            is_persisted=True,
-            warnings=warnings,
+        return _persisted_wiring(
+            OperatorWiringSource.RUN_PERSISTED, layout.snapshot_yaml_str, snapshot_sha, layout, warnings
         )
 
     # 3) Workspace default.
-    workspace_default = workspace_base / workspace_slug / "operators.yaml"
-    if workspace_default.is_file():
-        snapshot_bytes = workspace_default.read_bytes()
-        sha, snap_path, _did_write = _persist_snapshot_bytes(
+    if _is_regular_file(_stat_cached(workspace_default, stat_cache)):
+        snapshot_bytes, resolved_workspace_default = _read_source(workspace_default, stat_cache)
+        sha, _snap_path, _did_write = _persist_snapshot_bytes(
             run_root=run_root,
             snapshot_dir=snapshot_dir,
             snapshot_yaml_path=snapshot_yaml,
             metadata_path=metadata_json,
             history_path=history_jsonl,
             source=OperatorWiringSource.WORKSPACE_DEFAULT,
-            resolved_path=str(workspace_default.resolve()),
+            resolved_path=resolved_workspace_default,
             snapshot_bytes=snapshot_bytes,
             cli_operators_config_path=None,
             force_override=False,
@@ -188,33 +358,25 @@ def resolve_operator_wiring(
             profiles_config_path=profiles_config_path,
             workspace_slug=workspace_slug,
             allow_override=False,
+            stat_cache=stat_cache,
         )
-        return ResolvedOperatorWiring(
-            source=OperatorWiringSource.WORKSPACE_DEFAULT,
-            resolved_path=str(workspace_default.resolve()),
-            sha256=sha,
-            snapshot_path=str(snap_path),
-            snapshot_dir=str(snapshot_dir),
-            metadata_path=str(metadata_json),
-            history_path=str(history_jsonl),
-            is_persisted=True,
-            warnings=warnings,
+        return _persisted_wiring(
+            OperatorWiringSource.WORKSPACE_DEFAULT, resolved_workspace_default, sha, layout, warnings
         )
 
     # 4) Env var.
-    env_path_raw = os.environ.get(_ENV_OPERATORS_CONFIG)
     if env_path_raw:
         env_path = Path(env_path_raw)
-        _ensure_explicit_path_exists(env_path, what=f"Env var {_ENV_OPERATORS_CONFIG}")
-        snapshot_bytes = env_path.read_bytes()
-        sha, snap_path, _did_write = _persist_snapshot_bytes(
+        _ensure_explicit_path_exists(env_path, what=f"Env var {_ENV_OPERATORS_CONFIG}", stat_cache=stat_cache)
+        snapshot_bytes, resolved_env_path = _read_source(env_path, stat_cache)
+        sha, _snap_path, _did_write = _persist_snapshot_bytes(
             run_root=run_root,
             snapshot_dir=snapshot_dir,
             snapshot_yaml_path=snapshot_yaml,
             metadata_path=metadata_json,
             history_path=history_jsonl,
             source=OperatorWiringSource.ENV_VAR,
-            resolved_path=str(env_path.resolve()),
+            resolved_path=resolved_env_path,
             snapshot_bytes=snapshot_bytes,
             cli_operators_config_path=None,
             force_override=False,
@@ -223,18 +385,9 @@ def resolve_operator_wiring(
             profiles_config_path=profiles_config_path,
             workspace_slug=workspace_slug,
             allow_override=False,
+            stat_cache=stat_cache,
         )
-        return ResolvedOperatorWiring(
-            source=OperatorWiringSource.ENV_VAR,
-            resolved_path=str(env_path.resolve()),
-            sha256=sha,
-            snapshot_path=str(snap_path),
-            snapshot_dir=str(snapshot_dir),
-            metadata_path=str(metadata_json),
-            history_path=str(history_jsonl),
-            is_persisted=True,
-            warnings=warnings,
-        )
+        return _persisted_wiring(OperatorWiringSource.ENV_VAR, resolved_env_path, sha, layout, warnings)
 
     # 5) Legacy fallback -> generate snapshot.
     if legacy_hpc_config_path or legacy_profile:
@@ -242,12 +395,17 @@ def resolve_operator_wiring(
             raise ValueError("Cannot combine legacy --hpc-config and --profile; choose one.")
 
         if legacy_hpc_config_path:
-            _ensure_explicit_path_exists(Path(legacy_hpc_config_path), what="Legacy --hpc-config")
+            _ensure_explicit_path_exists(
+                Path(legacy_hpc_config_path), what="Legacy --hpc-config", stat_cache=stat_cache
+            )
+        # Imported lazily: only runs without any operators.yaml source take this branch.
+        from ._wiring_legacy import _generate_legacy_operators_yaml_bytes
+
         source, resolved, snapshot_bytes = _generate_legacy_operators_yaml_bytes(
             legacy_hpc_config_path=legacy_hpc_config_path,
             legacy_profile=legacy_profile,
         )
-        sha, snap_path, _did_write = _persist_snapshot_bytes(
+        sha, _snap_path, _did_write = _persist_snapshot_bytes(
             run_root=run_root,
             snapshot_dir=snapshot_dir,
             snapshot_yaml_path=snapshot_yaml,
@@ -263,28 +421,45 @@ def resolve_operator_wiring(
             profiles_config_path=profiles_config_path,
             workspace_slug=workspace_slug,
             allow_override=False,
+            stat_cache=stat_cache,
         )
-        return ResolvedOperatorWiring(
-            source=source,
-            resolved_path=resolved,
-            sha256=sha,
-            snapshot_path=str(snap_path),
-            snapshot_dir=str(snapshot_dir),
-            metadata_path=str(metadata_json),
-            history_path=str(history_jsonl),
-            is_persisted=True,
-            warnings=warnings,
-        )
+        return _persisted_wiring(source, resolved, sha, layout, warnings)
+
+    # Nothing resolved (no warnings are ever recorded on this path).
+    return _unresolved_wiring(layout)
 
-    # Nothing resolved.
+
+def _persisted_wiring(
+    source: OperatorWiringSource,
+    resolved_path: Optional[str],
+    sha256: Optional[str],
+    layout: _SnapshotLayout,
+    warnings: list[str],
+) -> ResolvedOperatorWiring:
+    """Result for any branch that ends with a run-local snapshot at the standard location."""
+    return ResolvedOperatorWiring(
+        source=source,
+        resolved_path=resolved_path,
+        sha256=sha256,
+        snapshot_path=layout.snapshot_yaml_str,
+        snapshot_dir=layout.snapshot_dir_str,
+        metadata_path=layout.metadata_json_str,
+        history_path=layout.history_jsonl_str,
+        is_persisted=True,
+        warnings=warnings,
+    )
+
+
+@lru_cache(maxsize=64)
+def _unresolved_wiring(layout: _SnapshotLayout) -> ResolvedOperatorWiring:
+    """The NONE result for a run; only the snapshot paths vary, so one instance per layout is shared."""
     return ResolvedOperatorWiring(
         source=OperatorWiringSource.NONE,
         resolved_path=None,
         sha256=None,
         snapshot_path=None,
-        snapshot_dir=str(snapshot_dir),
-        metadata_path=str(metadata_json),
-        history_path=str(history_jsonl),
+        snapshot_dir=layout.snapshot_dir_str,
+        metadata_path=layout.metadata_json_str,
+        history_path=layout.history_jsonl_str,
         is_persisted=False,
-        warnings=warnings,
     )
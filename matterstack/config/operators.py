@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import os
+import stat
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Literal, Mapping, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Literal, Mapping, NoReturn, Optional, TypeGuard, Union
 
-import yaml
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
-from matterstack.core.operator_keys import normalize_operator_key, split_operator_key
+from matterstack.config._yaml_loading import load_yaml_file
+from matterstack.core.operator_keys import normalize_operator_key, parse_canonical_operator_key
 
 
 class OperatorsConfigError(ValueError):
@@ -19,8 +23,17 @@ class OperatorsConfigError(ValueError):
     """
 
 
+# Models below use defer_build: validators are compiled on first validation, so modules that
+# only import these types (step execution, registry typing) never pay for building them. The
+# backend and SSH models are validated as part of OperatorInstanceConfig, whose core schema
+# inlines theirs, so in normal use they never build a SchemaValidator of their own.
+#
+# Backend and SSH models are frozen: identical backend blocks are shared between operators
+# (`_DEFAULT_LOCAL_BACKEND`, and interning in `parse_operators_config_dict`).
+
+
 class SSHConfigModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     host: str
     user: str
@@ -37,19 +50,23 @@ class LocalBackendConfig(BaseModel):
       - Keeping it optional supports portable configs that don't bake run paths.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     type: Literal["local"]
     workspace_root: Optional[str] = None
     dry_run: bool = False
 
 
+# Backend assigned to compute operators that omit `backend`; trusted, so built without validation.
+_DEFAULT_LOCAL_BACKEND = LocalBackendConfig.model_construct(type="local")
+
+
 class SlurmBackendConfig(BaseModel):
     """
     Inline config for SlurmBackend over SSH.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     type: Literal["slurm"]
     workspace_root: str
@@ -63,7 +80,7 @@ class ProfileBackendConfig(BaseModel):
     [`matterstack/config/profiles.py`](matterstack/config/profiles.py:1).
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     type: Literal["profile"]
     name: str
@@ -77,12 +94,15 @@ class HpcYamlBackendConfig(BaseModel):
     This exists for backward compatibility and migration.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     type: Literal["hpc_yaml"]
     path: str
 
 
+# Operator kinds that run on a compute backend (and default to `_DEFAULT_LOCAL_BACKEND`).
+_COMPUTE_KINDS = frozenset({"hpc", "local"})
+
 ComputeBackendConfig = Union[
     LocalBackendConfig,
     SlurmBackendConfig,
@@ -113,7 +133,7 @@ class OperatorInstanceConfig(BaseModel):
     - experiment.*-> Experiment operator
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     kind: Literal["hpc", "local", "human", "experiment"]
 
@@ -134,27 +154,21 @@ class OperatorInstanceConfig(BaseModel):
     # - Explicit null in YAML: unlimited (no limit applied)
     max_concurrent: Optional[int] = None
 
+    # One after-validator for all cross-field rules: each model validator is a separate Python
+    # call per instance, and most entries (compute kind, no backend, no limit) take the first branch.
     @model_validator(mode="after")
-    def _validate_kind_semantics(self) -> "OperatorInstanceConfig":
-        if self.kind in ("hpc", "local"):
+    def _validate_semantics(self) -> "OperatorInstanceConfig":
+        if self.kind in _COMPUTE_KINDS:
             if self.backend is None:
                 # Default compute backend: local (resolved later to run-root by factory if workspace_root is None).
-                return self.model_copy(update={"backend": LocalBackendConfig(type="local")})
-
-            # Enforce that a legacy hpc_yaml backend only makes sense for hpc.*
-            if isinstance(self.backend, HpcYamlBackendConfig) and self.kind != "hpc":
+                self.backend = _DEFAULT_LOCAL_BACKEND
+            elif self.kind != "hpc" and self.backend.type == "hpc_yaml":
+                # Enforce that a legacy hpc_yaml backend only makes sense for hpc.*
                 raise ValueError("backend.type='hpc_yaml' is only valid for kind='hpc'")
-
-            return self
-
-        # Non-compute kinds must not specify compute backend settings.
-        if self.backend is not None:
+        elif self.backend is not None:
+            # Non-compute kinds must not specify compute backend settings.
             raise ValueError(f"kind={self.kind!r} must not define 'backend'")
 
-        return self
-
-    @model_validator(mode="after")
-    def _validate_max_concurrent(self) -> "OperatorInstanceConfig":
         if self.max_concurrent is not None and self.max_concurrent < 1:
             raise ValueError("max_concurrent must be a positive integer or null/omitted")
         return self
@@ -169,7 +183,7 @@ class DefaultsConfig(BaseModel):
         max_concurrent_global: 50
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Global concurrency limit for operators that don't specify max_concurrent.
     # None = use hardcoded default (50).
@@ -187,22 +201,71 @@ class OperatorsConfig:
     """
     Parsed operators.yaml content.
 
-    operators: mapping of canonical operator_key -> validated instance config
+    operators: read-only mapping of canonical operator_key -> validated instance config
     defaults: workspace-level defaults (optional section)
     path: path to the file that produced this config (for error messages)
+
+    Instances are shared through the `load_operators_config` cache, so the mapping is a
+    read-only view and the config hashes by path, letting call sites memoize on it.
     """
 
-    operators: Dict[str, OperatorInstanceConfig]
+    operators: Mapping[str, OperatorInstanceConfig]
     defaults: DefaultsConfig
     path: Path
 
+    def __hash__(self) -> int:
+        # Consistent with the generated __eq__: equal configs always have equal paths.
+        return hash(self.path)
+
+
+# Leaf types produced by YAML that are already hashable; checked first since most values are leaves.
+_HASHABLE_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Hashable equivalent of a loaded YAML value (nested mappings/lists), for use as an intern key.
+    """
+    t = type(value)
+    if t in _HASHABLE_LEAF_TYPES:
+        return value
+    # Leaves are tested inline to skip a recursive call for each of them.
+    leaf = _HASHABLE_LEAF_TYPES
+    if t is dict or isinstance(value, Mapping):
+        return frozenset([(k, v if type(v) in leaf else _freeze(v)) for k, v in value.items()])
+    if t is list or isinstance(value, tuple):
+        return tuple([v if type(v) in leaf else _freeze(v) for v in value])
+    if isinstance(value, (set, frozenset)):
+        return frozenset([v if type(v) in leaf else _freeze(v) for v in value])
+    return value
+
+
+def _is_mapping(value: Any) -> TypeGuard[Mapping[str, Any]]:
+    # YAML always yields plain dicts; the exact-type check skips the Mapping ABC lookup for them.
+    return type(value) is dict or isinstance(value, Mapping)
+
 
 def _ensure_mapping(value: Any, *, what: str, path: Path) -> Mapping[str, Any]:
-    if not isinstance(value, Mapping):
+    if not _is_mapping(value):
         raise OperatorsConfigError(f"{path}: {what} must be a YAML mapping/object")
     return value
 
 
+def _raise_noncanonical_operator_key(raw_key: str, *, path: Path) -> NoReturn:
+    """
+    Raise the most specific OperatorsConfigError for a key that is not exactly canonical.
+    """
+    if raw_key != raw_key.strip():
+        raise OperatorsConfigError(f"{path}: operator key has leading/trailing whitespace: {raw_key!r}")
+    if raw_key.lower() != raw_key:
+        raise OperatorsConfigError(f"{path}: operator key must be lowercase canonical form: {raw_key!r}")
+    try:
+        normalize_operator_key(raw_key)
+    except Exception as exc:
+        raise OperatorsConfigError(f"{path}: invalid operator key {raw_key!r}: {exc}") from exc
+    raise OperatorsConfigError(f"{path}: operator key must be canonical: {raw_key!r}")
+
+
 def parse_operators_config_dict(data: Any, *, path: Union[str, Path]) -> OperatorsConfig:
     """
     Parse a loaded YAML object into an OperatorsConfig.
@@ -230,7 +293,7 @@ def parse_operators_config_dict(data: Any, *, path: Union[str, Path]) -> Operato
     if defaults_raw is None:
         defaults = DefaultsConfig()
     else:
-        if not isinstance(defaults_raw, Mapping):
+        if not _is_mapping(defaults_raw):
             raise OperatorsConfigError(f"{p}: 'defaults' must be a YAML mapping/object")
         try:
             defaults = DefaultsConfig.model_validate(defaults_raw)
@@ -244,50 +307,47 @@ def parse_operators_config_dict(data: Any, *, path: Union[str, Path]) -> Operato
     operators_map = _ensure_mapping(operators_raw, what="'operators'", path=p)
 
     parsed: Dict[str, OperatorInstanceConfig] = {}
+    # Validated backends by content, so operators with identical backend blocks (same SSH host,
+    # same Slurm settings) share one frozen config object.
+    backends: Dict[Any, ComputeBackendConfig] = {}
 
-    for raw_key, raw_cfg in operators_map.items():
-        if not isinstance(raw_key, str):
-            raise OperatorsConfigError(f"{p}: operator key must be a string, got {type(raw_key)}")
-
-        # Enforce canonical keys in config (strict; no implicit normalization).
-        if raw_key != raw_key.strip():
-            raise OperatorsConfigError(f"{p}: operator key has leading/trailing whitespace: {raw_key!r}")
-        if raw_key.lower() != raw_key:
-            raise OperatorsConfigError(f"{p}: operator key must be lowercase canonical form: {raw_key!r}")
+    for key, raw_cfg in operators_map.items():
+        if not isinstance(key, str):
+            raise OperatorsConfigError(f"{p}: operator key must be a string, got {type(key)}")
 
-        try:
-            normalized_key = normalize_operator_key(raw_key)
-        except Exception as exc:
-            raise OperatorsConfigError(f"{p}: invalid operator key {raw_key!r}: {exc}") from exc
+        # Enforce canonical keys in config (strict; no implicit normalization). Canonical keys
+        # pass in one regex scan; anything else is re-checked step by step for a precise error.
+        # Keys are used verbatim, so mapping-key uniqueness already rules out duplicates.
+        parts = parse_canonical_operator_key(key)
+        if parts is None:
+            _raise_noncanonical_operator_key(key, path=p)
+        key_kind = parts[0]
 
-        if normalized_key != raw_key:
-            # normalize_operator_key lowercases; we already enforce lowercase. This is for safety.
-            raise OperatorsConfigError(f"{p}: operator key must be canonical: {raw_key!r}")
-
-        try:
-            key_kind, _key_name = split_operator_key(normalized_key)
-        except Exception as exc:
-            raise OperatorsConfigError(f"{p}: invalid operator key {raw_key!r}: {exc}") from exc
-
-        if normalized_key in parsed:
-            raise OperatorsConfigError(f"{p}: duplicate operator key {normalized_key!r}")
-
-        if not isinstance(raw_cfg, Mapping):
-            raise OperatorsConfigError(f"{p}: operators.{normalized_key} must be a mapping/object")
+        if not _is_mapping(raw_cfg):
+            raise OperatorsConfigError(f"{p}: operators.{key} must be a mapping/object")
 
         try:
             inst = OperatorInstanceConfig.model_validate(raw_cfg)
         except ValidationError as exc:
-            raise OperatorsConfigError(f"{p}: invalid config for operators.{normalized_key}: {exc}") from exc
+            raise OperatorsConfigError(f"{p}: invalid config for operators.{key}: {exc}") from exc
 
         if inst.kind != key_kind:
             raise OperatorsConfigError(
-                f"{p}: operators.{normalized_key}: key kind {key_kind!r} does not match config kind {inst.kind!r}"
+                f"{p}: operators.{key}: key kind {key_kind!r} does not match config kind {inst.kind!r}"
             )
 
-        parsed[normalized_key] = inst
+        if inst.backend is not None and inst.backend is not _DEFAULT_LOCAL_BACKEND:
+            # Key on the raw block: validation is deterministic, and this avoids re-walking the
+            # validated tree with model_dump().
+            try:
+                backend_key = _freeze(raw_cfg["backend"])
+                inst.backend = backends.setdefault(backend_key, inst.backend)
+            except TypeError:
+                pass  # unhashable leaf value (non-YAML input); keep the entry's own object
+
+        parsed[key] = inst
 
-    return OperatorsConfig(operators=parsed, defaults=defaults, path=p)
+    return OperatorsConfig(operators=MappingProxyType(parsed), defaults=defaults, path=p)
 
 
 def load_operators_config(path: Union[str, Path]) -> OperatorsConfig:
@@ -305,15 +365,36 @@ def load_operators_config(path: Union[str, Path]) -> OperatorsConfig:
             ssh: {host: ..., user: ..., key_path: ...}
             slurm: {...}
 
+    Parsed configs are memoized per process by (path, device, inode, mtime_ns, size), so repeated
+    loads of an unchanged file (e.g. once per scheduler tick) skip both the YAML parse and
+    validation. Cached configs are shared; treat them as read-only.
+
     Raises:
         OperatorsConfigError
     """
     p = Path(path)
-    if not p.is_file():
+    try:
+        st = os.stat(p)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise OperatorsConfigError(f"{p}: file not found")
 
+    return _load_operators_config_cached(str(p), st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _load_operators_config_cached(path_str: str, dev: int, ino: int, mtime_ns: int, size: int) -> OperatorsConfig:
+    """
+    Parse and validate operators.yaml at `path_str`.
+
+    `dev`, `ino`, `mtime_ns` and `size` only participate in the cache key: the (dev, inode) pair
+    names the file a relative path or symlink resolves to without a realpath walk, and an
+    atomic replace changes the inode even when mtime and size match.
+    """
+    p = Path(path_str)
     try:
-        data = yaml.safe_load(p.read_text()) or {}
+        data = load_yaml_file(p)
     except Exception as exc:
         raise OperatorsConfigError(f"{p}: failed to parse YAML: {exc}") from exc
 
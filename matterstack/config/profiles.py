@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import os
+import stat
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from matterstack.config._yaml_loading import load_yaml_file
 from matterstack.core.backend import ComputeBackend
 
-# Moved imports to create_backend to avoid circular dependencies
-from matterstack.runtime.backends.hpc.ssh import SSHConfig
+# Backend imports are deferred (create_backend / _build_slurm_profile) to avoid circular
+# dependencies and to keep the SSH stack out of config-only imports.
+if TYPE_CHECKING:
+    from matterstack.runtime.backends.hpc.ssh import SSHConfig
 
 
 @dataclass
@@ -85,13 +89,17 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
     """
     Load a YAML file as a top-level mapping.
 
-    Missing files are treated as empty configuration.
+    Missing files are treated as empty configuration. Only called when `_load_profiles_cached`
+    misses, so every call parses the file afresh and the result is owned by the caller.
     """
 
-    if not path.is_file():
+    try:
+        st = os.stat(path)
+    except OSError:
         return {}
-    text = path.read_text()
-    data = yaml.safe_load(text) or {}
+    if not stat.S_ISREG(st.st_mode):
+        return {}
+    data = load_yaml_file(path)
     if not isinstance(data, dict):
         raise ValueError(f"Config file {path} must contain a mapping at top-level.")
     return data
@@ -114,6 +122,15 @@ def _profiles_from_dict(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     return result
 
 
+# Successful upward searches, keyed by starting directory. Each entry records the mtime of every
+# directory the search visited; creating, removing or renaming a config file changes its
+# directory's mtime, so a repeat lookup re-stats those directories and the matched file instead of
+# probing two filenames in each. "Not found" is never cached: with coarse mtime granularity a
+# config created in the same tick as the search would otherwise stay invisible.
+_PROJECT_CONFIG_CACHE: "OrderedDict[str, Tuple[Path, Tuple[Tuple[str, int], ...]]]" = OrderedDict()
+_PROJECT_CONFIG_CACHE_MAXSIZE = 8
+
+
 def _find_project_config_file() -> Optional[Path]:
     """
     Search upwards from the current working directory for a matterstack.yaml/yml file.
@@ -121,17 +138,52 @@ def _find_project_config_file() -> Optional[Path]:
     The first match encountered while walking towards the filesystem root is used.
     """
 
-    current = Path.cwd()
+    start = os.getcwd()
+    cached = _PROJECT_CONFIG_CACHE.get(start)
+    if cached is not None:
+        cached_result, visited = cached
+        try:
+            unchanged = all(os.stat(d).st_mtime_ns == mtime_ns for d, mtime_ns in visited)
+            if unchanged and stat.S_ISREG(os.stat(cached_result).st_mode):
+                return cached_result
+        except OSError:
+            pass
+
+    result, visited_or_none = _search_project_config_file(start)
+    if result is None or visited_or_none is None:
+        _PROJECT_CONFIG_CACHE.pop(start, None)
+    else:
+        _PROJECT_CONFIG_CACHE[start] = (result, visited_or_none)
+        _PROJECT_CONFIG_CACHE.move_to_end(start)
+        if len(_PROJECT_CONFIG_CACHE) > _PROJECT_CONFIG_CACHE_MAXSIZE:
+            _PROJECT_CONFIG_CACHE.popitem(last=False)
+    return result
+
+
+def _search_project_config_file(start: str) -> Tuple[Optional[Path], Optional[Tuple[Tuple[str, int], ...]]]:
+    """
+    Walk upwards from `start`; return the match and the (directory, mtime_ns) of each directory
+    visited, or None for the latter if a directory could not be stat'ed (result not cacheable).
+    """
+    visited: List[Tuple[str, int]] = []
+    cacheable = True
+    current = start
 
     while True:
+        # Stat before probing so a file created mid-search shows up as an mtime change.
+        try:
+            visited.append((current, os.stat(current).st_mtime_ns))
+        except OSError:
+            cacheable = False
         for filename in ("matterstack.yaml", "matterstack.yml"):
-            candidate = current / filename
-            if candidate.is_file():
-                return candidate
-        if current.parent == current:
+            candidate = os.path.join(current, filename)
+            if os.path.isfile(candidate):
+                return Path(candidate), tuple(visited) if cacheable else None
+        parent = os.path.dirname(current)
+        if parent == current:
             break
-        current = current.parent
-    return None
+        current = parent
+    return None, tuple(visited) if cacheable else None
 
 
 def _build_local_profile(name: str, data: Dict[str, Any]) -> ExecutionProfile:
@@ -162,6 +214,8 @@ def _build_slurm_profile(name: str, data: Dict[str, Any]) -> ExecutionProfile:
     if not isinstance(ssh_data, dict):
         raise ValueError(f"Slurm profile {name!r} 'ssh' section must be a mapping.")
 
+    from matterstack.runtime.backends.hpc.ssh import SSHConfig
+
     try:
         ssh_cfg = SSHConfig(
             host=ssh_data["host"],
@@ -203,31 +257,61 @@ def load_profiles(config_path: Optional[str] = None) -> Dict[str, ExecutionProfi
       ``matterstack.yaml`` or ``matterstack.yml``.
     * Project profiles override user profiles of the same name on a
     per-field basis (shallow merge).
+
+    Results are memoized per process by the config file paths and their stat (device, inode,
+    mtime_ns, size), so `load_profile` / `get_default_profile` calls in one process share a
+    single build. The returned dict is fresh per call, but the ExecutionProfile objects are
+    shared; treat them as read-only.
     """
 
     if config_path is not None:
         cfg_path = Path(os.path.expanduser(config_path))
-        cfg_data = _load_yaml(cfg_path)
-        profile_dicts = _profiles_from_dict(cfg_data)
+        key: Tuple[Any, ...] = (str(cfg_path), _stat_key(cfg_path))
     else:
         user_cfg_path = Path.home() / ".matterstack" / "config.yaml"
-        user_cfg = _load_yaml(user_cfg_path)
+        project_path = _find_project_config_file()
+        key = (
+            None,
+            str(user_cfg_path),
+            _stat_key(user_cfg_path),
+            str(project_path) if project_path is not None else None,
+            _stat_key(project_path) if project_path is not None else None,
+        )
+    return dict(_load_profiles_cached(key))
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_profiles_cached(key: Tuple[Any, ...]) -> Dict[str, ExecutionProfile]:
+    """
+    Build the profile set described by `key` (see `load_profiles`); stat values only key the cache.
+    """
+    if key[0] is not None:
+        cfg_data = _load_yaml(Path(key[0]))
+        profile_dicts = _profiles_from_dict(cfg_data)
+    else:
+        _, user_cfg_path, _, project_path, _ = key
+        user_cfg = _load_yaml(Path(user_cfg_path))
         user_profiles = _profiles_from_dict(user_cfg)
 
         project_cfg: Dict[str, Any] = {}
-        project_path = _find_project_config_file()
         if project_path is not None:
-            project_cfg = _load_yaml(project_path)
+            project_cfg = _load_yaml(Path(project_path))
         project_profiles = _profiles_from_dict(project_cfg)
 
-        # Merge by profile name, with project values overlaying user values.
-        merged: Dict[str, Dict[str, Any]] = {}
-        for name, pdata in user_profiles.items():
-            merged[name] = dict(pdata)
+        # Merge by profile name, with project values overlaying user values. Both parses are
+        # fresh, so profile mappings are reused as-is and only overlapping names build a new dict.
+        merged: Dict[str, Dict[str, Any]] = dict(user_profiles)
         for name, pdata in project_profiles.items():
-            base = merged.get(name, {}).copy()
-            base.update(pdata)
-            merged[name] = base
+            base = merged.get(name)
+            merged[name] = {**base, **pdata} if base is not None else pdata
 
         profile_dicts = merged
 
@@ -254,7 +338,13 @@ def load_profile(name: str, config_path: Optional[str] = None) -> ExecutionProfi
     Load a single named ExecutionProfile.
     """
 
-    profiles = load_profiles(config_path=config_path)
+    return _select_profile(load_profiles(config_path=config_path), name)
+
+
+def _select_profile(profiles: Dict[str, ExecutionProfile], name: str) -> ExecutionProfile:
+    """
+    Look up `name` in an already-loaded profile set, failing like `load_profile`.
+    """
     try:
         return profiles[name]
     except KeyError as exc:
@@ -1,10 +1,17 @@
-from matterstack.core.campaign import Campaign
-from matterstack.core.domain import Candidate, DesignSpace
-from matterstack.core.evidence import EvidenceBundle
-from matterstack.core.external import ExternalTask
-from matterstack.core.gate import GateTask
-from matterstack.core.run import RunHandle, RunMetadata
-from matterstack.core.workflow import Task, Workflow
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from matterstack._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from matterstack.core.campaign import Campaign
+    from matterstack.core.domain import Candidate, DesignSpace
+    from matterstack.core.evidence import EvidenceBundle
+    from matterstack.core.external import ExternalTask
+    from matterstack.core.gate import GateTask
+    from matterstack.core.run import RunHandle, RunMetadata
+    from matterstack.core.workflow import Task, Workflow
 
 __all__ = [
     "Candidate",
@@ -18,3 +25,21 @@ __all__ = [
     "GateTask",
     "ExternalTask",
 ]
+
+# Public names, imported on first attribute access (PEP 562) so that importing one core module
+# (e.g. matterstack.core.operator_keys) does not load the whole domain model.
+_LAZY_EXPORTS = {
+    "Candidate": ".domain",
+    "DesignSpace": ".domain",
+    "Campaign": ".campaign",
+    "Task": ".workflow",
+    "Workflow": ".workflow",
+    "RunHandle": ".run",
+    "RunMetadata": ".run",
+    "EvidenceBundle": ".evidence",
+    "GateTask": ".gate",
+    "ExternalTask": ".external",
+}
+
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
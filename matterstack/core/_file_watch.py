@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+# inotify(7) event bits: the file was closed after writing, or renamed into the directory.
+# IN_CREATE is deliberately not watched: it fires before the writer has filled the file.
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+
+
+class _DirectoryWatcher:
+    """
+    Minimal inotify wrapper (via ctypes, Linux only) signalling writes in a set of directories.
+
+    Only used as a wake-up hint: callers still decide by checking the paths themselves.
+    """
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+
+    @classmethod
+    def open(cls, directories: Sequence[Path]) -> Optional["_DirectoryWatcher"]:
+        """Return a watcher on `directories`, or None if inotify is unavailable."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+
+        watcher = cls(fd)
+        for directory in directories:
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), _IN_CLOSE_WRITE | _IN_MOVED_TO)
+            if wd < 0:
+                watcher.close()
+                return None
+        return watcher
+
+    def wait(self, timeout: float) -> None:
+        """Block until an event arrives or `timeout` seconds pass, then drain pending events."""
+        readable, _, _ = select.select([self.fd], [], [], max(0.0, timeout))
+        if not readable:
+            return
+        try:
+            while os.read(self.fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _directory_mtimes(directories: Sequence[Path]) -> Tuple[int, ...]:
+    mtimes = []
+    for directory in directories:
+        try:
+            mtimes.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            mtimes.append(-1)
+    return tuple(mtimes)
+
+
+def wait_for_any_file(
+    paths: Sequence[Path],
+    *,
+    timeout: float,
+    poll_interval: float,
+    min_poll_interval: Optional[float] = None,
+) -> Optional[Path]:
+    """
+    Wait until one of `paths` exists and return it (earlier paths win ties), or None on timeout.
+
+    On Linux the parent directories are watched with inotify, so a file written and closed (or
+    renamed into place) is noticed immediately. Existence is still re-checked periodically, which
+    covers platforms without inotify and writers on other hosts of a network filesystem, where no
+    event is delivered.
+
+    The re-check delay starts at `min_poll_interval` and doubles up to `poll_interval`, so fast
+    responders are seen quickly while long waits settle to the slow rate. It drops back to the
+    minimum whenever a parent directory's mtime changes, since activity there usually precedes
+    the file we want. Without a positive `min_poll_interval` the delay is a flat `poll_interval`.
+    """
+    deadline = time.monotonic() + timeout
+    directories: List[Path] = list(dict.fromkeys(p.absolute().parent for p in paths))
+    delay = poll_interval if not min_poll_interval or min_poll_interval <= 0 else min(min_poll_interval, poll_interval)
+    floor = delay
+    last_mtimes = _directory_mtimes(directories)
+    watcher = _DirectoryWatcher.open(directories)
+    try:
+        while True:
+            # Checked after the watch is armed, so a file landing in between is not missed.
+            for path in paths:
+                if path.exists():
+                    return path
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            if watcher is not None:
+                watcher.wait(min(remaining, delay))
+            else:
+                time.sleep(min(remaining, delay))
+
+            mtimes = _directory_mtimes(directories)
+            if mtimes != last_mtimes:
+                last_mtimes = mtimes
+                delay = floor
+            else:
+                delay = min(delay * 2, poll_interval)
+    finally:
+        if watcher is not None:
+            watcher.close()
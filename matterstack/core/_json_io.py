@@ -0,0 +1,39 @@
+"""
+JSON file helpers for the in-job coordination wrappers (external tasks, gates).
+
+Uses orjson when installed, which encodes/decodes straight between bytes and Python objects;
+the stdlib fallback produces equivalent documents.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup for JSON encoding/decoding
+    orjson = None  # type: ignore[assignment]
+
+
+def write_json_file(path: Path, data: Any) -> None:
+    """Write `data` to `path` as 2-space indented JSON."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def read_json_file(path: Path) -> Any:
+    """
+    Read and decode a JSON document from `path`.
+
+    Raises:
+        ValueError if the content is not valid JSON (orjson and json both raise subclasses).
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,6 +1,6 @@
 import itertools
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 
 @dataclass
@@ -32,21 +32,20 @@ class DesignSpace:
         """
         Returns the cartesian product of all dimensions as a list of Candidates.
         """
-        if not self.dimensions:
-            return []
-
-        keys = list(self.dimensions.keys())
-        values_list = list(self.dimensions.values())
-
-        candidates = []
-        # Calculate Cartesian product
-        for i, combination in enumerate(itertools.product(*values_list)):
-            # Create params dictionary for this combination
-            params = dict(zip(keys, combination))
+        return list(self.iter_candidates())
 
-            # Generate a simple ID (can be customized)
-            cand_id = f"cand_{i:04d}"
+    def iter_candidates(self) -> Iterator[Candidate]:
+        """
+        Lazily yield the cartesian product of all dimensions as Candidates.
 
-            candidates.append(Candidate(id=cand_id, params=params))
+        Same order and IDs as `enumerate_candidates()`, without holding the whole product in
+        memory at once.
+        """
+        if not self.dimensions:
+            return
 
-        return candidates
+        keys = tuple(self.dimensions)
+        # Calculate Cartesian product
+        for i, combination in enumerate(itertools.product(*self.dimensions.values())):
+            # Generate a simple ID (can be customized); "%04d" matches f"{i:04d}" but formats faster.
+            yield Candidate(id="cand_%04d" % i, params=dict(zip(keys, combination)))
@@ -3,12 +3,13 @@ from __future__ import annotations
 import json
 import logging
 import sys
-import time
 from pathlib import Path
 from typing import Any, Dict
 
 from pydantic import Field
 
+from ._file_watch import wait_for_any_file
+from ._json_io import read_json_file, write_json_file
 from .workflow import Task
 
 logger = logging.getLogger(__name__)
@@ -20,7 +21,7 @@ class ExternalTask(Task):
 
     Instead of running a direct command, this task runs a python wrapper that:
     1. Writes a request file (JSON) to `request_path`.
-    2. Polls for a response file (JSON) at `response_path`.
+    2. Waits for a response file (JSON) at `response_path`.
     3. Exits with success/failure based on the response content.
 
     The external agent (robot, human, service) is responsible for watching
@@ -31,6 +32,8 @@ class ExternalTask(Task):
     response_path: str = "response.json"
     request_data: Dict[str, Any] = Field(default_factory=dict)
     poll_interval: float = 5.0
+    # First re-check delay; doubles up to poll_interval while the directory stays quiet.
+    poll_min_interval: float = 0.05
 
     def model_post_init(self, __context: Any) -> None:
         # We override the command to run our internal poller wrapper
@@ -43,6 +46,7 @@ class ExternalTask(Task):
             "response_path": self.response_path,
             "request_data": self.request_data,
             "poll_interval": self.poll_interval,
+            "poll_min_interval": self.poll_min_interval,
             "timeout_minutes": self.time_limit_minutes if self.time_limit_minutes is not None else 60,
         }
 
@@ -71,6 +75,7 @@ class ExternalTaskWrapper:
         self.response_path = Path(config["response_path"])
         self.request_data = config.get("request_data", {})
         self.poll_interval = config.get("poll_interval", 5.0)
+        self.poll_min_interval = config.get("poll_min_interval")
         # Ensure we have a valid timeout even if config has None explicitly
         timeout = config.get("timeout_minutes")
         self.timeout_minutes = timeout if timeout is not None else 60
@@ -83,36 +88,32 @@ class ExternalTaskWrapper:
 
         # 1. Write Request
         logger.info("Writing request file...")
-        with open(self.request_path, "w") as f:
-            json.dump(self.request_data, f, indent=2)
-
-        # 2. Poll for Response
-        start_time = time.time()
-        timeout_seconds = self.timeout_minutes * 60
+        write_json_file(self.request_path, self.request_data)
 
+        # 2. Wait for Response
         logger.info("Waiting for response...")
-        while True:
-            if self.response_path.exists():
-                logger.info("Response file found!")
-                try:
-                    self._handle_response()
-                    return  # Success
-                except Exception as e:
-                    logger.error(f"Error handling response: {e}")
-                    sys.exit(1)
-
-            if time.time() - start_time > timeout_seconds:
-                logger.error("Timed out waiting for response file.")
-                sys.exit(1)
-
-            time.sleep(self.poll_interval)
+        found = wait_for_any_file(
+            [self.response_path],
+            timeout=self.timeout_minutes * 60,
+            poll_interval=self.poll_interval,
+            min_poll_interval=self.poll_min_interval,
+        )
+        if found is None:
+            logger.error("Timed out waiting for response file.")
+            sys.exit(1)
+
+        logger.info("Response file found!")
+        try:
+            self._handle_response()
+        except Exception as e:
+            logger.error(f"Error handling response: {e}")
+            sys.exit(1)
 
     def _handle_response(self):
         """Read and validate response."""
-        content = self.response_path.read_text()
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
+            data = read_json_file(self.response_path)
+        except ValueError:
             raise ValueError("Response file contains invalid JSON")
 
         logger.info(f"Response content: {data}")
@@ -3,12 +3,13 @@ from __future__ import annotations
 import json
 import logging
 import sys
-import time
 from pathlib import Path
 from typing import Any, Dict
 
 from pydantic import Field
 
+from ._file_watch import wait_for_any_file
+from ._json_io import write_json_file
 from .workflow import Task
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,8 @@ class GateTask(Task):
     reject_file: str = "rejected.txt"
     info_file: str = "gate_info.json"
     poll_interval: float = 2.0
+    # First re-check delay; doubles up to poll_interval while the directory stays quiet.
+    poll_min_interval: float = 0.05
 
     def model_post_init(self, __context: Any) -> None:
         # Configuration for the wrapper
@@ -38,6 +41,7 @@ class GateTask(Task):
             "reject_file": self.reject_file,
             "info_file": self.info_file,
             "poll_interval": self.poll_interval,
+            "poll_min_interval": self.poll_min_interval,
             "timeout_minutes": self.time_limit_minutes if self.time_limit_minutes is not None else 60,
         }
 
@@ -60,6 +64,7 @@ class GateTaskWrapper:
         self.reject_path = Path(config["reject_file"])
         self.info_path = Path(config["info_file"])
         self.poll_interval = config.get("poll_interval", 2.0)
+        self.poll_min_interval = config.get("poll_min_interval")
         timeout = config.get("timeout_minutes")
         self.timeout_minutes = timeout if timeout is not None else 60
 
@@ -72,29 +77,28 @@ class GateTaskWrapper:
             "message": self.message,
             "instructions": f"Create '{self.approve_path.name}' to approve, or '{self.reject_path.name}' to reject.",
         }
-        with open(self.info_path, "w") as f:
-            json.dump(info_data, f, indent=2)
+        write_json_file(self.info_path, info_data)
 
         logger.info(f"Waiting for approval ({self.approve_path}) or rejection ({self.reject_path})...")
 
-        # 2. Poll
-        start_time = time.time()
-        timeout_seconds = self.timeout_minutes * 60
+        # 2. Wait for a decision
+        found = wait_for_any_file(
+            [self.approve_path, self.reject_path],
+            timeout=self.timeout_minutes * 60,
+            poll_interval=self.poll_interval,
+            min_poll_interval=self.poll_min_interval,
+        )
 
-        while True:
-            if self.approve_path.exists():
-                logger.info("Approval file found. Gate passed.")
-                return  # Success
+        if found == self.approve_path:
+            logger.info("Approval file found. Gate passed.")
+            return  # Success
 
-            if self.reject_path.exists():
-                logger.error("Rejection file found. Gate failed.")
-                sys.exit(1)  # Failure
+        if found == self.reject_path:
+            logger.error("Rejection file found. Gate failed.")
+            sys.exit(1)  # Failure
 
-            if time.time() - start_time > timeout_seconds:
-                logger.error("Timed out waiting for gate decision.")
-                sys.exit(1)
-
-            time.sleep(self.poll_interval)
+        logger.error("Timed out waiting for gate decision.")
+        sys.exit(1)
 
 
 def main():
@@ -30,7 +30,6 @@ from __future__ import annotations
 import re
 import time
 import uuid
-from datetime import datetime, timezone
 from typing import Callable, Optional
 
 
@@ -46,7 +45,7 @@ def generate_chronological_id(prefix: str = "") -> str:
     Returns:
         Unique chronologically sortable ID
     """
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
     random_suffix = uuid.uuid4().hex[:8]
 
     if prefix:
@@ -9,6 +9,8 @@ from typing import Any, Mapping, Optional, Protocol, Tuple
 # - name: starts with [a-z0-9], then [a-z0-9_.-]*
 # This permits names like "default", "dev", "prod", "clusterA.dev".
 _OPERATOR_KEY_RE = re.compile(r"^[a-z][a-z0-9_]*\.[a-z0-9][a-z0-9_.-]*$")
+# Same grammar with (kind, name) groups, for fullmatch against already-canonical input.
+_OPERATOR_KEY_PARTS_RE = re.compile(r"([a-z][a-z0-9_]*)\.([a-z0-9][a-z0-9_.-]*)")
 
 
 LEGACY_OPERATOR_TYPE_TO_KEY = {
@@ -91,6 +93,19 @@ def split_operator_key(operator_key: str) -> Tuple[str, str]:
     return kind, name
 
 
+def parse_canonical_operator_key(value: str) -> Optional[Tuple[str, str]]:
+    """
+    Return (kind, name) if `value` is already exactly canonical, else None.
+
+    Single regex pass for the common case; equivalent to `normalize_operator_key(value) == value`
+    followed by `split_operator_key`. Callers needing a specific error fall back to those.
+    """
+    m = _OPERATOR_KEY_PARTS_RE.fullmatch(value)
+    if m is None or ".." in value:
+        return None
+    return m.group(1), m.group(2)
+
+
 def legacy_operator_type_to_key(operator_type: Optional[str]) -> Optional[str]:
     """
     Convert legacy operator_type (v0.2.5) to canonical operator_key.
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from matterstack.config.profiles import ExecutionProfile, get_default_profile, load_profile
 
@@ -128,7 +128,7 @@ async def run_workflow_async(
     fail_fast: Optional[bool] = None,  # Deprecated
 ) -> WorkflowResult:
     """
-    Execute a Workflow sequentially in topological order.
+    Execute a Workflow in topological order.
 
     The backend can be supplied explicitly, or derived once from an
     ExecutionProfile. The same backend instance is then reused for all tasks
@@ -138,6 +138,11 @@ async def run_workflow_async(
         continue_on_error: If True, workflow execution continues even if a task fails.
                            Dependent tasks will be cancelled, but independent tasks will run.
                            If False (default), execution aborts immediately on first failure.
+        max_concurrent_tasks: With the default of 1, tasks run strictly one after another.
+                           Larger values run the tasks of each dependency level concurrently
+                           (at most this many in flight), so independent tasks overlap their
+                           submit/poll round-trips. On abort, tasks already started in the
+                           failing level still finish and are reported.
     """
 
     # Deprecated: fail_fast parameter is ignored. Use continue_on_error instead.
@@ -150,7 +155,6 @@ async def run_workflow_async(
             stacklevel=2,
         )
 
-    # For now we ignore max_concurrent_tasks and run strictly sequentially.
     task_results: Dict[str, TaskResult] = {}
 
     # Determine backend and associated profile name, if any.
@@ -172,62 +176,95 @@ async def run_workflow_async(
     tasks_to_run = workflow.get_topo_sorted_tasks()
     logger.info(f"Starting workflow execution: {len(tasks_to_run)} tasks scheduled.")
 
-    for task in tasks_to_run:
-        # Check for failed dependencies
-        failed_deps = [
-            dep_id
-            for dep_id in task.dependencies
-            if dep_id in task_results
-            and task_results[dep_id].status.state in (JobState.COMPLETED_ERROR, JobState.CANCELLED)
-        ]
-
-        # Check if we should skip due to failed dependencies
-        should_skip = False
-        if failed_deps:
-            if getattr(task, "allow_dependency_failure", False):
-                logger.info(
-                    f"Dependencies failed for {task.task_id}: {failed_deps}, but allow_dependency_failure=True. Proceeding."
+    if max_concurrent_tasks > 1:
+        batches = _dependency_levels(tasks_to_run)
+    else:
+        batches = [[task] for task in tasks_to_run]
+    slots = asyncio.Semaphore(max(1, max_concurrent_tasks))
+
+    async def _run_in_slot(task: Task) -> TaskResult:
+        async with slots:
+            return await run_task_async(task, backend, poll_interval=poll_interval)
+
+    for batch in batches:
+        runnable: List[Task] = []
+        for task in batch:
+            # Check for failed dependencies
+            failed_deps = [
+                dep_id
+                for dep_id in task.dependencies
+                if dep_id in task_results
+                and task_results[dep_id].status.state in (JobState.COMPLETED_ERROR, JobState.CANCELLED)
+            ]
+
+            # Check if we should skip due to failed dependencies
+            should_skip = False
+            if failed_deps:
+                if getattr(task, "allow_dependency_failure", False):
+                    logger.info(
+                        f"Dependencies failed for {task.task_id}: {failed_deps}, "
+                        "but allow_dependency_failure=True. Proceeding."
+                    )
+                else:
+                    should_skip = True
+
+            if should_skip:
+                logger.info(f"Skipping task {task.task_id} due to failed dependencies: {failed_deps}")
+                cancelled_result = _make_cancelled_result(
+                    task=task,
+                    profile_name=profile_name,
                 )
-            else:
-                should_skip = True
-
-        if should_skip:
-            logger.info(f"Skipping task {task.task_id} due to failed dependencies: {failed_deps}")
-            cancelled_result = _make_cancelled_result(
-                task=task,
-                profile_name=profile_name,
-            )
-            task_results[task.task_id] = cancelled_result
-            continue
-
-        # Normal execution path
-        logger.info(f"Starting task {task.task_id}...")
-        result = await run_task_async(
-            task,
-            backend,
-            poll_interval=poll_interval,
-        )
+                task_results[task.task_id] = cancelled_result
+                continue
 
-        # If this workflow was executed via a profile-derived backend, associate
-        # the profile name with each TaskResult (run_task_async does not know
-        # which profile created a pre-constructed backend).
-        if profile_name is not None and result.profile_name is None:
-            result.profile_name = profile_name
+            # Normal execution path
+            logger.info(f"Starting task {task.task_id}...")
+            runnable.append(task)
 
-        task_results[task.task_id] = result
+        results = await asyncio.gather(*(_run_in_slot(task) for task in runnable))
 
-        if result.status.state == JobState.COMPLETED_ERROR:
-            logger.error(f"Task {task.task_id} failed: {result.status.reason}")
-            if not continue_on_error:
-                logger.error("Aborting workflow due to task failure (continue_on_error=False).")
-                break
-        else:
-            logger.info(f"Task {task.task_id} completed successfully.")
+        abort = False
+        for task, result in zip(runnable, results):
+            # If this workflow was executed via a profile-derived backend, associate
+            # the profile name with each TaskResult (run_task_async does not know
+            # which profile created a pre-constructed backend).
+            if profile_name is not None and result.profile_name is None:
+                result.profile_name = profile_name
+
+            task_results[task.task_id] = result
+
+            if result.status.state == JobState.COMPLETED_ERROR:
+                logger.error(f"Task {task.task_id} failed: {result.status.reason}")
+                if not continue_on_error:
+                    abort = True
+            else:
+                logger.info(f"Task {task.task_id} completed successfully.")
+
+        if abort:
+            logger.error("Aborting workflow due to task failure (continue_on_error=False).")
+            break
 
     logger.info("Workflow execution finished.")
     return WorkflowResult(workflow=workflow, tasks=task_results)
 
 
+def _dependency_levels(tasks: List[Task]) -> List[List[Task]]:
+    """
+    Group topologically sorted tasks into levels whose dependencies all lie in earlier levels.
+
+    Tasks keep their topological order within a level.
+    """
+    level_of: Dict[str, int] = {}
+    levels: List[List[Task]] = []
+    for task in tasks:
+        level = 1 + max((level_of.get(dep_id, -1) for dep_id in task.dependencies), default=-1)
+        level_of[task.task_id] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(task)
+    return levels
+
+
 def _infer_workspace_path(backend: ComputeBackend, job_id: str) -> Path:
     """
     Best-effort inference of a per-job workspace directory for a backend.
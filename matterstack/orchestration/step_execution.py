@@ -221,8 +221,7 @@ def step_run(
         if operators_config:
             # Use per-operator limits from operators.yaml
             global_limit = operators_config.defaults.max_concurrent_global or DEFAULT_MAX_CONCURRENT_GLOBAL
-            for op_key, op_cfg in operators_config.operators.items():
-                operator_limits[op_key] = op_cfg.max_concurrent
+            operator_limits = {op_key: op_cfg.max_concurrent for op_key, op_cfg in operators_config.operators.items()}
             logger.info(f"Using per-operator limits from operators.yaml (global={global_limit})")
         else:
             # Legacy: use global max_hpc_jobs from config.json
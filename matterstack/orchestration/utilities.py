@@ -8,6 +8,7 @@ and discovering active runs.
 from __future__ import annotations
 
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -93,20 +94,20 @@ def list_active_runs(base_path: Path = Path("workspaces")) -> List[RunHandle]:
     if not base_path.exists():
         return active_runs
 
-    # Iterate workspaces
-    for ws_dir in base_path.iterdir():
-        if not ws_dir.is_dir():
-            continue
+    # Iterate workspaces (os.scandir: directory checks use cached d_type, no per-entry stat)
+    with os.scandir(base_path) as ws_entries:
+        ws_dirs = [entry for entry in ws_entries if entry.is_dir()]
 
-        runs_dir = ws_dir / "runs"
-        if not runs_dir.exists():
+    for ws_dir in ws_dirs:
+        try:
+            with os.scandir(os.path.join(ws_dir.path, "runs")) as run_entries:
+                run_dirs = [Path(entry.path) for entry in run_entries if entry.is_dir()]
+        except OSError:
+            # No runs/ directory (or unreadable)
             continue
 
         # Iterate runs
-        for run_dir in runs_dir.iterdir():
-            if not run_dir.is_dir():
-                continue
-
+        for run_dir in run_dirs:
             db_path = run_dir / "state.sqlite"
             if not db_path.exists():
                 continue
@@ -13,7 +13,7 @@ from matterstack.config.operators import (
     ProfileBackendConfig,
     SlurmBackendConfig,
 )
-from matterstack.config.profiles import load_profile
+from matterstack.config.profiles import ExecutionProfile, _select_profile, load_profile, load_profiles
 from matterstack.core.operators import Operator
 from matterstack.core.run import RunHandle
 from matterstack.runtime.backends.hpc.backend import SlurmBackend
@@ -86,6 +86,7 @@ def _build_compute_operator_from_backend(
     profiles_config_path: Optional[str],
     slug_override: Optional[str],
     operator_name_override: Optional[str],
+    profiles: Optional[Dict[str, ExecutionProfile]] = None,
 ) -> ComputeOperator:
     slug_default, operator_name_default = _default_compute_metadata_for_kind(kind)
     slug = slug_override or slug_default
@@ -114,7 +115,10 @@ def _build_compute_operator_from_backend(
         return ComputeOperator(backend=backend, slug=slug, operator_name=operator_name)
 
     if isinstance(backend_cfg, ProfileBackendConfig):
-        prof = load_profile(backend_cfg.name, config_path=profiles_config_path)
+        if profiles is not None:
+            prof = _select_profile(profiles, backend_cfg.name)
+        else:
+            prof = load_profile(backend_cfg.name, config_path=profiles_config_path)
         backend = prof.create_backend()
         return ComputeOperator(backend=backend, slug=slug, operator_name=operator_name)
 
@@ -148,6 +152,12 @@ def build_operator_registry_from_operators_config(
     """
     reg: Dict[str, Operator] = {}
 
+    # Resolve the profile set once for all `backend.type=profile` entries rather than
+    # re-reading and rebuilding every profile per operator.
+    profiles: Optional[Dict[str, ExecutionProfile]] = None
+    if any(isinstance(cfg.backend, ProfileBackendConfig) for cfg in operators_config.operators.values()):
+        profiles = load_profiles(config_path=profiles_config_path)
+
     for operator_key, cfg in operators_config.operators.items():
         if cfg.kind in ("hpc", "local"):
             backend_cfg = cfg.backend
@@ -160,6 +170,7 @@ def build_operator_registry_from_operators_config(
                 profiles_config_path=profiles_config_path,
                 slug_override=cfg.slug,
                 operator_name_override=cfg.operator_name,
+                profiles=profiles,
             )
             continue
 
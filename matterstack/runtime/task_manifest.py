@@ -9,6 +9,10 @@ from matterstack.core.workflow import FileFromContent, FileFromPath, Task
 
 TASK_MANIFEST_SCHEMA_VERSION = 2
 
+# Same output as `json.dumps(payload, indent=2, sort_keys=True)`, without building a new
+# JSONEncoder for every manifest written.
+_MANIFEST_ENCODER = json.JSONEncoder(indent=2, sort_keys=True)
+
 
 def _sha256_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
@@ -84,7 +88,7 @@ def write_task_manifest_json(path: Path, task: Task) -> None:
     Write a lean persistence/debug manifest.json for a Task.
     """
     payload = task_to_persistence_manifest(task)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    path.write_text(_MANIFEST_ENCODER.encode(payload) + "\n", encoding="utf-8")
 
 
 def iter_strings(obj: Any):
@@ -20,7 +20,7 @@ import logging
 from pathlib import Path
 from typing import Generator
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, event, select
 from sqlalchemy.orm import sessionmaker
 
 from matterstack.storage._attempt_operations import _AttemptOperationsMixin
@@ -38,6 +38,25 @@ __all__ = ["SQLiteStateStore", "CURRENT_SCHEMA_VERSION", "TASK_ATTEMPT_MIGRATION
 
 logger = logging.getLogger(__name__)
 
+# Connection-level pragmas applied to every new SQLite connection.
+# WAL + synchronous=NORMAL avoids an fsync per commit while remaining crash-safe,
+# which matters for write-heavy CLI paths (reset, step) and the polling TUI.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class SQLiteStateStore(
     _MigrationsMixin,
@@ -71,6 +90,7 @@ class SQLiteStateStore(
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine)
 
         # Initialize schema if file is new. For existing DBs, this is additive only.
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pytest
+from sqlalchemy import text
 
 from matterstack.core.operators import ExternalRunHandle, ExternalRunStatus
 from matterstack.core.run import RunHandle, RunMetadata
@@ -146,3 +147,10 @@ def test_persistence_across_instances(temp_run_dir, run_handle):
 
     assert len(tasks) == 1
     assert tasks[0].task_id == "persistent_task"
+
+def test_connection_pragmas_applied(store):
+    """Test that every connection opens in WAL mode with relaxed fsync."""
+    with store.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # synchronous=NORMAL is reported as 1
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
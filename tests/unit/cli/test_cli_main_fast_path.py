@@ -0,0 +1,75 @@
+"""
+Tests for the lightweight fast-path argument parser in matterstack.cli.main.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from matterstack.cli import main as cli_main
+
+
+def test_fast_path_parses_positionals_and_flags() -> None:
+    ns = cli_main._try_fast_parse(["rerun", "run_1", "task_a", "--recursive"])
+
+    assert ns is not None
+    assert ns.command == "rerun"
+    assert ns.run_id == "run_1"
+    assert ns.task_id == "task_a"
+    assert ns.recursive is True
+    assert ns.force is False
+    assert ns.func is cli_main.cmd_rerun
+
+
+@pytest.mark.parametrize("argv", [["reset-run", "r", "t", "--action", "delete"], ["reset-run", "r", "t", "--action=delete"]])
+def test_fast_path_reset_run_action(argv: list[str]) -> None:
+    ns = cli_main._try_fast_parse(argv)
+
+    assert ns is not None
+    assert ns.action == "delete"
+    assert ns.recursive is False
+
+
+def test_fast_path_reset_run_action_defaults_to_reset() -> None:
+    ns = cli_main._try_fast_parse(["reset-run", "r", "t"])
+
+    assert ns is not None
+    assert ns.action == "reset"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--help"],
+        ["status"],
+        ["status", "--help"],
+        ["status", "r", "extra"],
+        ["attempts", "r", "t", "--force"],
+        ["reset-run", "r", "t", "--action", "bogus"],
+        ["reset-run", "r", "t", "--action"],
+        ["rerun", "r", "t", "-f"],
+        ["step", "r"],
+        ["unknown", "r"],
+    ],
+)
+def test_fast_path_falls_back_to_argparse(argv: list[str]) -> None:
+    assert cli_main._try_fast_parse(argv) is None
+
+
+def test_fast_path_matches_argparse_namespace(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[dict[str, object]] = []
+
+    def _capture(args) -> None:
+        seen.append(vars(args))
+
+    monkeypatch.setattr(cli_main, "cmd_cancel_attempt", _capture)
+    monkeypatch.setattr("sys.argv", ["main.py", "cancel-attempt", "r", "a", "--force"])
+    cli_main.main()
+
+    # Disable the fast path to produce the argparse namespace for the same argv.
+    monkeypatch.setattr(cli_main, "_try_fast_parse", lambda _argv: None)
+    cli_main.main()
+
+    fast, slow = seen
+    assert fast == slow
@@ -214,3 +214,48 @@ def test_compute_operator_local_backend_runs_in_attempt_evidence_dir(tmp_path: P
     used = Path(backend._job_paths[task.task_id]).resolve()  # noqa: SLF001 (test asserting internal behavior)
     expected = Path(abs_path_str).resolve()
     assert used == expected
+
+
+def test_build_operator_registry_aliases_do_not_leak_into_shared_cache(tmp_path: Path) -> None:
+    from matterstack.config.operators import load_operators_config
+    from matterstack.runtime.operators.registry import get_cached_operator_registry_from_operators_config
+
+    ops_path = tmp_path / "operators.yaml"
+    ops_path.write_text(
+        """operators:
+  hpc.default:
+    kind: hpc
+    backend:
+      type: local
+"""
+    )
+    run_root = tmp_path / "run_root"
+    run_root.mkdir(parents=True, exist_ok=True)
+    handle = RunHandle(workspace_slug="ws", run_id="r1", root_path=run_root)
+    cfg = RegistryConfig(operators_config_path=str(ops_path))
+
+    reg1 = build_operator_registry(handle, registry_config=cfg)
+    reg2 = build_operator_registry(handle, registry_config=cfg)
+
+    # Aliased view is built once and reused.
+    assert reg1 is reg2
+    assert reg1["HPC"] is reg1["hpc.default"]
+
+    canonical = get_cached_operator_registry_from_operators_config(handle, load_operators_config(ops_path))
+    assert set(canonical.keys()) == {"hpc.default"}
+
+
+def test_profile_from_hpc_yaml_is_cached_until_file_changes(tmp_path: Path) -> None:
+    from matterstack.cli.operator_registry import _profile_from_hpc_yaml
+
+    hpc_yaml = _write_min_hpc_yaml(tmp_path)
+
+    prof1 = _profile_from_hpc_yaml(hpc_yaml)
+    prof2 = _profile_from_hpc_yaml(str(hpc_yaml))
+    assert prof1 is prof2
+
+    hpc_yaml.write_text(hpc_yaml.read_text().replace("atesting", "amilan"))
+    prof3 = _profile_from_hpc_yaml(hpc_yaml)
+    assert prof3 is not prof1
+    assert prof3.slurm is not None
+    assert prof3.slurm.slurm["partition"] == "amilan"
@@ -4,6 +4,7 @@ Unit tests for matterstack/cli/utils.py
 Tests nested workspace path support for load_workspace_context() and find_run().
 Tests multi-level resolution for workspaces root discovery.
 """
+import os
 import sys
 from pathlib import Path
 
@@ -12,8 +13,10 @@ import pytest
 from matterstack.cli.utils import (
     _ENV_WORKSPACES_ROOT,
     _find_project_root,
+    _resolve_workspace_paths,
     _resolve_workspaces_root,
     find_run,
+    find_runs,
     load_workspace_context,
 )
 from matterstack.core.run import RunHandle
@@ -145,10 +148,74 @@ def get_campaign():
         result1 = load_workspace_context("reloadable")
         assert result1["count"] == 1
 
-        # Second load - module is re-executed
+        # Second load - the unchanged module is reused, but get_campaign() runs again
         result2 = load_workspace_context("reloadable")
+        assert result2 is not result1
+        assert result2["count"] == 2
+
+        # Touching main.py invalidates the reused module; it is re-executed from file
+        st = (ws_dir / "main.py").stat()
+        os.utime(ws_dir / "main.py", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        result3 = load_workspace_context("reloadable")
         # Note: counter resets because module is reloaded from file
-        assert result2["count"] == 1
+        assert result3["count"] == 1
+        assert result3 is not result1
+
+    def test_unchanged_module_is_not_re_executed(self, tmp_path, monkeypatch):
+        """An executed, unmodified workspace module is reused from sys.modules."""
+        ws_dir = tmp_path / "workspaces" / "no_campaign_cache"
+        ws_dir.mkdir(parents=True)
+        (ws_dir / "main.py").write_text(
+            '''
+import builtins
+builtins._matterstack_test_exec_count = getattr(builtins, "_matterstack_test_exec_count", 0) + 1
+
+def get_campaign():
+    return None
+'''
+        )
+
+        monkeypatch.chdir(tmp_path)
+        import builtins
+
+        monkeypatch.setattr(builtins, "_matterstack_test_exec_count", 0, raising=False)
+
+        assert load_workspace_context("no_campaign_cache") is None
+        assert load_workspace_context("no_campaign_cache") is None
+        assert builtins._matterstack_test_exec_count == 1
+
+    def test_each_load_gets_a_fresh_campaign(self, tmp_path, monkeypatch):
+        """Stateful campaigns (e.g. a seeded RNG built in __init__) are never shared between loads."""
+        ws_dir = tmp_path / "workspaces" / "stateful"
+        ws_dir.mkdir(parents=True)
+        (ws_dir / "main.py").write_text(
+            '''
+import random
+
+class Campaign:
+    def __init__(self):
+        self.rng = random.Random(42)
+
+def get_campaign():
+    return Campaign()
+'''
+        )
+
+        monkeypatch.chdir(tmp_path)
+
+        first = load_workspace_context("stateful")
+        first_draws = [first.rng.random() for _ in range(3)]
+
+        second = load_workspace_context("stateful")
+        assert second is not first
+        assert [second.rng.random() for _ in range(3)] == first_draws
+
+    def test_resolve_workspace_paths_for_nested_slug(self, tmp_path):
+        """Nested slugs map to a nested main.py and a dotted module name."""
+        main_py, module_name = _resolve_workspace_paths(tmp_path, "demos/battery_screening")
+        assert main_py == tmp_path / "demos" / "battery_screening" / "main.py"
+        assert module_name == "workspace.demos.battery_screening"
+        assert _resolve_workspace_paths(tmp_path, "demos/battery_screening")[0] is main_py
 
 
 class TestFindRun:
@@ -629,3 +696,30 @@ def get_campaign():
         result = load_workspace_context("ws2", base_path=explicit_ws)
 
         assert result["source"] == "explicit"
+
+
+class TestFindRuns:
+    """Tests for find_runs() batched lookup."""
+
+    def test_finds_runs_across_workspaces_in_one_call(self, tmp_path):
+        base = tmp_path / "workspaces"
+        (base / "ws1" / "runs" / "run_a").mkdir(parents=True)
+        (base / "ws1" / "runs" / "run_b").mkdir(parents=True)
+        (base / "demos" / "nested" / "runs" / "run_c").mkdir(parents=True)
+
+        result = find_runs(["run_a", "run_c", "missing"], base_path=base)
+
+        assert set(result) == {"run_a", "run_c"}
+        assert result["run_a"].workspace_slug == "ws1"
+        assert result["run_a"].root_path == base / "ws1" / "runs" / "run_a"
+        assert result["run_c"].workspace_slug == "demos/nested"
+
+    def test_empty_request_and_missing_base(self, tmp_path):
+        assert find_runs([], base_path=tmp_path) == {}
+        assert find_runs(["r"], base_path=tmp_path / "nonexistent") == {}
+
+    def test_matches_find_run(self, tmp_path):
+        base = tmp_path / "workspaces"
+        (base / "ws" / "runs" / "run_x").mkdir(parents=True)
+
+        assert find_runs(["run_x"], base_path=base)["run_x"] == find_run("run_x", base_path=base)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from matterstack.config._wiring_legacy import _generate_legacy_operators_yaml_bytes, _snapshot_bytes_for
+from matterstack.config.operator_wiring import OperatorWiringSource
+
+
+def _reference_bytes(hpc_backend: dict) -> bytes:
+    """The original `yaml.safe_dump` serialization; snapshot sha256s depend on it."""
+    operators_doc = {
+        "operators": {
+            "human.default": {"kind": "human"},
+            "experiment.default": {"kind": "experiment"},
+            "local.default": {"kind": "local", "backend": {"type": "local"}},
+            "hpc.default": {"kind": "hpc", "backend": hpc_backend},
+        }
+    }
+    return yaml.safe_dump(operators_doc, sort_keys=True).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "/abs/path/HPC_atesting_config.yaml",
+        "relative/config.yaml",
+        "C:\\Users\\me\\hpc config.yaml",
+        "with: colon",
+        "- leading dash",
+        "123",
+        "true",
+        "caf\u00e9",
+        "it's \"quoted\"",
+        "x" * 120,
+        "my_profile",
+        "./configs/hpc.yaml",
+        "_private",
+        "yes",
+        "Off",
+        "null",
+        "NULL",
+        ".5",
+        "1e3",
+        "~",
+        "2024-01-01",
+        "a b",
+        "a/" * 50 + "b.yaml",
+        "path#frag",
+        "../shared/hpc.yaml",
+        "~/hpc.yaml",
+        "./",
+        "./true",
+        ".inf",
+        # Long, double-quoted non-ASCII scalar with spaces: libyaml's emitter wraps it differently.
+        "/files m\u00fcnchen/Documents/m\u00fcnchen projects/projects/m\u00fcnchen/files my.yaml",
+    ],
+)
+def test_legacy_snapshot_bytes_match_safe_dump(value: str) -> None:
+    source, resolved, data = _generate_legacy_operators_yaml_bytes(legacy_hpc_config_path=value, legacy_profile=None)
+    assert source == OperatorWiringSource.LEGACY_HPC_CONFIG
+    assert resolved == value
+    assert data == _reference_bytes({"type": "hpc_yaml", "path": value})
+
+    source, resolved, data = _generate_legacy_operators_yaml_bytes(legacy_hpc_config_path=None, legacy_profile=value)
+    assert source == OperatorWiringSource.LEGACY_PROFILE
+    assert resolved == value
+    assert data == _reference_bytes({"type": "profile", "name": value})
+
+
+def test_legacy_snapshot_requires_legacy_inputs() -> None:
+    with pytest.raises(ValueError):
+        _generate_legacy_operators_yaml_bytes(legacy_hpc_config_path=None, legacy_profile=None)
+
+
+def test_legacy_snapshot_bytes_are_cached_per_inputs(monkeypatch: pytest.MonkeyPatch) -> None:
+    from matterstack.config import _wiring_legacy
+
+    _snapshot_bytes_for.cache_clear()
+    calls = []
+    real_dump = _wiring_legacy._dump_legacy_operators_doc
+
+    def _counting_dump(hpc_backend):
+        calls.append(hpc_backend)
+        return real_dump(hpc_backend)
+
+    monkeypatch.setattr(_wiring_legacy, "_dump_legacy_operators_doc", _counting_dump)
+
+    first = _generate_legacy_operators_yaml_bytes(legacy_hpc_config_path="my cfg.yaml", legacy_profile=None)
+    second = _generate_legacy_operators_yaml_bytes(legacy_hpc_config_path="my cfg.yaml", legacy_profile="ignored")
+    assert first == second
+    assert len(calls) == 1
+    _snapshot_bytes_for.cache_clear()
+
+
+@pytest.mark.parametrize("value", ["./configs/hpc.yaml", "../shared/hpc.yaml", "~/hpc.yaml"])
+def test_relative_paths_render_from_template(value: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    from matterstack.config import _wiring_legacy
+
+    def _no_emitter(hpc_backend: dict) -> bytes:
+        raise AssertionError("YAML emitter should not be needed")
+
+    monkeypatch.setattr(_wiring_legacy, "_dump_legacy_operators_doc", _no_emitter)
+    _snapshot_bytes_for.cache_clear()
+
+    assert _snapshot_bytes_for(value, None) == _reference_bytes({"type": "hpc_yaml", "path": value})
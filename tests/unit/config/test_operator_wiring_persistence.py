@@ -9,6 +9,7 @@ import pytest
 
 from matterstack.config.operator_wiring import (
     OperatorWiringSource,
+    _clear_resolution_cache,
     resolve_operator_wiring,
 )
 from matterstack.core.run import RunHandle
@@ -134,3 +135,526 @@ def test_metadata_and_history_reconstructed_when_only_snapshot_exists(tmp_path:
     first = json.loads(lines[0])
     assert first["event"] == "WIRING_PERSISTED"
     assert first["source"] == OperatorWiringSource.RUN_PERSISTED.value
+
+
+def test_snapshot_sha256_sidecar_is_reused_until_snapshot_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    The snapshot digest is cached in operators.yaml.sha256 keyed by the file's stat, and a
+    changed snapshot is re-hashed instead of trusting the stale sidecar.
+    """
+    from matterstack.config import _wiring_hashing as hashing
+
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+
+    handle = _mk_handle(tmp_path, workspace_slug="ws_sidecar")
+    workspace_base = tmp_path / "workspaces"
+    payload = b"operators:\n  human.default:\n    kind: human\n"
+    _write_file(workspace_base / "ws_sidecar" / "operators.yaml", payload)
+
+    w1 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    assert w1.snapshot_path is not None
+    snap = Path(w1.snapshot_path)
+    sidecar = snap.with_name("operators.yaml.sha256")
+    assert json.loads(sidecar.read_text(encoding="utf-8"))["sha256"] == hashlib.sha256(payload).hexdigest()
+
+    def _fail_file_digest(*_args, **_kwargs):
+        raise AssertionError("snapshot should not be re-hashed while the sidecar is valid")
+
+    with monkeypatch.context() as mp:
+        mp.setattr(hashing.hashlib, "file_digest", _fail_file_digest)
+        w2 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    assert w2.source == OperatorWiringSource.RUN_PERSISTED
+    assert w2.sha256 == w1.sha256
+
+    edited = payload + b"  experiment.default:\n    kind: experiment\n"
+    snap.write_bytes(edited)
+    w3 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    assert w3.sha256 == hashlib.sha256(edited).hexdigest()
+
+
+def test_encode_metadata_skips_rewrite_when_only_timestamp_would_change(tmp_path: Path) -> None:
+    from matterstack.config._wiring_persistence import _encode_metadata, _snapshot_paths
+
+    run_root = tmp_path / "run"
+    _snap_dir, snap_yaml, meta_json, _hist = _snapshot_paths(run_root)
+    kwargs = dict(
+        run_root=run_root,
+        source=OperatorWiringSource.WORKSPACE_DEFAULT,
+        resolved_path="/ws/operators.yaml",
+        sha256="abc",
+        snapshot_path=snap_yaml,
+        workspace_slug="ws",
+        cli_operators_config_path=None,
+        force_override=False,
+        legacy_profile=None,
+        legacy_hpc_config_path=None,
+        profiles_config_path=None,
+    )
+
+    data = _encode_metadata(meta_json, now_iso="2025-01-01T00:00:00Z", **kwargs)
+    assert data is not None
+    _write_file(meta_json, data)
+
+    assert _encode_metadata(meta_json, now_iso="2025-01-02T00:00:00Z", **kwargs) is None
+
+    changed = _encode_metadata(meta_json, now_iso="2025-01-02T00:00:00Z", **{**kwargs, "sha256": "def"})
+    assert changed is not None
+    assert json.loads(changed)["effective"]["sha256"] == "def"
+
+
+def test_history_lines_are_identical_with_and_without_orjson(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from matterstack.config import _wiring_json
+    from matterstack.config._wiring_persistence import _encode_history_line, _snapshot_paths
+
+    run_root = tmp_path / "run"
+    _snap_dir, snap_yaml, _meta, _hist = _snapshot_paths(run_root)
+    event = dict(
+        run_root=run_root,
+        event="WIRING_PERSISTED",
+        source=OperatorWiringSource.CLI_OVERRIDE,
+        sha256="abc",
+        resolved_path="/p/café/operators.yaml",
+        snapshot_path=snap_yaml,
+        details={"note": "x", "n": 1},
+        now_iso="2025-01-01T00:00:00Z",
+    )
+
+    first = _encode_history_line(**event)
+    monkeypatch.setattr(_wiring_json, "orjson", None)
+    second = _encode_history_line(**event)
+
+    assert first == second
+    assert json.loads(first)["resolved_path"] == "/p/café/operators.yaml"
+
+
+def test_utc_now_iso_matches_datetime_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    from datetime import datetime, timezone
+
+    from matterstack.config import _wiring_persistence as persistence
+
+    fixed = 1735689600.75  # 2025-01-01T00:00:00.75Z
+    monkeypatch.setattr(persistence.time, "time", lambda: fixed)
+
+    expected = datetime.fromtimestamp(fixed, timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    assert persistence._utc_now_iso() == expected == "2025-01-01T00:00:00Z"
+    # Same second is served from the memo; the next second is reformatted.
+    assert persistence._utc_now_iso() == expected
+    monkeypatch.setattr(persistence.time, "time", lambda: fixed + 1)
+    assert persistence._utc_now_iso() == "2025-01-01T00:00:01Z"
+
+
+def test_forced_override_replaces_snapshot_atomically(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A forced override swaps operators.yaml via a temp file and updates metadata/history together."""
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+
+    handle = _mk_handle(tmp_path, workspace_slug="ws_atomic")
+    first = _write_file(tmp_path / "cfg" / "a.yaml", b"operators:\n  hpc.default:\n    kind: hpc\n")
+    second = _write_file(tmp_path / "cfg" / "b.yaml", b"operators:\n  human.default:\n    kind: human\n")
+
+    resolve_operator_wiring(handle, cli_operators_config_path=str(first))
+    w2 = resolve_operator_wiring(handle, cli_operators_config_path=str(second), force_override=True)
+
+    snap = Path(w2.snapshot_path)
+    assert snap.read_bytes() == second.read_bytes()
+    assert sorted(p.name for p in snap.parent.iterdir() if p.name.endswith(".tmp")) == []
+
+    meta = json.loads(Path(w2.metadata_path).read_text(encoding="utf-8"))
+    assert meta["effective"]["sha256"] == w2.sha256
+    events = [json.loads(line)["event"] for line in Path(w2.history_path).read_text(encoding="utf-8").splitlines()]
+    assert events == ["WIRING_PERSISTED", "WIRING_OVERRIDE_FORCED"]
+
+
+@pytest.mark.parametrize(
+    "resolved_path, profile, force",
+    [
+        ("/ws/operators.yaml", None, False),
+        (None, "prof \"quoted\"\\ ünï", True),
+    ],
+)
+def test_metadata_template_matches_json_dumps(
+    tmp_path: Path, resolved_path: str | None, profile: str | None, force: bool
+) -> None:
+    from matterstack.config._wiring_persistence import _encode_metadata, _snapshot_paths
+
+    run_root = tmp_path / "run"
+    _snap_dir, snap_yaml, meta_json, _hist = _snapshot_paths(run_root)
+    data = _encode_metadata(
+        meta_json,
+        run_root=run_root,
+        source=OperatorWiringSource.LEGACY_PROFILE,
+        resolved_path=resolved_path,
+        sha256="abc",
+        snapshot_path=snap_yaml,
+        workspace_slug="ws",
+        cli_operators_config_path=None,
+        force_override=force,
+        legacy_profile=profile,
+        legacy_hpc_config_path=None,
+        profiles_config_path=None,
+    )
+    assert data is not None
+
+    payload = json.loads(data)
+    assert payload["effective"]["snapshot_relpath"] == "operators_snapshot/operators.yaml"
+    assert payload["provenance"]["legacy"]["profile"] == profile
+    assert payload["provenance"]["cli"]["force_wiring_override"] is force
+    assert data == (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def test_atomic_write_bytes_replaces_contents_without_leaving_temp_file(tmp_path: Path) -> None:
+    from matterstack.config._wiring_io import _atomic_write_bytes
+
+    target = tmp_path / "operators.yaml"
+    target.write_bytes(b"old contents that are longer than the new ones\n")
+
+    _atomic_write_bytes(target, b"new\n")
+
+    assert target.read_bytes() == b"new\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["operators.yaml"]
+
+
+def test_atomic_write_bytes_uses_unique_temp_files_and_cleans_up_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    from matterstack.config import _wiring_io
+
+    target = tmp_path / "operators.yaml"
+    temp_names = []
+    real_replace = os.replace
+
+    def _recording_replace(src, dst):
+        temp_names.append(Path(src).name)
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", _recording_replace)
+    _wiring_io._atomic_write_bytes(target, b"a\n")
+    _wiring_io._atomic_write_bytes(target, b"b\n")
+    assert len(set(temp_names)) == 2
+    assert all(name.startswith(f"operators.yaml.{os.getpid()}.") for name in temp_names)
+
+    def _failing_replace(src, dst):
+        raise OSError("rename failed")
+
+    monkeypatch.setattr(os, "replace", _failing_replace)
+    with pytest.raises(OSError, match="rename failed"):
+        _wiring_io._atomic_write_bytes(target, b"c\n")
+    assert target.read_bytes() == b"b\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["operators.yaml"]
+
+
+def test_run_persisted_resolve_stats_snapshot_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The run snapshot is stat'ed at most once (existence check and sha256 lookup share it)."""
+    import os
+
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+
+    handle = _mk_handle(tmp_path, workspace_slug="ws_stat_once")
+    workspace_base = tmp_path / "workspaces"
+    _write_file(workspace_base / "ws_stat_once" / "operators.yaml", b"operators:\n  human.default:\n    kind: human\n")
+    w1 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    snap = os.fspath(w1.snapshot_path)
+
+    calls: list[str] = []
+    real_stat = os.stat
+
+    def _counting_stat(path, *args, **kwargs):
+        if os.fspath(path) == snap:
+            calls.append(snap)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", _counting_stat)
+    w2 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+
+    assert w2.source == OperatorWiringSource.RUN_PERSISTED
+    assert w2.sha256 == w1.sha256
+    assert len(calls) <= 1
+
+
+def test_run_persisted_resolve_does_not_stat_metadata(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A fresh-process steady-state resolve learns metadata.json exists from the directory listing."""
+    import os
+
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+
+    handle = _mk_handle(tmp_path, workspace_slug="ws_meta_scan")
+    workspace_base = tmp_path / "workspaces"
+    _write_file(workspace_base / "ws_meta_scan" / "operators.yaml", b"operators:\n  human.default:\n    kind: human\n")
+    w1 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    meta = os.fspath(w1.metadata_path)
+    _clear_resolution_cache()
+
+    calls: list[str] = []
+    real_stat = os.stat
+
+    def _counting_stat(path, *args, **kwargs):
+        if os.fspath(path) == meta:
+            calls.append(meta)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", _counting_stat)
+    w2 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+
+    assert w2.source == OperatorWiringSource.RUN_PERSISTED
+    assert w2.sha256 == w1.sha256
+    assert calls == []
+
+
+def test_sha256_sidecar_is_written_atomically(tmp_path: Path) -> None:
+    from matterstack.config import _wiring_hashing as hashing
+
+    snap = _write_file(tmp_path / "operators.yaml", b"operators: {}\n")
+    hashing._SHA256_MEMO.clear()
+
+    sha = hashing._load_snapshot_sha256_if_present(snap)
+
+    assert sha == hashlib.sha256(b"operators: {}\n").hexdigest()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["operators.yaml", "operators.yaml.sha256"]
+    assert json.loads((tmp_path / "operators.yaml.sha256").read_bytes())["sha256"] == sha
+
+
+def test_resolution_is_cached_until_consulted_files_change(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+    _clear_resolution_cache()
+
+    handle = _mk_handle(tmp_path, workspace_slug="ws_cached")
+    workspace_base = tmp_path / "workspaces"
+    _write_file(workspace_base / "ws_cached" / "operators.yaml", b"operators:\n  human.default:\n    kind: human\n")
+
+    w1 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    w2 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    w3 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    assert w1.source == OperatorWiringSource.WORKSPACE_DEFAULT
+    assert w2.source == OperatorWiringSource.RUN_PERSISTED
+    assert w3 is w2
+
+    # Deleting metadata changes the key, so it is reconstructed rather than served stale.
+    Path(w2.metadata_path).unlink()
+    w4 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    assert w4 is not w2
+    assert Path(w4.metadata_path).is_file()
+
+    w5 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+    assert resolve_operator_wiring(handle, workspace_base_path=workspace_base) is w5
+    _clear_resolution_cache()
+    assert resolve_operator_wiring(handle, workspace_base_path=workspace_base) is not w5
+
+
+def test_deleted_snapshot_is_rewritten_instead_of_served_from_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import shutil
+
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+    _clear_resolution_cache()
+
+    handle = _mk_handle(tmp_path, workspace_slug="ws_deleted")
+    workspace_base = tmp_path / "workspaces"
+    _write_file(workspace_base / "ws_deleted" / "operators.yaml", b"operators:\n  human.default:\n    kind: human\n")
+
+    for _ in range(2):
+        w1 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+        shutil.rmtree(Path(w1.snapshot_path).parent)
+
+        w2 = resolve_operator_wiring(handle, workspace_base_path=workspace_base)
+        assert w2.is_persisted
+        assert Path(w2.snapshot_path).is_file()
+        assert Path(w2.metadata_path).is_file()
+
+
+@pytest.mark.parametrize("size_hint_delta", [None, 0, -5, 10])
+def test_read_bytes_returns_whole_file_for_any_size_hint(tmp_path: Path, size_hint_delta: int | None) -> None:
+    from matterstack.config._wiring_io import _read_bytes
+
+    data = b"operators:\n" + b"x" * 200_000
+    path = _write_file(tmp_path / "operators.yaml", data)
+    hint = -1 if size_hint_delta is None else len(data) + size_hint_delta
+
+    assert _read_bytes(path, hint) == data
+    assert _read_bytes(_write_file(tmp_path / "empty.yaml", b""), 0) == b""
+
+
+def test_cli_resolve_with_unchanged_bytes_does_not_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from matterstack.config import _wiring_persistence
+
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+    handle = _mk_handle(tmp_path, workspace_slug="ws_no_write")
+    cfg = _write_file(tmp_path / "cfg" / "operators.yaml", b"operators:\n  human.default:\n    kind: human\n")
+
+    w1 = resolve_operator_wiring(handle, cli_operators_config_path=str(cfg))
+    _clear_resolution_cache()
+
+    def _no_writes(*_args, **_kwargs):
+        raise AssertionError("unchanged snapshot must not be rewritten")
+
+    monkeypatch.setattr(_wiring_persistence, "_atomic_write_bytes", _no_writes)
+    monkeypatch.setattr(Path, "mkdir", _no_writes)
+
+    w2 = resolve_operator_wiring(handle, cli_operators_config_path=str(cfg))
+    assert w2.sha256 == w1.sha256
+    assert len(Path(w2.history_path).read_text(encoding="utf-8").splitlines()) == 1
+
+
+@pytest.mark.parametrize("size", [0, 4096, (1 << 20) + 1])
+def test_snapshot_sha256_matches_for_small_and_large_files(tmp_path: Path, size: int) -> None:
+    from matterstack.config import _wiring_hashing as hashing
+
+    data = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+    snap = _write_file(tmp_path / "operators.yaml", data)
+    hashing._SHA256_MEMO.clear()
+
+    assert hashing._load_snapshot_sha256_if_present(snap) == hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_json_matches_stdlib_with_and_without_orjson(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    from matterstack.config import _wiring_json
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_wiring_json, "orjson", None)
+
+    doc = {"effective": {"source": "CLI_OVERRIDE", "sha256": "ab" * 32}, "schema_version": 1, "note": "ü"}
+    raw = json.dumps(doc, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    assert _wiring_json._loads_json(raw) == doc
+
+
+def test_sha256_bytes_reuses_digest_for_same_object_only() -> None:
+    from matterstack.config import _wiring_hashing as hashing
+
+    data = b"operators: {}\n"
+    assert hashing._sha256_bytes(data) == hashlib.sha256(data).hexdigest()
+    assert hashing._LAST_SHA256[0] is data
+    assert hashing._sha256_bytes(data) == hashlib.sha256(data).hexdigest()
+
+    other = bytes(bytearray(b"operators: []\n"))
+    assert hashing._sha256_bytes(other) == hashlib.sha256(other).hexdigest()
+
+
+def test_hashing_snapshot_file_does_not_retain_its_buffer(tmp_path: Path) -> None:
+    from matterstack.config import _wiring_hashing as hashing
+
+    source = b"operators: {}\n"
+    hashing._sha256_bytes(source)
+    snap = _write_file(tmp_path / "operators.yaml", b"operators: {a: 1}\n")
+    hashing._SHA256_MEMO.clear()
+
+    assert hashing._load_snapshot_sha256_if_present(snap) == hashlib.sha256(snap.read_bytes()).hexdigest()
+    assert hashing._LAST_SHA256[0] is source
+
+
+def test_snapshot_sha256_reuses_expected_digest_for_identical_bytes(tmp_path: Path) -> None:
+    from matterstack.config import _wiring_hashing as hashing
+
+    snap = _write_file(tmp_path / "operators.yaml", b"operators: {a: 1}\n")
+    hashing._SHA256_MEMO.clear()
+    assert hashing._load_snapshot_sha256_if_present(snap, expected=(b"operators: {a: 1}\n", "known")) == "known"
+
+    snap2 = _write_file(tmp_path / "other" / "operators.yaml", b"operators: {b: 2}\n")
+    assert hashing._load_snapshot_sha256_if_present(snap2, expected=(b"operators: {a: 1}\n", "known")) == (
+        hashlib.sha256(b"operators: {b: 2}\n").hexdigest()
+    )
+
+
+def test_persist_stamps_metadata_and_history_with_one_timestamp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from matterstack.config import _wiring_persistence as persistence
+
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+    _clear_resolution_cache()
+    calls = []
+
+    def _ticking_now() -> str:
+        calls.append(None)
+        return f"2025-01-01T00:00:{len(calls):02d}Z"
+
+    monkeypatch.setattr(persistence, "_utc_now_iso", _ticking_now)
+
+    handle = _mk_handle(tmp_path)
+    cfg = _write_file(tmp_path / "ops.yaml", b"operators:\n  human.default:\n    kind: human\n")
+    w = resolve_operator_wiring(handle, cli_operators_config_path=str(cfg))
+
+    meta = json.loads(Path(w.metadata_path).read_text(encoding="utf-8"))
+    event = json.loads(Path(w.history_path).read_text(encoding="utf-8").splitlines()[0])
+    assert len(calls) == 1
+    assert meta["created_at_utc"] == meta["updated_at_utc"] == event["at_utc"]
+
+
+def test_json_line_fallback_matches_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    from matterstack.config import _wiring_json
+
+    pytest.importorskip("orjson")
+    line = {"event": "WIRING_PERSISTED", "at_utc": "2025-01-01T00:00:00Z", "details": {"note": "café", "n": 1}}
+    expected = _wiring_json._dumps_json_line(line)
+
+    monkeypatch.setattr(_wiring_json, "orjson", None)
+    assert _wiring_json._dumps_json_line(line) == expected
+    assert expected.endswith(b"\n") and json.loads(expected) == line
+
+
+def test_encode_metadata_treats_missing_or_unreadable_file_as_new(tmp_path: Path) -> None:
+    from matterstack.config._wiring_persistence import _encode_metadata, _snapshot_paths
+
+    run_root = tmp_path / "run"
+    _snap_dir, snap_yaml, meta_json, _hist = _snapshot_paths(run_root)
+    kwargs = dict(
+        run_root=run_root,
+        source=OperatorWiringSource.ENV_VAR,
+        resolved_path="/env/operators.yaml",
+        sha256="abc",
+        snapshot_path=snap_yaml,
+        workspace_slug="ws",
+        cli_operators_config_path=None,
+        force_override=False,
+        legacy_profile=None,
+        legacy_hpc_config_path=None,
+        profiles_config_path=None,
+        now_iso="2025-01-01T00:00:00Z",
+    )
+
+    missing = _encode_metadata(meta_json, **kwargs)
+    assert missing is not None
+    assert json.loads(missing)["created_at_utc"] == "2025-01-01T00:00:00Z"
+
+    meta_json.mkdir(parents=True)
+    assert _encode_metadata(meta_json, **kwargs) == missing
+
+
+def test_encode_metadata_reads_timestamps_without_full_parse(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from matterstack.config import _wiring_persistence as persistence
+
+    run_root = tmp_path / "run"
+    _snap_dir, snap_yaml, meta_json, _hist = persistence._snapshot_paths(run_root)
+    kwargs = dict(
+        run_root=run_root,
+        source=OperatorWiringSource.WORKSPACE_DEFAULT,
+        resolved_path="/ws/operators.yaml",
+        sha256="abc",
+        snapshot_path=snap_yaml,
+        workspace_slug="ws",
+        cli_operators_config_path=None,
+        force_override=False,
+        legacy_profile=None,
+        legacy_hpc_config_path=None,
+        profiles_config_path=None,
+    )
+    data = persistence._encode_metadata(meta_json, now_iso="2025-01-01T00:00:00Z", **kwargs)
+    assert data is not None
+    _write_file(meta_json, data)
+
+    def _no_full_parse(data: bytes) -> None:
+        raise AssertionError("metadata.json should not be fully parsed")
+
+    monkeypatch.setattr(persistence, "_loads_json", _no_full_parse)
+    assert persistence._encode_metadata(meta_json, now_iso="2025-01-02T00:00:00Z", **kwargs) is None
+
+    # Files not in the template layout still keep their created_at_utc via the full parse.
+    monkeypatch.undo()
+    compact = json.dumps(json.loads(meta_json.read_text(encoding="utf-8")), separators=(",", ":"))
+    meta_json.write_text(compact, encoding="utf-8")
+    rewritten = persistence._encode_metadata(meta_json, now_iso="2025-01-02T00:00:00Z", **kwargs)
+    assert rewritten is not None
+    payload = json.loads(rewritten)
+    assert payload["created_at_utc"] == "2025-01-01T00:00:00Z"
+    assert payload["updated_at_utc"] == "2025-01-02T00:00:00Z"
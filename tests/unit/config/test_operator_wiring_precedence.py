@@ -156,3 +156,78 @@ def test_precedence_legacy_hpc_config_fallback(tmp_path: Path, monkeypatch: pyte
     snap_text = Path(wiring.snapshot_path).read_text(encoding="utf-8")
     assert "hpc_yaml" in snap_text
     assert str(hpc_cfg) in snap_text
+
+
+def test_no_source_resolves_to_none_without_persisting(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+    handle = _mk_handle(tmp_path, workspace_slug="ws_none")
+
+    wiring = resolve_operator_wiring(handle, workspace_base_path=tmp_path / "workspaces")
+
+    assert wiring.source == OperatorWiringSource.NONE
+    assert wiring.snapshot_path is None
+    assert wiring.sha256 is None
+    assert wiring.is_persisted is False
+    assert wiring.warnings == []
+    assert wiring.snapshot_dir == str(handle.root_path / "operators_snapshot")
+    assert not (handle.root_path / "operators_snapshot").exists()
+
+
+def test_env_source_bytes_are_reused_until_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from matterstack.config import operator_wiring
+
+    env_cfg = _write_file(tmp_path / "env_ops.yaml", b"env: 1\n")
+    monkeypatch.setenv(_ENV_NAME, str(env_cfg))
+
+    reads: list[str] = []
+    real_read = operator_wiring._read_bytes
+
+    def _counting_read(path, size_hint=-1):
+        reads.append(str(path))
+        return real_read(path, size_hint)
+
+    monkeypatch.setattr(operator_wiring, "_read_bytes", _counting_read)
+
+    w1 = resolve_operator_wiring(_mk_handle(tmp_path, run_id="r1"), workspace_base_path=tmp_path / "workspaces")
+    w2 = resolve_operator_wiring(_mk_handle(tmp_path, run_id="r2"), workspace_base_path=tmp_path / "workspaces")
+    assert w1.source == w2.source == OperatorWiringSource.ENV_VAR
+    assert w1.sha256 == w2.sha256
+    assert reads == [str(env_cfg)]
+
+    env_cfg.write_bytes(b"env: 2, changed\n")
+    w3 = resolve_operator_wiring(_mk_handle(tmp_path, run_id="r3"), workspace_base_path=tmp_path / "workspaces")
+    assert w3.sha256 != w1.sha256
+    assert Path(w3.snapshot_path).read_bytes() == b"env: 2, changed\n"
+    assert len(reads) == 2
+
+
+def test_workspace_source_realpath_is_reused_across_runs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import os
+
+    monkeypatch.delenv(_ENV_NAME, raising=False)
+    workspace_base = tmp_path / "workspaces"
+    real_cfg = _write_file(tmp_path / "shared" / "operators.yaml", b"workspace: shared\n")
+    link = workspace_base / "ws_link" / "operators.yaml"
+    link.parent.mkdir(parents=True)
+    link.symlink_to(real_cfg)
+    expected = str(link.resolve())
+
+    walks: list[str] = []
+    real_realpath = os.path.realpath
+
+    def _counting_realpath(path, *args, **kwargs):
+        if os.fspath(path) == str(link):
+            walks.append(os.fspath(path))
+        return real_realpath(path, *args, **kwargs)
+
+    monkeypatch.setattr(os.path, "realpath", _counting_realpath)
+
+    wirings = [
+        resolve_operator_wiring(
+            _mk_handle(tmp_path, workspace_slug="ws_link", run_id=rid), workspace_base_path=workspace_base
+        )
+        for rid in ("a1", "a2")
+    ]
+    assert [w.source for w in wirings] == [OperatorWiringSource.WORKSPACE_DEFAULT] * 2
+    assert [w.resolved_path for w in wirings] == [expected] * 2
+    assert len(walks) == 1
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from matterstack.config.operator_wiring import (
+    format_operator_wiring_explain_line,
+    load_wiring_provenance_from_run_root,
+)
+
+
+def _write_metadata(run_root: Path, *, sha256: str, source: str = "WORKSPACE_DEFAULT") -> Path:
+    meta = run_root / "operators_snapshot" / "metadata.json"
+    meta.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "schema_version": 1,
+        "created_at_utc": "2025-01-01T00:00:00Z",
+        "updated_at_utc": "2025-01-01T00:00:00Z",
+        "effective": {
+            "source": source,
+            "resolved_path": "/ws/operators.yaml",
+            "sha256": sha256,
+            "snapshot_relpath": "operators_snapshot/operators.yaml",
+        },
+    }
+    meta.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return meta
+
+
+def test_explain_line_reports_metadata(tmp_path: Path) -> None:
+    _write_metadata(tmp_path, sha256="a" * 64)
+
+    prov = load_wiring_provenance_from_run_root(tmp_path)
+    assert prov is not None
+    assert prov.source == "WORKSPACE_DEFAULT"
+    assert prov.resolved_path == "/ws/operators.yaml"
+    assert prov.created_at_utc == "2025-01-01T00:00:00Z"
+
+    assert format_operator_wiring_explain_line(tmp_path) == (
+        f"Operator wiring: source=WORKSPACE_DEFAULT, sha256={'a' * 64}, snapshot=operators_snapshot/operators.yaml"
+    )
+
+
+def test_missing_or_malformed_metadata_is_none(tmp_path: Path) -> None:
+    assert load_wiring_provenance_from_run_root(tmp_path) is None
+    assert format_operator_wiring_explain_line(tmp_path) == "Operator wiring: none/unknown"
+
+    meta = tmp_path / "operators_snapshot" / "metadata.json"
+    meta.parent.mkdir(parents=True)
+    meta.write_text("{not json", encoding="utf-8")
+    assert load_wiring_provenance_from_run_root(tmp_path) is None
+
+
+def test_provenance_is_cached_until_metadata_changes(tmp_path: Path) -> None:
+    meta = _write_metadata(tmp_path, sha256="a" * 64)
+
+    prov1 = load_wiring_provenance_from_run_root(tmp_path)
+    prov2 = load_wiring_provenance_from_run_root(tmp_path)
+    assert prov1 is prov2
+
+    _write_metadata(tmp_path, sha256="b" * 64)
+    st = meta.stat()
+    os.utime(meta, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    prov3 = load_wiring_provenance_from_run_root(tmp_path)
+    assert prov3 is not None
+    assert prov3.sha256 == "b" * 64
+
+
+def test_provenance_cache_sees_replacement_with_same_mtime_and_size(tmp_path: Path) -> None:
+    meta = _write_metadata(tmp_path, sha256="a" * 64)
+    st = meta.stat()
+    assert load_wiring_provenance_from_run_root(tmp_path).sha256 == "a" * 64
+
+    # Atomic replace (new inode) with identical size and mtime.
+    replacement = _write_metadata(tmp_path / "staging", sha256="d" * 64)
+    os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(replacement, meta)
+
+    prov = load_wiring_provenance_from_run_root(tmp_path)
+    assert prov is not None
+    assert prov.sha256 == "d" * 64
+
+
+def test_provenance_falls_back_to_full_parse_for_compact_metadata(tmp_path: Path) -> None:
+    meta = _write_metadata(tmp_path, sha256="c" * 64)
+    compact = json.dumps(json.loads(meta.read_text(encoding="utf-8")), separators=(",", ":"))
+    meta.write_text(compact, encoding="utf-8")
+    st = meta.stat()
+    os.utime(meta, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    prov = load_wiring_provenance_from_run_root(tmp_path)
+    assert prov is not None
+    assert prov.sha256 == "c" * 64
+    assert prov.created_at_utc == "2025-01-01T00:00:00Z"
+
+
+def test_provenance_from_resolver_written_metadata(tmp_path: Path, monkeypatch) -> None:
+    from matterstack.config.operator_wiring import resolve_operator_wiring
+    from matterstack.core.run import RunHandle
+
+    monkeypatch.delenv("MATTERSTACK_OPERATORS_CONFIG", raising=False)
+    run_root = tmp_path / "runs" / "r1"
+    run_root.mkdir(parents=True)
+    ops = tmp_path / 'dir "quoted"\n  "effective": x' / "operators.yaml"
+    ops.parent.mkdir(parents=True)
+    ops.write_bytes(b"operators:\n  human.default:\n    kind: human\n")
+
+    wiring = resolve_operator_wiring(
+        RunHandle(workspace_slug="ws", run_id="r1", root_path=run_root),
+        cli_operators_config_path=str(ops),
+    )
+
+    prov = load_wiring_provenance_from_run_root(run_root)
+    assert prov is not None
+    assert prov.source == "CLI_OVERRIDE"
+    assert prov.sha256 == wiring.sha256
+    assert prov.resolved_path == str(ops.resolve())
+
+
+def test_provenance_reexports_are_the_provenance_module_functions() -> None:
+    from matterstack.config import _wiring_provenance, operator_wiring
+
+    assert operator_wiring.format_operator_wiring_explain_line is _wiring_provenance.format_operator_wiring_explain_line
+    assert (
+        operator_wiring.load_wiring_provenance_from_run_root is _wiring_provenance.load_wiring_provenance_from_run_root
+    )
+    assert "format_operator_wiring_explain_line" in dir(operator_wiring)
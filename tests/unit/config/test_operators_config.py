@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from matterstack.config.operators import (
     OperatorsConfigError,
@@ -277,3 +278,193 @@ def test_parse_operators_config_complete_example(tmp_path: Path) -> None:
     assert parsed.operators["hpc.cpu"].max_concurrent == 30
     assert parsed.operators["human.default"].max_concurrent == 1000  # High capacity
     assert parsed.operators["local.default"].max_concurrent is None  # Will inherit global
+
+
+def test_load_operators_config_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    p = tmp_path / "operators.yaml"
+    p.write_text("operators:\n  human.default:\n    kind: human\n")
+
+    first = load_operators_config(p)
+    assert load_operators_config(p) is first
+
+    p.write_text("operators:\n  human.default:\n    kind: human\n  experiment.default:\n    kind: experiment\n")
+    reloaded = load_operators_config(p)
+    assert reloaded is not first
+    assert set(reloaded.operators.keys()) == {"human.default", "experiment.default"}
+
+
+def test_operator_models_validate_with_deferred_schema_build(tmp_path: Path) -> None:
+    from matterstack.config.operators import OperatorInstanceConfig
+
+    assert OperatorInstanceConfig.model_config.get("defer_build") is True
+    inst = OperatorInstanceConfig.model_validate({"kind": "hpc", "backend": {"type": "local", "workspace_root": "/w"}})
+    assert inst.backend is not None and inst.backend.type == "local"
+
+
+def test_safe_load_yaml_uses_libyaml_when_available_and_accepts_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    import yaml
+
+    from matterstack.config._yaml_loading import safe_load_yaml
+
+    loaders = []
+    real_load = yaml.load
+
+    def spy_load(stream, Loader):  # noqa: N803 - mirrors yaml.load
+        loaders.append(Loader)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", spy_load)
+    safe_load_yaml(b"a: 1\n")
+    expected = "CSafeLoader" if getattr(yaml, "__with_libyaml__", False) else "SafeLoader"
+    assert [loader.__name__ for loader in loaders] == [expected]
+    monkeypatch.undo()
+
+    text = "operators:\n  human.default:\n    kind: human\n    note: \"café\"\n"
+    assert safe_load_yaml(text.encode("utf-8")) == safe_load_yaml(text) == yaml.safe_load(text)
+    assert safe_load_yaml(b"") is None
+
+
+def test_load_yaml_file_parses_file_and_treats_empty_as_mapping(tmp_path: Path) -> None:
+    import yaml
+
+    from matterstack.config._yaml_loading import load_yaml_file
+
+    text = "operators:\n  human.default:\n    kind: human\n"
+    (tmp_path / "ops.yaml").write_text(text, encoding="utf-8")
+    (tmp_path / "empty.yaml").write_bytes(b"")
+
+    assert load_yaml_file(tmp_path / "ops.yaml") == yaml.safe_load(text)
+    assert load_yaml_file(str(tmp_path / "empty.yaml")) == {}
+    with pytest.raises(FileNotFoundError):
+        load_yaml_file(tmp_path / "missing.yaml")
+
+
+def test_default_local_backend_matches_validated_config_and_is_shared() -> None:
+    from matterstack.config.operators import LocalBackendConfig, OperatorInstanceConfig
+
+    a = OperatorInstanceConfig.model_validate({"kind": "hpc"})
+    b = OperatorInstanceConfig.model_validate({"kind": "local"})
+
+    assert a.backend == LocalBackendConfig(type="local")
+    assert a.backend.model_fields_set == {"type"}
+    assert "backend" in a.model_fields_set
+    assert a.backend is b.backend
+    with pytest.raises(ValidationError):
+        a.backend.workspace_root = "/elsewhere"
+
+
+def test_operators_config_is_read_only_and_hashable(tmp_path: Path) -> None:
+    cfg = {"operators": {"human.default": {"kind": "human"}}}
+    a = parse_operators_config_dict(cfg, path=tmp_path / "operators.yaml")
+    b = parse_operators_config_dict(cfg, path=tmp_path / "operators.yaml")
+
+    with pytest.raises(TypeError):
+        a.operators["local.default"] = a.operators["human.default"]  # type: ignore[index]
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert {a: 1}[b] == 1
+
+
+def test_load_operators_config_reports_yaml_errors_from_streamed_file(tmp_path: Path) -> None:
+    p = tmp_path / "operators.yaml"
+    p.write_bytes("operators:\n  human.default: {kind: human\n".encode("utf-8"))
+
+    with pytest.raises(OperatorsConfigError, match="failed to parse YAML"):
+        load_operators_config(p)
+
+
+def test_load_operators_config_sees_atomic_replace_with_same_mtime_and_size(tmp_path: Path) -> None:
+    import os
+
+    p = tmp_path / "operators.yaml"
+    p.write_text("operators:\n  human.aaaa:\n    kind: human\n")
+    st = os.stat(p)
+    first = load_operators_config(p)
+
+    tmp = tmp_path / "operators.yaml.tmp"
+    tmp.write_text("operators:\n  human.bbbb:\n    kind: human\n")
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(tmp, p)
+
+    reloaded = load_operators_config(p)
+    assert reloaded is not first
+    assert set(reloaded.operators) == {"human.bbbb"}
+
+
+@pytest.mark.parametrize("key,kind", [("human.default", "human"), ("local.default", "local")])
+def test_parse_operators_config_max_concurrent_checked_for_every_kind(tmp_path: Path, key: str, kind: str) -> None:
+    cfg = {"operators": {key: {"kind": kind, "max_concurrent": 0}}}
+    with pytest.raises(OperatorsConfigError, match="must be a positive integer"):
+        parse_operators_config_dict(cfg, path=tmp_path / "operators.yaml")
+
+
+def test_nested_operator_models_share_the_instance_validator() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "from matterstack.config import operators as o\n"
+        "o.OperatorInstanceConfig.model_validate({'kind': 'hpc', 'backend': {'type': 'slurm', "
+        "'workspace_root': '/w', 'ssh': {'host': 'h', 'user': 'u'}}})\n"
+        "models = (o.SSHConfigModel, o.LocalBackendConfig, o.SlurmBackendConfig, o.ProfileBackendConfig, "
+        "o.HpcYamlBackendConfig, o.OperatorInstanceConfig)\n"
+        "print(sorted(m.__name__ for m in models if type(m.__pydantic_validator__).__name__ == 'SchemaValidator'))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert out.strip() == "['OperatorInstanceConfig']"
+
+
+def test_parse_operators_config_shares_identical_backend_blocks(tmp_path: Path) -> None:
+    slurm = {
+        "type": "slurm",
+        "workspace_root": "/scratch/ws",
+        "ssh": {"host": "login", "user": "me"},
+        "slurm": {"partition": "gpu", "modules": ["cuda"]},
+    }
+    cfg = {
+        "operators": {
+            "hpc.a": {"kind": "hpc", "backend": dict(slurm)},
+            "hpc.b": {"kind": "hpc", "backend": dict(slurm), "max_concurrent": 2},
+            "hpc.c": {"kind": "hpc", "backend": {**slurm, "slurm": {"partition": "cpu"}}},
+        }
+    }
+
+    parsed = parse_operators_config_dict(cfg, path=tmp_path / "operators.yaml")
+    a, b, c = (parsed.operators[k].backend for k in ("hpc.a", "hpc.b", "hpc.c"))
+
+    assert a is b
+    assert c is not a and c.slurm == {"partition": "cpu"}
+    with pytest.raises(ValidationError):
+        a.workspace_root = "/elsewhere"
+
+
+def test_parse_operators_config_accepts_non_dict_mappings(tmp_path: Path) -> None:
+    from types import MappingProxyType
+
+    cfg = MappingProxyType(
+        {
+            "defaults": MappingProxyType({"max_concurrent_global": 3}),
+            "operators": MappingProxyType({"human.default": MappingProxyType({"kind": "human"})}),
+        }
+    )
+    parsed = parse_operators_config_dict(cfg, path=tmp_path / "operators.yaml")
+    assert parsed.defaults.max_concurrent_global == 3
+    assert parsed.operators["human.default"].kind == "human"
+
+    with pytest.raises(OperatorsConfigError, match="must be a mapping/object"):
+        parse_operators_config_dict({"operators": {"human.default": ["kind", "human"]}}, path=tmp_path / "x.yaml")
+
+
+def test_backend_interning_tolerates_unhashable_values(tmp_path: Path) -> None:
+    slurm = {
+        "type": "slurm",
+        "workspace_root": "/w",
+        "ssh": {"host": "h", "user": "u"},
+        "slurm": {"x": bytearray(b"a")},
+    }
+    cfg = {"operators": {"hpc.a": {"kind": "hpc", "backend": slurm}, "hpc.b": {"kind": "hpc", "backend": slurm}}}
+
+    parsed = parse_operators_config_dict(cfg, path=tmp_path / "operators.yaml")
+
+    assert parsed.operators["hpc.a"].backend == parsed.operators["hpc.b"].backend
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 
+from matterstack.core.domain import DesignSpace
 from matterstack.core.evidence import EvidenceBundle
 from matterstack.core.operators import ExternalRunHandle, ExternalRunStatus
 from matterstack.core.run import RunHandle, RunMetadata
@@ -120,3 +121,20 @@ def test_workflow_cycle_detection():
 
     with pytest.raises(ValueError, match="Graph has cycles"):
         wf.get_topo_sorted_tasks()
+
+def test_design_space_enumerates_cartesian_product():
+    space = DesignSpace()
+    assert space.enumerate_candidates() == []
+
+    space.add_dimension("metal", ["Cu", "Ni"])
+    space.add_dimension("temp", [300, 600, 900])
+
+    candidates = space.enumerate_candidates()
+    assert [c.id for c in candidates] == [f"cand_{i:04d}" for i in range(6)]
+    assert candidates[0].params == {"metal": "Cu", "temp": 300}
+    assert candidates[-1].params == {"metal": "Ni", "temp": 900}
+    assert candidates[0].files is not candidates[1].files
+
+    lazy = space.iter_candidates()
+    assert next(lazy) == candidates[0]
+    assert list(lazy) == candidates[1:]
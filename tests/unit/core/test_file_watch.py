@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from matterstack.core._file_watch import _DirectoryWatcher, wait_for_any_file
+
+
+def test_wait_for_any_file_returns_existing_path_in_order(tmp_path):
+    approve = tmp_path / "approve"
+    reject = tmp_path / "reject"
+    approve.touch()
+    reject.touch()
+
+    assert wait_for_any_file([approve, reject], timeout=1, poll_interval=0.01) == approve
+
+
+def test_wait_for_any_file_times_out(tmp_path):
+    start = time.monotonic()
+    assert wait_for_any_file([tmp_path / "missing"], timeout=0.2, poll_interval=0.05) is None
+    assert time.monotonic() - start < 2
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_wait_for_any_file_wakes_on_write_before_poll_interval(tmp_path):
+    assert _DirectoryWatcher.open([tmp_path]) is not None
+    target = tmp_path / "response.json"
+
+    def _write():
+        time.sleep(0.2)
+        tmp = tmp_path / "response.json.tmp"
+        tmp.write_text("{}")
+        tmp.rename(target)
+
+    writer = threading.Thread(target=_write)
+    start = time.monotonic()
+    writer.start()
+    try:
+        found = wait_for_any_file([target], timeout=30, poll_interval=20)
+    finally:
+        writer.join()
+
+    assert found == target
+    assert time.monotonic() - start < 5
+
+
+def test_wait_for_any_file_backs_off_and_resets_on_directory_activity(tmp_path):
+    delays = []
+
+    def _sleep(seconds):
+        delays.append(round(seconds, 3))
+        if len(delays) == 4:
+            (tmp_path / "unrelated").write_text("x")
+            # Make sure the directory mtime visibly moves on coarse-grained filesystems.
+            os.utime(tmp_path, ns=(0, 12345))
+        if len(delays) == 6:
+            (tmp_path / "done").touch()
+
+    with patch.object(_DirectoryWatcher, "open", return_value=None), patch("time.sleep", _sleep):
+        found = wait_for_any_file([tmp_path / "done"], timeout=60, poll_interval=0.3, min_poll_interval=0.05)
+
+    assert found == tmp_path / "done"
+    assert delays == [0.05, 0.1, 0.2, 0.3, 0.05, 0.1]
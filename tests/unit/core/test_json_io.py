@@ -0,0 +1,33 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from matterstack.core import _json_io
+from matterstack.core._json_io import read_json_file, write_json_file
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_file_roundtrip_matches_stdlib_layout(tmp_path, use_orjson):
+    if use_orjson and _json_io.orjson is None:
+        pytest.skip("orjson not installed")
+    data = {"status": "success", "values": [1, 2.5, None], "nested": {"unit": "eV"}}
+    path = tmp_path / "doc.json"
+
+    with patch.object(_json_io, "orjson", _json_io.orjson if use_orjson else None):
+        write_json_file(path, data)
+        assert read_json_file(path) == data
+
+    assert path.read_text() == json.dumps(data, indent=2)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_read_json_file_invalid_raises_value_error(tmp_path, use_orjson):
+    if use_orjson and _json_io.orjson is None:
+        pytest.skip("orjson not installed")
+    path = tmp_path / "response.json"
+    path.write_bytes(b"{not json")
+
+    with patch.object(_json_io, "orjson", _json_io.orjson if use_orjson else None):
+        with pytest.raises(ValueError):
+            read_json_file(path)
@@ -9,6 +9,7 @@ from matterstack.core.operator_keys import (
     is_canonical_operator_key,
     legacy_operator_type_to_key,
     normalize_operator_key,
+    parse_canonical_operator_key,
     resolve_operator_key_for_attempt,
     split_operator_key,
 )
@@ -72,6 +73,32 @@ def test_split_operator_key_splits_on_first_dot() -> None:
     assert name2 == "clustera.dev"
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "hpc.default",
+        "hpc.clustera.dev",
+        "local.a-b_c",
+        "HPC.default",
+        " hpc.default",
+        "hpc.default\n",
+        "hpc..default",
+        "hpc.a..b",
+        "hpc",
+        ".default",
+        "hpc.",
+        "hpc.de fault",
+        "1hpc.default",
+    ],
+)
+def test_parse_canonical_operator_key_matches_normalize_then_split(value: str) -> None:
+    try:
+        expected = split_operator_key(value) if normalize_operator_key(value) == value else None
+    except ValueError:
+        expected = None
+    assert parse_canonical_operator_key(value) == expected
+
+
 def test_legacy_operator_type_to_key_maps_known_legacy_types() -> None:
     assert legacy_operator_type_to_key("HPC") == "hpc.default"
     assert legacy_operator_type_to_key("Local") == "local.default"
@@ -123,3 +150,28 @@ def test_resolve_operator_key_for_attempt_operator_type_legacy_map() -> None:
 def test_resolve_operator_key_for_attempt_returns_none_when_unresolvable() -> None:
     a = _Attempt(operator_key=None, operator_type=None, operator_data={})
     assert resolve_operator_key_for_attempt(a) is None
+
+
+def test_importing_operator_keys_does_not_load_orchestration_or_ssh() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, matterstack.core.operator_keys, matterstack.config.profiles; "
+        "print(sorted(m for m in ('matterstack.orchestration', 'matterstack.storage', 'paramiko') "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_package_exports_resolve_lazily() -> None:
+    import matterstack
+    import matterstack.core
+    from matterstack.core.workflow import Task
+
+    assert matterstack.Task is Task
+    assert matterstack.core.Task is Task
+    assert set(matterstack.__all__) <= set(dir(matterstack))
+    with pytest.raises(AttributeError):
+        matterstack.core.NotAThing  # noqa: B018
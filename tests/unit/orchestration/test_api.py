@@ -0,0 +1,96 @@
+"""Tests for the in-process workflow runner in matterstack.orchestration.api."""
+
+import asyncio
+from typing import Dict, List, Optional
+
+from matterstack.core.backend import ComputeBackend, JobState, JobStatus
+from matterstack.core.workflow import Task, Workflow
+from matterstack.orchestration.api import _dependency_levels, run_workflow
+
+
+class _SlowBackend(ComputeBackend):
+    """Backend whose jobs stay RUNNING for one poll; records peak concurrency and submit order."""
+
+    def __init__(self, fail: Optional[set] = None) -> None:
+        self.fail = fail or set()
+        self.in_flight = 0
+        self.peak = 0
+        self.submitted: List[str] = []
+        self._polls: Dict[str, int] = {}
+
+    @property
+    def is_local_execution(self) -> bool:
+        return True
+
+    async def submit(self, task: Task, workdir_override=None, local_debug_dir=None) -> str:
+        self.submitted.append(task.task_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self._polls[task.task_id] = 0
+        return task.task_id
+
+    async def poll(self, job_id: str) -> JobStatus:
+        self._polls[job_id] += 1
+        if self._polls[job_id] < 2:
+            await asyncio.sleep(0)
+            return JobStatus(job_id=job_id, state=JobState.RUNNING)
+        self.in_flight -= 1
+        state = JobState.COMPLETED_ERROR if job_id in self.fail else JobState.COMPLETED_OK
+        return JobStatus(job_id=job_id, state=state)
+
+    async def download(self, job_id, remote_path, local_path, include_patterns=None, exclude_patterns=None,
+                       workdir_override=None) -> None:
+        return None
+
+    async def cancel(self, job_id: str) -> None:
+        return None
+
+    async def get_logs(self, job_id: str) -> Dict[str, str]:
+        return {"stdout": "", "stderr": ""}
+
+
+def _workflow() -> Workflow:
+    wf = Workflow()
+    wf.add_task(Task(task_id="a", image="ubuntu", command="true"))
+    wf.add_task(Task(task_id="b", image="ubuntu", command="true"))
+    wf.add_task(Task(task_id="c", image="ubuntu", command="true"))
+    wf.add_task(Task(task_id="d", image="ubuntu", command="true", dependencies={"a", "b"}))
+    return wf
+
+
+def test_dependency_levels_groups_independent_tasks():
+    levels = _dependency_levels(_workflow().get_topo_sorted_tasks())
+    assert [sorted(t.task_id for t in level) for level in levels] == [["a", "b", "c"], ["d"]]
+
+
+def test_run_workflow_is_sequential_by_default():
+    backend = _SlowBackend()
+    result = run_workflow(_workflow(), backend=backend, poll_interval=0)
+    assert result.status == JobState.COMPLETED_OK
+    assert backend.peak == 1
+
+
+def test_run_workflow_overlaps_independent_tasks_up_to_limit():
+    backend = _SlowBackend()
+    result = run_workflow(_workflow(), backend=backend, poll_interval=0, max_concurrent_tasks=2)
+    assert result.status == JobState.COMPLETED_OK
+    assert backend.peak == 2
+    assert backend.submitted[-1] == "d"
+
+
+def test_run_workflow_concurrent_failure_cancels_dependents():
+    backend = _SlowBackend(fail={"a"})
+    result = run_workflow(
+        _workflow(), backend=backend, poll_interval=0, max_concurrent_tasks=4, continue_on_error=True
+    )
+    assert result.tasks["a"].status.state == JobState.COMPLETED_ERROR
+    assert result.tasks["b"].status.state == JobState.COMPLETED_OK
+    assert result.tasks["d"].status.state == JobState.CANCELLED
+    assert "d" not in backend.submitted
+
+
+def test_run_workflow_concurrent_abort_stops_after_level():
+    backend = _SlowBackend(fail={"b"})
+    result = run_workflow(_workflow(), backend=backend, poll_interval=0, max_concurrent_tasks=4)
+    assert set(result.tasks) == {"a", "b", "c"}
+    assert "d" not in backend.submitted
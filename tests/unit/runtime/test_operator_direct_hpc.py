@@ -9,7 +9,7 @@ from matterstack.core.operators import ExternalRunStatus
 from matterstack.core.run import RunHandle
 from matterstack.core.workflow import Task, Workflow
 from matterstack.runtime.operators.hpc import ComputeOperator as DirectHPCOperator
-from matterstack.runtime.task_manifest import iter_strings
+from matterstack.runtime.task_manifest import iter_strings, task_to_persistence_manifest, write_task_manifest_json
 from matterstack.storage.state_store import SQLiteStateStore
 
 # --- Mock Backend ---
@@ -328,6 +328,16 @@ def test_task_manifest_does_not_embed_large_file_contents(operator, run_handle):
     assert max(len(s) for s in iter_strings(manifest)) <= 10_000
 
 
+def test_task_manifest_json_layout_is_indented_and_sorted(tmp_path):
+    task = Task(task_id="task_layout", image="ubuntu", command="echo hi", files={"run.sh": "echo é\n"})
+    path = tmp_path / "manifest.json"
+
+    write_task_manifest_json(path, task)
+
+    expected = json.dumps(task_to_persistence_manifest(task), indent=2, sort_keys=True) + "\n"
+    assert path.read_text(encoding="utf-8") == expected
+
+
 def test_attempt_config_snapshot_hash_is_populated_and_stable(operator, run_handle, simple_task):
     store = _seed_store_with_run_and_task(run_handle, simple_task)
 
@@ -72,3 +72,45 @@ def test_get_cached_operator_registry_returns_same_object_for_same_key(tmp_path:
 
     assert reg1 is reg2
     assert reg1["hpc.default"] is reg2["hpc.default"]
+
+
+def test_build_operator_registry_loads_profiles_once_for_profile_backends(tmp_path: Path, monkeypatch) -> None:
+    import matterstack.runtime.operators.registry as registry_mod
+
+    profiles_path = tmp_path / "profiles.yaml"
+    profiles_path.write_text(
+        f"""profiles:
+  a:
+    type: local
+    workspace_root: {tmp_path / "a"}
+  b:
+    type: local
+    workspace_root: {tmp_path / "b"}
+"""
+    )
+    operators_cfg = parse_operators_config_dict(
+        {
+            "operators": {
+                "local.a": {"kind": "local", "backend": {"type": "profile", "name": "a"}},
+                "local.b": {"kind": "local", "backend": {"type": "profile", "name": "b"}},
+                "hpc.default": {"kind": "hpc"},
+            }
+        },
+        path=tmp_path / "operators.yaml",
+    )
+    handle = RunHandle(workspace_slug="ws", run_id="r1", root_path=tmp_path)
+
+    calls = []
+    real_load_profiles = registry_mod.load_profiles
+
+    def counting_load_profiles(config_path=None):
+        calls.append(config_path)
+        return real_load_profiles(config_path=config_path)
+
+    monkeypatch.setattr(registry_mod, "load_profiles", counting_load_profiles)
+
+    reg = build_operator_registry_from_operators_config(handle, operators_cfg, profiles_config_path=str(profiles_path))
+
+    assert calls == [str(profiles_path)]
+    assert Path(reg["local.a"].backend.workspace_root) == tmp_path / "a"
+    assert Path(reg["local.b"].backend.workspace_root) == tmp_path / "b"
@@ -71,3 +71,101 @@ def test_run_task_async_with_profile(tmp_path):
     assert "hello" in result.logs.stdout
     assert result.workspace_path.exists()
     assert result.workspace_path.is_dir()
+
+
+def test_load_profile_shares_profiles_until_config_changes(tmp_path):
+    from matterstack.config.profiles import get_default_profile, load_profiles
+
+    config_path = _write_local_profile_config(tmp_path, dry_run=True)
+
+    first = load_profile("local_test", config_path=str(config_path))
+    assert get_default_profile(config_path=str(config_path)) is first
+    profiles = load_profiles(config_path=str(config_path))
+    profiles.clear()
+    assert load_profile("local_test", config_path=str(config_path)) is first
+
+    config_path.write_text(config_path.read_text().replace("dry_run: true", "dry_run: false"))
+    reloaded = load_profile("local_test", config_path=str(config_path))
+    assert reloaded is not first
+    assert reloaded.local.dry_run is False
+
+
+def test_project_config_search_is_cached_until_a_directory_changes(tmp_path, monkeypatch):
+    import os
+
+    from matterstack.config import profiles as profiles_mod
+
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    monkeypatch.chdir(nested)
+    assert profiles_mod._find_project_config_file() is None
+
+    config_path = tmp_path / "a" / "matterstack.yaml"
+    config_path.write_text("profiles: {}\n")
+    assert profiles_mod._find_project_config_file() == config_path
+
+    probes = []
+    real_isfile = os.path.isfile
+    monkeypatch.setattr(os.path, "isfile", lambda p: probes.append(p) or real_isfile(p))
+    assert profiles_mod._find_project_config_file() == config_path
+    assert probes == []
+
+    config_path.unlink()
+    assert profiles_mod._find_project_config_file() is None
+
+
+def test_project_config_search_sees_files_created_without_a_directory_mtime_change(tmp_path, monkeypatch):
+    import os
+
+    from matterstack.config import profiles as profiles_mod
+
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    monkeypatch.chdir(nested)
+    assert profiles_mod._find_project_config_file() is None
+
+    # Simulate a coarse-grained filesystem: the directory mtime does not move.
+    config_dir = tmp_path / "a"
+    before = os.stat(config_dir)
+    config_path = config_dir / "matterstack.yaml"
+    config_path.write_text("profiles: {}\n")
+    os.utime(config_dir, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert profiles_mod._find_project_config_file() == config_path
+
+    config_path.unlink()
+    os.utime(config_dir, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert profiles_mod._find_project_config_file() is None
+
+
+def test_load_profiles_overlays_project_profiles_on_user_profiles(tmp_path, monkeypatch):
+    from matterstack.config.profiles import load_profiles
+
+    home = tmp_path / "home"
+    (home / ".matterstack").mkdir(parents=True)
+    (home / ".matterstack" / "config.yaml").write_text(
+        "profiles:\n"
+        "  shared: {type: local, workspace_root: /user/ws, dry_run: true}\n"
+        "  user_only: {type: local, workspace_root: /user/only}\n"
+    )
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "matterstack.yaml").write_text("profiles:\n  shared: {workspace_root: /project/ws}\n")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(project)
+
+    profiles = load_profiles()
+
+    assert profiles["shared"].raw == {"type": "local", "workspace_root": "/project/ws", "dry_run": True}
+    assert profiles["shared"].local.dry_run is True
+    assert profiles["user_only"].local.workspace_root == "/user/only"
+
+
+def test_load_profile_detects_config_encoding_from_bytes(tmp_path):
+    config_path = tmp_path / "profiles.yaml"
+    config_path.write_bytes(
+        "profiles:\n  local_test:\n    type: local\n    workspace_root: ./résultats\n".encode("utf-16")
+    )
+
+    profile = load_profile("local_test", config_path=str(config_path))
+
+    assert profile.local.workspace_root == "./résultats"